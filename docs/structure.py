@@ -23,16 +23,22 @@ PAGES = [
         'methods': [
             private.node.DataNode.set_private_data,
             private.node.DataNode.set_private_test_data,
+            private.node.DataNode.set_model,
             private.node.DataNode.configure_data_access,
+            private.node.DataNode.data_access_definition,
             private.node.DataNode.configure_model_params_access,
             private.node.DataNode.apply_data_transformation,
             private.node.DataNode.query,
             private.node.DataNode.query_model_params,
+            private.node.DataNode.snapshot_model_params,
+            private.node.DataNode.trained_model_params,
             private.node.DataNode.set_model_params,
             private.node.DataNode.train_model,
             private.node.DataNode.predict,
             private.node.DataNode.evaluate,
             private.node.DataNode.performance,
+            private.node.DataNode.evaluate_many,
+            private.node.DataNode.performance_many,
             private.node.DataNode.local_evaluate,
         ],
     },
@@ -50,19 +56,28 @@ PAGES = [
         'classes': [
             (private.query.Query, ["get"]),
             private.query.IdentityFunction,
-            private.query.Mean
+            private.query.Mean,
+            private.query.SufficientStatistics
         ]
     },
     {
         'page': 'private/federated_operation.md',
         'classes': [
-            (private.federated_operation.FederatedData, ["add_data_node", "num_nodes",
-                                                         "configure_data_access", "query"]),
+            (private.federated_operation.FederatedData, ["add_data_node", "num_nodes", "select", "evaluate",
+                                                         "performance", "local_performance", "configure_data_access",
+                                                         "query"]),
             (private.federated_operation.FederatedDataNode, ['configure_data_access',
+                                                             'data_access_definition',
                                                              'set_private_data',
                                                              'set_private_test_data',
                                                              'train_model',
                                                              'apply_data_transformation',
+                                                             'num_samples',
+                                                             'local_performance',
+                                                             'local_performance_many',
+                                                             'evaluate_many',
+                                                             'evaluate_snapshot',
+                                                             'simulated_time',
                                                              'split_train_test']),
             (private.federated_operation.FederatedTransformation, ["apply"]),
             private.federated_operation.Normalize
@@ -73,6 +88,24 @@ PAGES = [
             private.federated_operation.split_train_test
         ]
     },
+    {
+        'page': 'private/data_storage.md',
+        'classes': [
+            (private.data_storage.DataStorage, ['store', 'store_indices']),
+            private.data_storage.LazyLabeledData,
+            (private.data_storage.SharedArray, ['from_indices', 'from_partitions', 'writable_array', 'close', 'unlink']),
+            private.data_storage.SharedLabeledData,
+            (private.data_storage.SharedMemoryStorage, ['unlink']),
+            private.data_storage.MemmapLabeledData,
+            private.data_storage.MemmapStorage
+        ]
+    },
+    {
+        'page': 'private/device_profile.md',
+        'classes': [
+            (private.device_profile.DeviceProfile, ['training_time', 'upload_time'])
+        ]
+    },
     {
         'page': 'private/federated_attack.md',
         'classes': [
@@ -110,31 +143,39 @@ PAGES = [
     {
         'page': 'data_distribution.md',
         'classes': [
-            (data_distribution.data_distribution.DataDistribution, ["get_federated_data", "make_data_federated"]),
+            (data_distribution.data_distribution.DataDistribution, ["get_federated_data", "make_data_federated",
+                                                                  "make_index_federated"]),
             data_distribution.data_distribution_iid.IidDataDistribution,
-            (data_distribution.data_distribution_non_iid.NonIidDataDistribution, ['choose_labels'])
+            (data_distribution.data_distribution_non_iid.NonIidDataDistribution, ['choose_labels']),
+            data_distribution.data_distribution_dirichlet.DirichletDataDistribution
         ]
     },
     {
         'page': 'model.md',
         'classes': [
             (model.model.TrainableModel, ["train", "predict", "evaluate", "get_model_params", "set_model_params",
-                                          'performance']),
+                                          'performance', 'evaluate_many', 'performance_many',
+                                          'performance_each']),
             model.deep_learning_model.DeepLearningModel,
             model.linear_regression_model.LinearRegressionModel,
             model.kmeans_model.KMeansModel,
-            model.logistic_regression_model.LogisticRegressionModel
+            model.kmeans_model.LloydKMeansModel,
+            model.logistic_regression_model.LogisticRegressionModel,
+            (model.param_vector.ParamVector, ["from_params", "layers", "to_params", "with_buffer"])
         ]
     },
     {
         'page': 'federated_aggregator.md',
         'classes': [
-            (federated_aggregator.federated_aggregator.FederatedAggregator, ["aggregate_weights"]),
+            (federated_aggregator.federated_aggregator.FederatedAggregator, ["aggregate_weights", "begin",
+                                                                             "add", "finalize"]),
             federated_aggregator.fedavg_aggregator.FedAvgAggregator,
             federated_aggregator.weighted_fedavg_aggregator.WeightedFedAvgAggregator,
             (federated_aggregator.iowa_federated_aggregator.IowaFederatedAggregator, ['set_ponderation', 'q_function',
                                                                                       'get_ponderation_weights']),
-            federated_aggregator.cluster_fedavg_aggregator.ClusterFedAvgAggregator
+            federated_aggregator.cluster_fedavg_aggregator.ClusterFedAvgAggregator,
+            federated_aggregator.matched_cluster_fedavg_aggregator.MatchedClusterFedAvgAggregator,
+            federated_aggregator.sufficient_statistics_aggregator.SufficientStatisticsAggregator
         ]
     },
     {
@@ -143,6 +184,7 @@ PAGES = [
             (federated_government.federated_government.FederatedGovernment, ['evaluate_global_model',
                                                                              'deploy_central_model',
                                                                              'evaluate_clients',
+                                                                             'select_clients',
                                                                              'train_all_clients',
                                                                              'aggregate_weights',
                                                                              'run_rounds']),
@@ -151,12 +193,37 @@ PAGES = [
             federated_government.federated_images_classifier.Reshape,
             federated_government.federated_images_classifier.ImagesDataBases,
             (federated_government.federated_linear_regression.FederatedLinearRegression, ['run_rounds',
+                                                                                          'aggregate_statistics',
                                                                                           'model_builder']),
             federated_government.federated_linear_regression.LinearRegressionDataBases,
             (federated_government.federated_clustering.FederatedClustering, ['run_rounds',
+                                                                             'seed_centers',
                                                                              'model_builder']),
             federated_government.federated_clustering.ClusteringDataBases,
-            (federated_government.iowa_federated_government.IowaFederatedGovernment, ['performance_clients'])
+            (federated_government.iowa_federated_government.IowaFederatedGovernment, ['performance_clients']),
+            (federated_government.asynchronous_federated_government.AsynchronousFederatedGovernment,
+             ['staleness_weight', 'add_client_update', 'run_rounds']),
+            (federated_government.vectorized_federated_government.VectorizedFederatedGovernment,
+             ['from_federated_data', 'deploy_central_model', 'train_all_clients', 'aggregate_weights',
+              'evaluate_global_model', 'run_rounds']),
+            (federated_government.training_executor.TrainingExecutor, ['train', 'submit', 'shutdown']),
+            federated_government.training_executor.SerialTrainingExecutor,
+            federated_government.training_executor.ThreadPoolTrainingExecutor,
+            federated_government.training_executor.ProcessPoolTrainingExecutor,
+            federated_government.training_executor.PersistentProcessTrainingExecutor,
+            (federated_government.client_selector.ClientSelector, ['select']),
+            federated_government.client_selector.UniformClientSelector,
+            federated_government.client_selector.SizeWeightedClientSelector,
+            federated_government.client_selector.PowerOfChoiceClientSelector,
+            (federated_government.virtual_clock.VirtualClock, ['advance']),
+            (federated_government.evaluation_policy.EvaluationPolicy, ['evaluates', 'client_test_data',
+                                                                       'global_test_data', 'combine']),
+            federated_government.evaluation_policy.FullEvaluationPolicy,
+            federated_government.evaluation_policy.SubsampleEvaluationPolicy,
+            federated_government.evaluation_policy.ShardedEvaluationPolicy
+        ],
+        'functions': [
+            federated_government.virtual_clock.params_nbytes
         ]
     },
     {
@@ -198,7 +265,11 @@ PAGES = [
         'page': 'differential_privacy/composition.md',
         'classes': [
             differential_privacy.composition_dp.ExceededPrivacyBudgetError,
-            differential_privacy.composition_dp.AdaptiveDifferentialPrivacy
+            (differential_privacy.composition_dp.AdaptiveDifferentialPrivacy, ["apply", "can_afford"]),
+            (differential_privacy.composition_dp.PrivacyBudgetLedger, ["from_privacy_filter", "node_filter",
+                                                                       "can_afford", "charge", "prepay",
+                                                                       "prepay_filters", "spend"]),
+            (differential_privacy.composition_dp.LedgerPrivacyFilter, ["apply", "can_afford"])
         ],
     },
     {
@@ -12,4 +12,4 @@ setup(name="shfl",
       url="https://github.com/sherpaai/Sherpa.ai-Federated-Learning-Framework",
       packages=find_packages(),
       install_requires=['numpy', 'emnist', 'scikit-learn', 'pytest', 'tensorflow>=2.2.0', 'scipy', 'six', 'pathlib2'],
-      python_requires='>=3.7')
+      python_requires='>=3.8')
@@ -6,3 +6,4 @@ from shfl.data_distribution import data_distribution_non_iid
 from shfl.data_distribution.data_distribution import DataDistribution
 from shfl.data_distribution.data_distribution_iid import IidDataDistribution
 from shfl.data_distribution.data_distribution_non_iid import NonIidDataDistribution
+from shfl.data_distribution.data_distribution_dirichlet import DirichletDataDistribution
@@ -1,6 +1,8 @@
 import abc
+import numpy as np
 
 from shfl.private.data import LabeledData
+from shfl.private.data_storage import LazyLabeledData
 from shfl.private.federated_operation import FederatedData
 
 
@@ -15,15 +17,21 @@ class DataDistribution(abc.ABC):
     def __init__(self, database):
         self._database = database
 
-    def get_federated_data(self, num_nodes, percent=100, weights=None, sampling="without_replacement"):
+    def get_federated_data(self, num_nodes, percent=100, weights=None, sampling="without_replacement",
+                           storage=None):
         """
         Method that split the whole data between the established number of nodes.
 
+        If the distribution implements make_index_federated, nodes reference their samples in the original \
+        arrays and gather them on first access (see: [LazyLabeledData](../private/data_storage/#lazylabeleddata-class)).
+
         # Arguments:
             num_nodes: Number of nodes to create
             percent: Percent of the data (between 0 and 100) to be distributed (default is 100)
             weights: Array of weights for weighted distribution (default is None)
             sampling: methodology between with or without sampling (default "without_sampling")
+            storage: Backing store for the data of the nodes (see: [DataStorage](../private/data_storage/#datastorage-class)). \
+            By default every node holds its own arrays.
 
         # Returns:
               * **federated_data, test_data, test_label**
@@ -32,15 +40,27 @@ class DataDistribution(abc.ABC):
         train_data, train_label = self._database.train
         test_data, test_label = self._database.test
 
-        federated_train_data, federated_train_label = self.make_data_federated(train_data,
-                                                                               train_label,
-                                                                               num_nodes, percent,
-                                                                               weights, sampling)
+        federated_indices = self.make_index_federated(train_label, num_nodes, percent, weights, sampling)
+
+        if federated_indices is not None:
+            if storage is None:
+                nodes_data = [LazyLabeledData(train_data, train_label, indices) for indices in federated_indices]
+            else:
+                nodes_data = storage.store_indices(train_data, train_label, federated_indices)
+        else:
+            federated_train_data, federated_train_label = self.make_data_federated(train_data,
+                                                                                   train_label,
+                                                                                   num_nodes, percent,
+                                                                                   weights, sampling)
+            if storage is None:
+                nodes_data = [LabeledData(federated_train_data[node], federated_train_label[node])
+                              for node in range(num_nodes)]
+            else:
+                nodes_data = storage.store(federated_train_data[:num_nodes], federated_train_label[:num_nodes])
 
         federated_data = FederatedData()
-        for node in range(num_nodes):
-            node_data = LabeledData(federated_train_data[node], federated_train_label[node])
-            federated_data.add_data_node(node_data)
+        for node_data in nodes_data:
+            federated_data.add_data_node(node_data, ownership="transfer")
 
         return federated_data, test_data, test_label
 
@@ -60,4 +80,44 @@ class DataDistribution(abc.ABC):
         # Returns:
             federated_data: Data for each client
             federated_label: Labels for each client
-        """
\ No newline at end of file
+        """
+    def make_index_federated(self, labels, num_nodes, percent, weights, sampling):
+        """
+        Method that assigns samples to every node returning their indices in the original arrays, instead of \
+        copies of the samples. Distributions implementing it let nodes reference the original data until it is \
+        accessed. By default it is not implemented and make_data_federated is used.
+
+        # Arguments:
+            labels: Labels
+            num_nodes : Number of nodes
+            percent: Percent of the data (between 0 and 100) to be distributed (default is 100)
+            weights: Array of weights for weighted distribution (default is None)
+            sampling: methodology between with or without sampling (default "without_sampling")
+
+        # Returns:
+            federated_indices: List with an array of indices per node, or None if not implemented
+        """
+        return None
+
+    @staticmethod
+    def _gather_federated_data(data, labels, federated_indices):
+        """
+        Gathers the samples of every node from their indices.
+
+        # Arguments:
+            data: Array of data
+            labels: Labels
+            federated_indices: List with an array of indices per node
+
+        # Returns:
+            federated_data: Object array with the data of each client
+            federated_label: Object array with the labels of each client
+        """
+        # Filled node by node, so nodes of different sizes never make a ragged array
+        federated_data = np.empty(len(federated_indices), dtype=object)
+        federated_label = np.empty(len(federated_indices), dtype=object)
+        for node, indices in enumerate(federated_indices):
+            federated_data[node] = data[indices]
+            federated_label[node] = labels[indices]
+
+        return federated_data, federated_label
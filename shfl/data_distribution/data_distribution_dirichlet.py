@@ -0,0 +1,175 @@
+import numpy as np
+
+from shfl.data_distribution.data_distribution import DataDistribution
+
+
+class DirichletDataDistribution(DataDistribution):
+    """
+    Implementation of a non-independent and identically distributed data distribution using \
+        [Data Distribution](../data_distribution/#datadistribution-class)
+
+    In this data distribution the label skew between clients is controlled by a Dirichlet distribution. \
+    Without replacement, the share of every class held by each client is drawn from Dirichlet(alpha), \
+    scaled by the weights of the clients. With replacement, the class proportions of every client are drawn \
+    from Dirichlet(alpha) and its samples are drawn from those classes independently of the other clients, so \
+    clients may share samples, but no sample is repeated inside a client, as in the iid distribution. Small \
+    values of alpha give clients dominated by a few classes, while big values approach an iid distribution.
+
+    Samples are assigned with operations over whole arrays, so it scales to thousands of clients.
+
+    This distribution only works with classification problems.
+
+    # Arguments:
+        database: Database to distribute. (see: [Databases](../databases))
+        alpha: Concentration parameter of the Dirichlet distribution (default 0.5)
+    """
+
+    def __init__(self, database, alpha=0.5):
+        super().__init__(database)
+        if alpha <= 0:
+            raise ValueError("alpha must be positive")
+        self._alpha = alpha
+
+    def make_data_federated(self, data, labels, num_nodes, percent, weights, sampling="without_replacement"):
+        """
+        Method that makes data and labels argument federated following a Dirichlet distribution.
+
+        # Arguments:
+            data: Data to federate
+            labels: Labels to federate
+            num_nodes: Number of nodes to create
+            percent: Percent of the data (between 0 and 100) to be distributed (default is 100)
+            weights: Array of weights for weighted distribution (default is None)
+            sampling: methodology between with or without sampling (default "without_sampling")
+
+        # Returns:
+              * **federated_data, federated_labels**
+        """
+        federated_indices = self.make_index_federated(labels, num_nodes, percent, weights, sampling)
+
+        return self._gather_federated_data(data, labels, federated_indices)
+
+    def make_index_federated(self, labels, num_nodes, percent, weights, sampling="without_replacement"):
+        """
+        Method that assigns the samples to the nodes following a Dirichlet distribution, returning their indices.
+
+        # Arguments:
+            labels: Labels to federate, either class ids or one hot encoded
+            num_nodes: Number of nodes to create
+            percent: Percent of the data (between 0 and 100) to be distributed (default is 100)
+            weights: Array of weights for weighted distribution (default is None)
+            sampling: methodology between with or without sampling (default "without_sampling")
+
+        # Returns:
+              * **federated_indices**
+        """
+        if weights is None:
+            weights = np.full(num_nodes, 1/num_nodes)
+        weights = np.asarray(weights, dtype=float)
+
+        # Shuffle data
+        indices = np.arange(len(labels))
+        np.random.shuffle(indices)
+
+        # Select percent
+        indices = indices[0:int(percent * len(indices) / 100)]
+
+        # Indices of the samples of every class
+        selected_labels = labels[indices]
+        if selected_labels.ndim > 1:
+            selected_labels = selected_labels.argmax(axis=-1)
+        _, classes = np.unique(selected_labels, return_inverse=True)
+        order = np.argsort(classes, kind="stable")
+        indices = indices[order]
+        class_sizes = np.bincount(classes)
+        class_starts = np.concatenate(([0], np.cumsum(class_sizes)[:-1]))
+
+        rng = np.random.default_rng(np.random.randint(2**31))
+
+        if sampling == "without_replacement":
+            node_indices, nodes = self._split_classes(indices, class_sizes, class_starts, weights, rng)
+        else:
+            node_indices, nodes = self._sample_classes(indices, class_sizes, class_starts, weights, rng)
+
+        # Group the samples by node, in random order inside every node
+        order = np.lexsort((rng.random(len(nodes)), nodes))
+        node_sizes = np.bincount(nodes, minlength=num_nodes)
+
+        return np.split(node_indices[order], np.cumsum(node_sizes)[:-1])
+
+    def _split_classes(self, indices, class_sizes, class_starts, weights, rng):
+        """
+        Splits the samples of every class between the nodes, with the share of each node drawn \
+        from a Dirichlet distribution.
+
+        # Arguments:
+            indices: Indices of the samples, grouped by class
+            class_sizes: Number of samples of every class
+            class_starts: Position of the first sample of every class
+            weights: Weight of every node
+            rng: Random generator
+
+        # Returns:
+              * **indices, nodes**: indices assigned and the node of each one
+        """
+        num_nodes = len(weights)
+        fraction = min(weights.sum(), 1)
+
+        proportions = rng.dirichlet(np.full(num_nodes, self._alpha), size=len(class_sizes)) * weights
+        proportions /= proportions.sum(axis=1, keepdims=True)
+
+        # Number of samples of every class (rows) assigned to each node (columns)
+        used_sizes = (class_sizes * fraction).astype(int)
+        bounds = (np.cumsum(proportions, axis=1) * used_sizes[:, np.newaxis]).astype(int)
+        bounds[:, -1] = used_sizes
+        counts = np.diff(bounds, axis=1, prepend=0)
+
+        # Only the first samples of every class are used if the weights add up to less than one
+        class_positions = np.arange(len(indices)) - np.repeat(class_starts, class_sizes)
+        used = class_positions < np.repeat(used_sizes, class_sizes)
+        nodes = np.repeat(np.tile(np.arange(num_nodes), len(class_sizes)), counts.ravel())
+
+        return indices[used], nodes
+
+    def _sample_classes(self, indices, class_sizes, class_starts, weights, rng):
+        """
+        Draws the samples of every node independently of the other nodes, with its class proportions drawn \
+        from a Dirichlet distribution. Inside a node the samples of every class are drawn without replacement.
+
+        # Arguments:
+            indices: Indices of the samples, grouped by class
+            class_sizes: Number of samples of every class
+            class_starts: Position of the first sample of every class
+            weights: Weight of every node
+            rng: Random generator
+
+        # Returns:
+              * **indices, nodes**: indices assigned and the node of each one
+        """
+        num_nodes = len(weights)
+
+        proportions = rng.dirichlet(np.full(len(class_sizes), self._alpha), size=num_nodes)
+        node_sizes = np.minimum((weights * len(indices)).astype(int), len(indices))
+        counts = rng.multinomial(node_sizes, proportions)
+
+        # A node can not take more samples of a class than the class has, the rest come from the classes left
+        excess = np.maximum(counts - class_sizes, 0)
+        while excess.any():
+            counts -= excess
+            room = class_sizes - counts
+            room_proportions = proportions * room
+            no_proportion = room_proportions.sum(axis=1) == 0
+            room_proportions[no_proportion] = room[no_proportion]
+            totals = room_proportions.sum(axis=1, keepdims=True)
+            room_proportions = np.divide(room_proportions, totals, where=totals > 0,
+                                         out=np.full(room_proportions.shape, 1 / len(class_sizes)))
+            counts += rng.multinomial(excess.sum(axis=1), room_proportions)
+            excess = np.maximum(counts - class_sizes, 0)
+
+        positions = [class_starts[node_class] + rng.choice(class_sizes[node_class], counts[node, node_class],
+                                                           replace=False)
+                     for node, node_class in zip(*np.nonzero(counts))]
+        positions = np.concatenate([np.zeros(0, dtype=int)] + positions)
+        nodes = np.repeat(np.arange(num_nodes), counts.sum(axis=1))
+
+        return indices[positions], nodes
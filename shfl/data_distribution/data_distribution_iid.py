@@ -24,22 +24,37 @@ class IidDataDistribution(DataDistribution):
         # Returns:
               * **federated_data, federated_labels**
 
+        """
+        federated_indices = self.make_index_federated(labels, num_nodes, percent, weights, sampling)
+
+        return self._gather_federated_data(data, labels, federated_indices)
+
+    def make_index_federated(self, labels, num_nodes, percent, weights, sampling="without_replacement"):
+        """
+        Method that assigns the samples to the nodes in an iid scenario, returning their indices.
+
+        # Arguments:
+            labels: Labels to federate
+            num_nodes: Number of nodes to create
+            percent: Percent of the data (between 0 and 100) to be distributed
+            weights: Array of weights for weighted distribution (default is None)
+            sampling: methodology between with or without sampling (default "without_sampling")
+
+        # Returns:
+              * **federated_indices**
+
         """
         if weights is None:
             weights = np.full(num_nodes, 1/num_nodes)
 
         # Shuffle data
-        randomize = np.arange(len(labels))
-        np.random.shuffle(randomize)
-        data = data[randomize, ]
-        labels = labels[randomize]
+        indices = np.arange(len(labels))
+        np.random.shuffle(indices)
 
         # Select percent
-        data = data[0:int(percent * len(data) / 100), ]
-        labels = labels[0:int(percent * len(labels) / 100)]
+        indices = indices[0:int(percent * len(indices) / 100)]
 
-        federated_data = []
-        federated_label = []
+        federated_indices = []
 
         if sampling == "without_replacement":
             if sum(weights) > 1:
@@ -49,22 +64,16 @@ class IidDataDistribution(DataDistribution):
             percentage_used = 0
 
             for client in range(0, num_nodes):
-                federated_data.append(np.array(data[sum_used:int((percentage_used + weights[client]) * len(data)), ]))
-                federated_label.append(np.array(labels[sum_used:int((percentage_used + weights[client]) * len(labels))]))
+                federated_indices.append(indices[sum_used:int((percentage_used + weights[client]) * len(indices))])
 
-                sum_used = int((percentage_used + weights[client]) * len(data))
+                sum_used = int((percentage_used + weights[client]) * len(indices))
                 percentage_used += weights[client]
         else:
-            randomize = np.arange(len(labels))
+            randomize = np.arange(len(indices))
             for client in range(0, num_nodes):
-                federated_data.append(np.array(data[:int((weights[client]) * len(data)), ]))
-                federated_label.append(np.array(labels[:int((weights[client]) * len(labels))]))
+                federated_indices.append(indices[:int((weights[client]) * len(indices))])
 
                 np.random.shuffle(randomize)
-                data = data[randomize, ]
-                labels = labels[randomize]
-
-        federated_data = np.array(federated_data)
-        federated_label = np.array(federated_label)
+                indices = indices[randomize]
 
-        return federated_data, federated_label
+        return federated_indices
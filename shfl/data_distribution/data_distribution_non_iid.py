@@ -1,6 +1,5 @@
 import numpy as np
 import random
-import tensorflow as tf
 
 from shfl.data_distribution.data_distribution import DataDistribution
 
@@ -63,53 +62,60 @@ class NonIidDataDistribution(DataDistribution):
         # Returns:
               * **federated_data, federated_labels**
         """
+        federated_indices = self.make_index_federated(labels, num_nodes, percent, weights, sampling)
+
+        return self._gather_federated_data(data, labels, federated_indices)
+
+    def make_index_federated(self, labels, num_nodes, percent, weights, sampling="with_replacement"):
+        """
+        Method that assigns the samples to the nodes in a non-iid scenario, returning their indices.
+
+        Samples are grouped by class once, so the candidates of every node are gathered from the groups of its \
+        classes instead of scanning all the samples for every node.
+
+        # Arguments:
+            labels: Labels to federate, either class ids or one hot encoded
+            num_nodes: Number of nodes to create
+            percent: Percent of the data (between 0 and 100) to be distributed (default is 100)
+            weights: Array of weights for weighted distribution (default is None)
+            sampling: methodology between with or without sampling (default "without_sampling")
+
+        # Returns:
+              * **federated_indices**
+        """
         if weights is None:
             weights = np.full(num_nodes, 1/num_nodes)
 
-        # Check label's format
-        if labels.ndim == 1:
-            one_hot = False
-            labels = tf.keras.utils.to_categorical(labels)
-        else:
-            one_hot = True
-
         # Shuffle data
-        randomize = np.arange(len(labels))
-        np.random.shuffle(randomize)
-        data = data[randomize, ]
-        labels = labels[randomize]
+        indices = np.arange(len(labels))
+        np.random.shuffle(indices)
 
         # Select percent
-        data = data[0:int(percent * len(data) / 100), ]
-        labels = labels[0:int(percent * len(labels) / 100)]
+        indices = indices[0:int(percent * len(indices) / 100)]
+
+        # Class of every selected sample, as consecutive ids starting at 0
+        selected_labels = labels[indices]
+        if selected_labels.ndim > 1:
+            selected_labels = selected_labels.argmax(axis=-1)
+        total_labels, selected_classes = np.unique(selected_labels, return_inverse=True)
+
+        # Indices of the samples of every class
+        order = np.argsort(selected_classes, kind="stable")
+        class_sizes = np.bincount(selected_classes, minlength=len(total_labels))
+        class_indices = np.split(indices[order], np.cumsum(class_sizes)[:-1])
 
         # We generate random classes for each client
-        total_labels = np.unique(labels.argmax(axis=-1))
         random_classes = self.choose_labels(num_nodes, len(total_labels))
+        rng = np.random.default_rng(np.random.randint(2**31))
 
-        federated_data = []
-        federated_label = []
+        federated_indices = []
+        num_available = len(indices)
 
         if sampling == "with_replacement":
             for i in range(0, num_nodes):
-                labels_to_use = random_classes[i]
-
-                idx = np.array([True if i in labels_to_use else False for i in labels.argmax(axis=-1)])
-                data_aux = data[idx]
-                labels_aux = labels[idx]
-
-                randomize = np.arange(len(labels_aux))
-                np.random.shuffle(randomize)
-                data_aux = data_aux[randomize, ]
-                labels_aux = labels_aux[randomize]
-
-                percent_per_client = min(int(weights[i]*len(data)), len(data_aux))
-
-                federated_data.append(np.array(data_aux[0:percent_per_client, ]))
-                federated_label.append(np.array(labels_aux[0:percent_per_client, ]))
-
-            federated_data = np.array(federated_data)
-            federated_label = np.array(federated_label)
+                node_indices, _ = self._sample_classes(class_indices, random_classes[i],
+                                                       int(weights[i] * num_available), rng)
+                federated_indices.append(node_indices)
 
         else:
             if sum(weights) > 1:
@@ -117,32 +123,40 @@ class NonIidDataDistribution(DataDistribution):
 
             for i in range(0, num_nodes):
                 labels_to_use = random_classes[i]
+                node_indices, positions = self._sample_classes(class_indices, labels_to_use,
+                                                               int(weights[i] * num_available), rng)
+                federated_indices.append(node_indices)
 
-                idx = np.array([True if i in labels_to_use else False for i in labels.argmax(axis=-1)])
-                data_aux = data[idx]
-                rest_data = data[~idx]
-                labels_aux = labels[idx]
-                rest_labels = labels[~idx]
-
-                randomize = np.arange(len(labels_aux))
-                np.random.shuffle(randomize)
-                data_aux = data_aux[randomize, ]
-                labels_aux = labels_aux[randomize]
+                # Samples assigned to the node are no longer available
+                for label, class_positions in zip(labels_to_use, positions):
+                    class_indices[label] = np.delete(class_indices[label], class_positions)
+                num_available -= len(node_indices)
 
-                percent_per_client = min(int(weights[i] * len(data)), len(data_aux))
+        return federated_indices
 
-                federated_data.append(np.array(data_aux[0:percent_per_client, ]))
-                rest_data = np.append(rest_data, data_aux[percent_per_client:, ], axis=0)
-                federated_label.append(np.array(labels_aux[0:percent_per_client, ]))
-                rest_labels = np.append(rest_labels, labels_aux[percent_per_client:, ], axis=0)
-
-                data = rest_data
-                labels = rest_labels
-
-            federated_data = np.array(federated_data)
-            federated_label = np.array(federated_label)
+    @staticmethod
+    def _sample_classes(class_indices, labels_to_use, num_samples, rng):
+        """
+        Draws samples without replacement from the samples of some classes, without joining them.
 
-        if not one_hot:
-            federated_label = np.array([np.argmax(node, 1) for node in federated_label])
+        # Arguments:
+            class_indices: List with the indices of the samples of every class
+            labels_to_use: Classes to draw from
+            num_samples: Number of samples to draw, limited to the samples available in the classes
+            rng: Random generator
 
-        return federated_data, federated_label
+        # Returns:
+              * **indices, positions**: indices drawn, in random order, and the positions drawn within each class
+        """
+        offsets = np.cumsum([0] + [len(class_indices[label]) for label in labels_to_use])
+        drawn = rng.choice(offsets[-1], min(num_samples, offsets[-1]), replace=False)
+        owners = np.searchsorted(offsets, drawn, side="right") - 1
+
+        indices = np.empty(len(drawn), dtype=int)
+        positions = []
+        for j, label in enumerate(labels_to_use):
+            owned = owners == j
+            positions.append(drawn[owned] - offsets[j])
+            indices[owned] = class_indices[label][positions[-1]]
+
+        return indices, positions
@@ -7,6 +7,8 @@ from shfl.differential_privacy.dp_mechanism import LaplaceMechanism
 from shfl.differential_privacy.dp_mechanism import GaussianMechanism
 from shfl.differential_privacy.composition_dp import ExceededPrivacyBudgetError
 from shfl.differential_privacy.composition_dp import AdaptiveDifferentialPrivacy
+from shfl.differential_privacy.composition_dp import PrivacyBudgetLedger
+from shfl.differential_privacy.composition_dp import LedgerPrivacyFilter
 from shfl.differential_privacy.sensitivity_sampler import SensitivitySampler
 from shfl.differential_privacy.norm import SensitivityNorm
 from shfl.differential_privacy.norm import L1SensitivityNorm
@@ -1,4 +1,5 @@
 from math import sqrt, log, exp
+import numpy as np
 
 from shfl.private.data import DPDataAccessDefinition
 
@@ -26,6 +27,9 @@ class AdaptiveDifferentialPrivacy(DPDataAccessDefinition):
     """
     It provides Adaptive Differential Privacy through Privacy Filters
 
+    The filter keeps running sums of the privacy spent by the accesses, so checking the budget before every \
+    access takes constant time regardless of the number of previous accesses.
+
     # Arguments:
         epsilon_delta: Tuple or array of length 2 which contains the epsilon-delta privacy budget for this data
         differentially_private_mechanism: Optional. Default method that will be used to access data. If it is not set \
@@ -33,6 +37,9 @@ class AdaptiveDifferentialPrivacy(DPDataAccessDefinition):
 
     # Properties:
         epsilon_delta: Return epsilon_delta value
+        differentially_private_mechanism: Return the default mechanism, None if it is not set
+        spent: Return an array with the sums of epsilon, delta, epsilon squared and \
+        epsilon * (exp(epsilon) - 1) / 2 of the accesses, as used by the privacy filter
     """
 
     def __init__(self, epsilon_delta, differentially_private_mechanism=None):
@@ -41,6 +48,10 @@ class AdaptiveDifferentialPrivacy(DPDataAccessDefinition):
         self._epsilon_delta = epsilon_delta
         self._epsilon_delta_access_history = []
         self._private_data_epsilon_delta_access_history = []
+        self._epsilon_sum = 0
+        self._delta_sum = 0
+        self._epsilon_squared_sum = 0
+        self._epsilon_exp_sum = 0
         if differentially_private_mechanism is not None:
             _check_differentially_private_mechanism(differentially_private_mechanism)
         self._differentially_private_mechanism = differentially_private_mechanism
@@ -49,6 +60,14 @@ class AdaptiveDifferentialPrivacy(DPDataAccessDefinition):
     def epsilon_delta(self):
         return self._epsilon_delta
 
+    @property
+    def differentially_private_mechanism(self):
+        return self._differentially_private_mechanism
+
+    @property
+    def spent(self):
+        return np.array([self._epsilon_sum, self._delta_sum, self._epsilon_squared_sum, self._epsilon_exp_sum])
+
     def apply(self, data, differentially_private_mechanism=None):
         """
         It applies a differentially private mechanism if the privacy budget allows it.
@@ -62,16 +81,29 @@ class AdaptiveDifferentialPrivacy(DPDataAccessDefinition):
             The application of the dp-mechanism to the input data, if the privacy budget is not exceeded
         """
         differentially_private_mechanism_to_apply = self._get_data_access_definition(differentially_private_mechanism)
+        sums = self.__spent_with(differentially_private_mechanism_to_apply.epsilon_delta)
+        if self.__budget_exceeded(*sums):
+            raise ExceededPrivacyBudgetError(epsilon_delta=self._epsilon_delta)
+
         self._private_data_epsilon_delta_access_history.append(differentially_private_mechanism_to_apply.epsilon_delta)
+        self._epsilon_sum, self._delta_sum, self._epsilon_squared_sum, self._epsilon_exp_sum = sums
+        return differentially_private_mechanism_to_apply.apply(data)
 
-        privacy_budget_exceeded = self.__basic_adaptive_comp_theorem()
-        if 0 < self._epsilon_delta[1] < exp(-1):
-            privacy_budget_exceeded &= self.__advanced_adaptive_comp_theorem()
-        if privacy_budget_exceeded:
-            self._private_data_epsilon_delta_access_history.pop()
-            raise ExceededPrivacyBudgetError(epsilon_delta=self._epsilon_delta)
-        else:
-            return differentially_private_mechanism_to_apply.apply(data)
+    def can_afford(self, differentially_private_mechanism=None):
+        """
+        It checks whether the privacy budget allows an access with a differentially private mechanism, without \
+        accessing the data nor spending any budget.
+
+        # Arguments:
+            differentially_private_mechanism: it is the provider of differential privacy, by default the one \
+            given in the constructor
+
+        # Returns:
+            True if the mechanism can be applied without exceeding the privacy budget, False otherwise
+        """
+        differentially_private_mechanism_to_apply = self._get_data_access_definition(differentially_private_mechanism)
+
+        return not self.__budget_exceeded(*self.__spent_with(differentially_private_mechanism_to_apply.epsilon_delta))
 
     def _get_data_access_definition(self, data_access_definition):
         """
@@ -92,7 +124,31 @@ class AdaptiveDifferentialPrivacy(DPDataAccessDefinition):
             raise ValueError("Not data access definition provided or default method established")
         return self._differentially_private_mechanism
 
-    def __basic_adaptive_comp_theorem(self):
+    def __spent_with(self, epsilon_delta):
+        """
+            It computes the running sums of the privacy spent if an access with the given epsilon-delta is added.
+
+            # Returns:
+                The sums of epsilon, delta, epsilon squared and epsilon * (exp(epsilon) - 1) / 2
+        """
+        epsilon, delta = epsilon_delta
+        return (self._epsilon_sum + epsilon, self._delta_sum + delta, self._epsilon_squared_sum + epsilon ** 2,
+                self._epsilon_exp_sum + epsilon * (exp(epsilon) - 1) * 0.5)
+
+    def __budget_exceeded(self, epsilon_sum, delta_sum, epsilon_squared_sum, epsilon_exp_sum):
+        """
+            It checks whether the privacy spent given by the running sums surpasses the privacy budget.
+
+            # Returns:
+                It returns True if the privacy budget if surpassed, False otherwise.
+        """
+        privacy_budget_exceeded = self.__basic_adaptive_comp_theorem(epsilon_sum, delta_sum)
+        if 0 < self._epsilon_delta[1] < exp(-1):
+            privacy_budget_exceeded &= self.__advanced_adaptive_comp_theorem(delta_sum, epsilon_squared_sum,
+                                                                             epsilon_exp_sum)
+        return privacy_budget_exceeded
+
+    def __basic_adaptive_comp_theorem(self, eps_sum, delta_sum):
         """
             It checks whether the privacy budget given by epsilon_delta is surpassed.
 
@@ -105,10 +161,9 @@ class AdaptiveDifferentialPrivacy(DPDataAccessDefinition):
                 - [Privacy Odometers and Filters: Pay-as-you-Go Composition] (https://arxiv.org/abs/1605.08294)
         """
         global_epsilon, global_delta = self._epsilon_delta
-        eps_sum, delta_sum = map(sum, zip(*self._private_data_epsilon_delta_access_history))
         return eps_sum > global_epsilon or delta_sum > global_delta
 
-    def __advanced_adaptive_comp_theorem(self):
+    def __advanced_adaptive_comp_theorem(self, delta_sum, epsilon_squared_sum, epsilon_exp_sum):
         """
             It checks whether the privacy budget given by epsilon_delta is surpassed.
 
@@ -120,15 +175,11 @@ class AdaptiveDifferentialPrivacy(DPDataAccessDefinition):
             # References:
                 - [Privacy Odometers and Filters: Pay-as-you-Go Composition] (https://arxiv.org/abs/1605.08294)
         """
-        epsilon_history, delta_history = zip(*self._private_data_epsilon_delta_access_history)
         global_epsilon, global_delta = self._epsilon_delta
 
-        delta_sum = sum(delta_history)
-        epsilon_squared_sum = sum(epsilon ** 2 for epsilon in epsilon_history)
-
         h = global_epsilon ** 2 / (28.04 * log(1 / global_delta))
 
-        a = sum(eps * (exp(eps) - 1) * 0.5 for eps in epsilon_history)
+        a = epsilon_exp_sum
         b = epsilon_squared_sum + h
         c = 2 + log(epsilon_squared_sum / h + 1)
         d = log(2 / global_delta)
@@ -138,6 +189,290 @@ class AdaptiveDifferentialPrivacy(DPDataAccessDefinition):
         return k > global_epsilon or delta_sum > (global_delta * 0.5)
 
 
+class PrivacyBudgetLedger:
+    """
+    It keeps the privacy budget of many nodes, with the same privacy filter as \
+    [AdaptiveDifferentialPrivacy](./#adaptivedifferentialprivacy-class), in numpy arrays with a column per node.
+
+    The running sums of the privacy spent by every node are updated at once, so the budget of all the nodes \
+    is checked and charged in a single vectorized step. Every node accesses its data through a \
+    [LedgerPrivacyFilter](./#ledgerprivacyfilter-class) (see: node_filter). \
+    [FederatedData](../../private/federated_operation/#federateddata-class) uses a ledger when an \
+    AdaptiveDifferentialPrivacy is configured over all its nodes, instead of a copy of it per node.
+
+    # Arguments:
+        epsilon_delta: Tuple or array of length 2 which contains the epsilon-delta privacy budget of every node
+        num_nodes: Number of nodes
+
+    # Properties:
+        epsilon_delta: Return epsilon_delta value
+        spent: Array of shape (num_nodes, 2) with the sum of the epsilon and delta spent by every node
+    """
+
+    def __init__(self, epsilon_delta, num_nodes):
+        DPDataAccessDefinition._check_epsilon_delta(epsilon_delta)
+
+        self._epsilon_delta = epsilon_delta
+        # Sums of epsilon, delta, epsilon squared and epsilon * (exp(epsilon) - 1) / 2 of every node
+        self._sums = np.zeros((4, num_nodes))
+        self._credit = np.full((2, num_nodes), np.nan)
+
+    @classmethod
+    def from_privacy_filter(cls, privacy_filter, num_nodes):
+        """
+        Creates a ledger where every node has the budget of a privacy filter, and has already spent the \
+        privacy spent by the filter.
+
+        # Arguments:
+            privacy_filter: [AdaptiveDifferentialPrivacy](./#adaptivedifferentialprivacy-class) to replicate
+            num_nodes: Number of nodes
+
+        # Returns:
+            ledger: PrivacyBudgetLedger with a column per node
+        """
+        ledger = cls(privacy_filter.epsilon_delta, num_nodes)
+        ledger._sums[:] = privacy_filter.spent[:, np.newaxis]
+
+        return ledger
+
+    @property
+    def epsilon_delta(self):
+        return self._epsilon_delta
+
+    @property
+    def spent(self):
+        return self._sums[:2].T.copy()
+
+    def node_filter(self, node, differentially_private_mechanism=None):
+        """
+        Privacy filter of a node, whose budget is kept in this ledger.
+
+        # Arguments:
+            node: Index of the node
+            differentially_private_mechanism: Optional. Default method used to access data
+
+        # Returns:
+            privacy_filter: [LedgerPrivacyFilter](./#ledgerprivacyfilter-class) of the node
+        """
+        return LedgerPrivacyFilter(self, node, differentially_private_mechanism)
+
+    def can_afford(self, epsilon_delta, nodes=None):
+        """
+        It checks whether some nodes can spend a given privacy, without spending it.
+
+        # Arguments:
+            epsilon_delta: Privacy spent by an access, usually the epsilon_delta of a mechanism
+            nodes: Indices of the nodes (default None, all of them)
+
+        # Returns:
+            Boolean array, True for the nodes whose budget allows the access
+        """
+        return ~self.__budget_exceeded(self.__spent_with(epsilon_delta, nodes))
+
+    def charge(self, epsilon_delta, nodes=None):
+        """
+        It spends a given privacy in some nodes, if the budget of all of them allows it. Otherwise an exception \
+        (ExceededPrivacyBudgetError) is thrown and nothing is spent.
+
+        # Arguments:
+            epsilon_delta: Privacy spent by an access, usually the epsilon_delta of a mechanism
+            nodes: Indices of the nodes (default None, all of them)
+        """
+        nodes = self.__nodes(nodes)
+        sums = self.__spent_with(epsilon_delta, nodes)
+        if self.__budget_exceeded(sums).any():
+            raise ExceededPrivacyBudgetError(epsilon_delta=self._epsilon_delta)
+        self._sums[:, nodes] = sums
+
+    def prepay(self, epsilon_delta, nodes=None):
+        """
+        It charges a given privacy in some nodes, as charge does, leaving them a credit so that the next access \
+        of every node with the same epsilon_delta is not charged again. It is used to charge all the nodes of a \
+        federated query at once.
+
+        # Arguments:
+            epsilon_delta: Privacy spent by an access, usually the epsilon_delta of a mechanism
+            nodes: Indices of the nodes (default None, all of them)
+        """
+        nodes = self.__nodes(nodes)
+        self.charge(epsilon_delta, nodes)
+        self._credit[:, nodes] = np.asarray(epsilon_delta, dtype=float)[:, np.newaxis]
+
+    @staticmethod
+    def prepay_filters(privacy_filters, differentially_private_mechanism=None):
+        """
+        It prepays an access of every privacy filter at once, if all of them are \
+        [LedgerPrivacyFilter](./#ledgerprivacyfilter-class) of the same ledger and the access uses the same \
+        mechanism in all of them. Otherwise nothing is charged, and every filter charges its own access.
+
+        # Arguments:
+            privacy_filters: List with the privacy filter of every node
+            differentially_private_mechanism: Mechanism used by the access (default None, the default \
+            mechanism of every filter)
+        """
+        if not privacy_filters or not all(isinstance(privacy_filter, LedgerPrivacyFilter)
+                                          for privacy_filter in privacy_filters):
+            return
+
+        ledger = privacy_filters[0].ledger
+        mechanisms = {id(privacy_filter._get_data_access_definition(differentially_private_mechanism))
+                      for privacy_filter in privacy_filters}
+        if len(mechanisms) != 1 or any(privacy_filter.ledger is not ledger for privacy_filter in privacy_filters):
+            return
+
+        epsilon_delta = privacy_filters[0]._get_data_access_definition(differentially_private_mechanism).epsilon_delta
+        ledger.prepay(epsilon_delta, [privacy_filter.node for privacy_filter in privacy_filters])
+
+    def spend(self, epsilon_delta, node):
+        """
+        It spends a given privacy in a node, using its credit if it was prepaid.
+
+        # Arguments:
+            epsilon_delta: Privacy spent by an access, usually the epsilon_delta of a mechanism
+            node: Index of the node
+        """
+        epsilon, delta = epsilon_delta
+        if self._credit[0, node] == epsilon and self._credit[1, node] == delta:
+            self._credit[:, node] = np.nan
+        else:
+            self.charge(epsilon_delta, [node])
+
+    def __nodes(self, nodes):
+        """
+        Indices of the given nodes, or of all the nodes.
+        """
+        if nodes is None:
+            return np.arange(self._sums.shape[1])
+        return np.asarray(nodes, dtype=int)
+
+    def __spent_with(self, epsilon_delta, nodes):
+        """
+            It computes the running sums of the privacy spent by some nodes if an access with the given \
+            epsilon-delta is added.
+
+            # Returns:
+                Array of shape (4, n_nodes) with the sums of epsilon, delta, epsilon squared and \
+                epsilon * (exp(epsilon) - 1) / 2
+        """
+        epsilon, delta = epsilon_delta
+        return self._sums[:, self.__nodes(nodes)] + \
+            np.array([epsilon, delta, epsilon ** 2, epsilon * (exp(epsilon) - 1) * 0.5])[:, np.newaxis]
+
+    def __budget_exceeded(self, sums):
+        """
+            It checks whether the privacy spent given by the running sums of every node surpasses the privacy \
+            budget, with the theorems 3.6 and 5.1 from Privacy Odometers and Filters: Pay-as-you-Go Composition.
+
+            # Returns:
+                Boolean array, True for the nodes whose privacy budget is surpassed
+
+            # References:
+                - [Privacy Odometers and Filters: Pay-as-you-Go Composition] (https://arxiv.org/abs/1605.08294)
+        """
+        global_epsilon, global_delta = self._epsilon_delta
+        epsilon_sum, delta_sum, epsilon_squared_sum, epsilon_exp_sum = sums
+
+        privacy_budget_exceeded = (epsilon_sum > global_epsilon) | (delta_sum > global_delta)
+        if 0 < global_delta < exp(-1):
+            h = global_epsilon ** 2 / (28.04 * log(1 / global_delta))
+            k = epsilon_exp_sum + np.sqrt((epsilon_squared_sum + h) * (2 + np.log(epsilon_squared_sum / h + 1)) *
+                                          log(2 / global_delta))
+            privacy_budget_exceeded &= (k > global_epsilon) | (delta_sum > (global_delta * 0.5))
+
+        return privacy_budget_exceeded
+
+
+class LedgerPrivacyFilter(DPDataAccessDefinition):
+    """
+    It provides Adaptive Differential Privacy to a node, as \
+    [AdaptiveDifferentialPrivacy](./#adaptivedifferentialprivacy-class) does, keeping its privacy budget in a \
+    [PrivacyBudgetLedger](./#privacybudgetledger-class) shared by many nodes.
+
+    # Arguments:
+        ledger: PrivacyBudgetLedger keeping the budget of the node
+        node: Index of the node in the ledger
+        differentially_private_mechanism: Optional. Default method that will be used to access data. If it is not set \
+        it's mandatory to pass it in every query.
+
+    # Properties:
+        epsilon_delta: Return epsilon_delta value
+        ledger: Return the ledger keeping the budget
+        node: Return the index of the node in the ledger
+    """
+
+    def __init__(self, ledger, node, differentially_private_mechanism=None):
+        self._ledger = ledger
+        self._node = node
+        if differentially_private_mechanism is not None:
+            _check_differentially_private_mechanism(differentially_private_mechanism)
+        self._differentially_private_mechanism = differentially_private_mechanism
+
+    @property
+    def epsilon_delta(self):
+        return self._ledger.epsilon_delta
+
+    @property
+    def ledger(self):
+        return self._ledger
+
+    @property
+    def node(self):
+        return self._node
+
+    def apply(self, data, differentially_private_mechanism=None):
+        """
+        It applies a differentially private mechanism if the privacy budget of the node allows it.
+        If the privacy budget is suparsed and exception (ExceededPrivacyBudgetError) is thrown.
+
+        # Arguments:
+            data: input data which is going to be accessed with differential privacy
+            differentially_private_mechanism: it is the provider of differential privacy
+
+        # Returns:
+            The application of the dp-mechanism to the input data, if the privacy budget is not exceeded
+        """
+        differentially_private_mechanism_to_apply = self._get_data_access_definition(differentially_private_mechanism)
+        self._ledger.spend(differentially_private_mechanism_to_apply.epsilon_delta, self._node)
+
+        return differentially_private_mechanism_to_apply.apply(data)
+
+    def can_afford(self, differentially_private_mechanism=None):
+        """
+        It checks whether the privacy budget of the node allows an access with a differentially private \
+        mechanism, without accessing the data nor spending any budget.
+
+        # Arguments:
+            differentially_private_mechanism: it is the provider of differential privacy, by default the one \
+            given in the constructor
+
+        # Returns:
+            True if the mechanism can be applied without exceeding the privacy budget, False otherwise
+        """
+        differentially_private_mechanism_to_apply = self._get_data_access_definition(differentially_private_mechanism)
+
+        return bool(self._ledger.can_afford(differentially_private_mechanism_to_apply.epsilon_delta,
+                                            [self._node])[0])
+
+    def _get_data_access_definition(self, data_access_definition):
+        """
+        This method checks if the given data access definition is differentially private,
+        if none is provided, it ensures that the default data access definition is
+        differentially private.
+
+        # Arguments:
+            data_access_definition: method to be checked for Differential Privacy
+
+        # Returns:
+            The given data_access_definition or the default one given in the constructor
+        """
+        if data_access_definition is not None:
+            _check_differentially_private_mechanism(data_access_definition)
+            return data_access_definition
+        if self._differentially_private_mechanism is None:
+            raise ValueError("Not data access definition provided or default method established")
+        return self._differentially_private_mechanism
+
+
 def _check_differentially_private_mechanism(data_access_mechanism):
     """
         This method ensures that the given data access mechanism provides Differential Privacy
@@ -7,3 +7,5 @@ from shfl.federated_aggregator.fedavg_aggregator import FedAvgAggregator
 from shfl.federated_aggregator.weighted_fedavg_aggregator import WeightedFedAvgAggregator
 from shfl.federated_aggregator.iowa_federated_aggregator import IowaFederatedAggregator
 from shfl.federated_aggregator.cluster_fedavg_aggregator import ClusterFedAvgAggregator
+from shfl.federated_aggregator.matched_cluster_fedavg_aggregator import MatchedClusterFedAvgAggregator
+from shfl.federated_aggregator.sufficient_statistics_aggregator import SufficientStatisticsAggregator
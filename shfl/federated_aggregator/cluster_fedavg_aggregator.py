@@ -1,4 +1,5 @@
 from shfl.federated_aggregator.federated_aggregator import FederatedAggregator
+from shfl.model.param_vector import ParamVector
 import numpy as np
 from sklearn.cluster import KMeans
 
@@ -16,15 +17,21 @@ class ClusterFedAvgAggregator(FederatedAggregator):
         Implementation of abstract method of class [AggregateWeightsFunction](../federated_aggregator/#federatedaggregator-class)
         # Arguments:
             clients_params: list of multi-dimensional (numeric) arrays. Each entry in the list contains the \
-             model's parameters of one client.
+             model's parameters of one client. They can also be [ParamVector](../model/#paramvector-class).
 
         # Returns:
             aggregated_weights: aggregator weights representing the global learning model
         """
+        layout = clients_params[0] if isinstance(clients_params[0], ParamVector) else None
+        if layout is not None:
+            clients_params = [params.to_params() for params in clients_params]
+
         clients_params_array = np.concatenate(clients_params)
 
         n_clusters = clients_params[0].shape[0]
         model_aggregator = KMeans(n_clusters=n_clusters, init='k-means++')
         model_aggregator.fit(clients_params_array)
         aggregated_weights = np.array(model_aggregator.cluster_centers_)
+        if layout is not None:
+            aggregated_weights = ParamVector.from_params(aggregated_weights, layout.buffer.dtype)
         return aggregated_weights
@@ -1,15 +1,29 @@
 import numpy as np
 
 from shfl.federated_aggregator.federated_aggregator import FederatedAggregator
+from shfl.federated_aggregator.federated_aggregator import _add_weighted_params
+from shfl.federated_aggregator.federated_aggregator import _params_dtypes
+from shfl.federated_aggregator.federated_aggregator import _normalize_params
+from shfl.model.param_vector import ParamVector
 
 
 class FedAvgAggregator(FederatedAggregator):
     """
     Implementation of Average Federated Aggregator. It only uses a simple average of the parameters of all the models.
 
+    The params of the clients can be given as [ParamVector](../model/#paramvector-class), in which case each \
+    client is added to the aggregate with a single operation over its whole buffer.
+
+    Parameters added one at a time are kept as a running sum per layer, so the memory used does not depend on \
+    the number of clients.
+
     It implements [Federated Aggregator](../federated_aggregator/#federatedaggregator-class)
     """
 
+    def __init__(self, percentage=None):
+        super().__init__(percentage)
+        self.begin()
+
     def aggregate_weights(self, clients_params):
         """
         Implementation of abstract method of class [AggregateWeightsFunction](../federated_aggregator/#federatedaggregator-class)
@@ -22,10 +36,44 @@ class FedAvgAggregator(FederatedAggregator):
         # References
             [Communication-Efficient Learning of Deep Networks from Decentralized Data](https://arxiv.org/abs/1602.05629)
         """
+        self.begin()
+        for params in clients_params:
+            self.add(params)
+
+        aggregated_weights = self.finalize()
+        if isinstance(aggregated_weights, ParamVector):
+            return aggregated_weights
+
+        return np.array(aggregated_weights)
+
+    def begin(self):
+        self._weighted_sum = None
+        self._dtypes = None
+        self._layout = None
+        self._sum_weights = 0
+
+    def add(self, params, weight=None):
+        """
+        Adds the parameters of one client to the running sum.
 
-        clients_params_array = np.array(clients_params)
-        shape = clients_params_array.shape[1]
+        # Arguments:
+            params: Parameters of the local model of the client
+            weight: Weight of the client in the average (default None, all the clients weigh the same)
+        """
+        if weight is None:
+            weight = 1
+        if isinstance(params, ParamVector):
+            self._layout = params
+            params = params.buffer
+        if self._weighted_sum is None:
+            self._dtypes = _params_dtypes(params)
+        self._weighted_sum = _add_weighted_params(self._weighted_sum, params, weight)
+        self._sum_weights += weight
 
-        aggregated_weights = np.array([np.mean(clients_params_array[:, layer], axis=0) for layer in range(shape)])
+    def finalize(self):
+        aggregated_weights = _normalize_params(self._weighted_sum, self._sum_weights, self._dtypes)
+        if self._layout is not None:
+            aggregated_weights = self._layout.with_buffer(aggregated_weights)
+        self.begin()
 
         return aggregated_weights
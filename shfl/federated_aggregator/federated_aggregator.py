@@ -1,16 +1,24 @@
 import abc
+import numpy as np
 
 
 class FederatedAggregator(abc.ABC):
     """
     Interface for Federated Aggregator.
 
+    Besides aggregating a list with the parameters of all the clients, every aggregator can receive the \
+    parameters of the clients one at a time, as they are available: call begin, then add for every client \
+    and finally finalize to get the aggregated weights. By default the parameters are collected and aggregated \
+    in finalize, but aggregators can keep a running aggregate instead so that the server memory does not grow \
+    with the number of clients.
+
     # Arguments:
         percentage: Percentage of total data in each client (default None)
     """
 
     def __init__(self, percentage=None):
         self._percentage = percentage
+        self._clients_params = []
 
     @abc.abstractmethod
     def aggregate_weights(self, clients_params):
@@ -22,3 +30,110 @@ class FederatedAggregator(abc.ABC):
         # Returns:
             aggregated_weights: Aggregated weights
         """
+
+    def client_weight(self, index):
+        """
+        Weight of a client in the aggregation, given its index among all the clients.
+
+        # Arguments:
+            index: Index of the client
+
+        # Returns:
+            weight: The percentage of the client, or 1 if there are no percentages
+        """
+        if self._percentage is None:
+            return 1
+        return self._percentage[index]
+
+    def begin(self):
+        """
+        Starts a new aggregation, discarding the parameters added since the last one.
+        """
+        self._clients_params = []
+
+    def add(self, params, weight=None):
+        """
+        Adds the parameters of one client to the current aggregation.
+
+        # Arguments:
+            params: Parameters of the local model of the client
+            weight: Weight of the client in the aggregation (default None, the aggregator decides)
+        """
+        self._clients_params.append(params)
+
+    def finalize(self):
+        """
+        Ends the current aggregation.
+
+        # Returns:
+            aggregated_weights: Aggregated weights of the clients added since begin
+        """
+        clients_params = self._clients_params
+        self._clients_params = []
+
+        return self.aggregate_weights(clients_params)
+
+
+def _is_params_list(params):
+    """
+    Checks whether some parameters are a list of arrays (e.g. layers) instead of a single array.
+    """
+    return isinstance(params, (list, tuple)) or (isinstance(params, np.ndarray) and params.dtype == object)
+
+
+def _add_weighted_params(weighted_sum, params, weight):
+    """
+    Adds some parameters multiplied by a weight to a running sum, layer by layer. The sum is kept in float64.
+
+    # Arguments:
+        weighted_sum: Running sum, with the structure of the parameters, or None to start a new one
+        params: Parameters to add, either an array or a list of arrays
+        weight: Weight of the parameters
+
+    # Returns:
+        weighted_sum: Updated running sum
+    """
+    if _is_params_list(params):
+        if weighted_sum is None:
+            weighted_sum = [None] * len(params)
+        return [_add_weighted_params(layer_sum, layer, weight) for layer_sum, layer in zip(weighted_sum, params)]
+
+    weighted_params = np.multiply(params, weight, dtype=np.float64)
+    if weighted_sum is None:
+        return weighted_params
+    weighted_sum += weighted_params
+
+    return weighted_sum
+
+
+def _params_dtypes(params):
+    """
+    Gets the dtype of every array in some parameters, with the structure of the parameters.
+    """
+    if _is_params_list(params):
+        return [_params_dtypes(layer) for layer in params]
+
+    return np.asarray(params).dtype
+
+
+def _normalize_params(weighted_sum, total_weight, dtypes):
+    """
+    Divides a running sum by the total weight, casting every layer back to the original floating dtype.
+
+    # Arguments:
+        weighted_sum: Running sum of parameters
+        total_weight: Total weight of the sum
+        dtypes: Original dtypes, with the structure of the running sum
+
+    # Returns:
+        params: Normalized parameters
+    """
+    if isinstance(weighted_sum, list):
+        return [_normalize_params(layer_sum, total_weight, layer_dtype)
+                for layer_sum, layer_dtype in zip(weighted_sum, dtypes)]
+
+    params = weighted_sum / total_weight
+    if np.issubdtype(dtypes, np.floating):
+        params = params.astype(dtypes, copy=False)
+
+    return params
@@ -0,0 +1,146 @@
+import numpy as np
+from scipy.optimize import linear_sum_assignment
+
+from shfl.federated_aggregator.cluster_fedavg_aggregator import ClusterFedAvgAggregator
+from shfl.model.param_vector import ParamVector
+
+
+class MatchedClusterFedAvgAggregator(ClusterFedAvgAggregator):
+    """
+    Implementation of Cluster Average Federated Aggregator matching the centroids of every node to the global \
+    centroids instead of clustering them again.
+
+    The centroids of every node are aligned to the global centroids of the previous aggregation with the \
+    Hungarian algorithm, minimizing the squared distance between matched centroids, and the aligned centroids \
+    are averaged. The distances of all the nodes are computed at once, so the aggregation costs \
+    O(nodes x clusters ^ 2) plus the matching, it is deterministic and every global centroid keeps its \
+    identity across rounds. The centroids of the first node are the reference of the first aggregation, \
+    unless initial centroids are given.
+
+    The params of the clients can be the centroids of a [KMeansModel](../model/#kmeansmodel-class), weighted by \
+    the weight of every client, or the sums and counts of the clusters of a \
+    [LloydKMeansModel](../model/#lloydkmeansmodel-class), weighted by the count of every cluster. Global \
+    centroids without any weight keep their previous value.
+
+    It implements [Federated Aggregator](../federated_aggregator/#federatedaggregator-class)
+
+    # Arguments:
+        init: Initial global centroids, array of shape (n_clusters, n_features) (default None)
+        counts: boolean indicating if the params hold the sums of the clusters followed by their counts, \
+        as in LloydKMeansModel, instead of the centroids (default False)
+    """
+
+    def __init__(self, init=None, counts=False):
+        super().__init__()
+        self._centroids = None if init is None else np.array(init, dtype=float)
+        self._counts = counts
+        self.begin()
+
+    def aggregate_weights(self, clients_params):
+        """
+        Implementation of abstract method of class [AggregateWeightsFunction](../federated_aggregator/#federatedaggregator-class)
+
+        # Arguments:
+            clients_params: list of multi-dimensional (numeric) arrays. Each entry in the list contains the \
+             model's parameters of one client. They can also be [ParamVector](../model/#paramvector-class).
+
+        # Returns:
+            aggregated_weights: aggregator weights representing the global learning model
+        """
+        self.begin()
+        for params in clients_params:
+            self.add(params)
+
+        return self.finalize()
+
+    def begin(self):
+        self._clients_params = []
+        self._weights = []
+        self._layout = None
+
+    def add(self, params, weight=None):
+        """
+        Adds the parameters of one client to the current aggregation.
+
+        # Arguments:
+            params: Parameters of the local model of the client
+            weight: Weight of the centroids of the client (default None, 1). Ignored if the params hold counts.
+        """
+        if isinstance(params, ParamVector):
+            self._layout = params
+            params = params.to_params()
+        self._clients_params.append(np.asarray(params, dtype=float))
+        self._weights.append(1 if weight is None else weight)
+
+    def finalize(self):
+        clients_params = np.stack(self._clients_params)
+        if self._counts:
+            centroids, cluster_weights = self._centroids_counts(clients_params, self._centroids)
+        else:
+            centroids = clients_params
+            cluster_weights = np.repeat(np.asarray(self._weights, dtype=float)[:, np.newaxis],
+                                        clients_params.shape[1], axis=1)
+
+        if self._centroids is None:
+            self._centroids = centroids[0]
+        assignment = self._match(centroids, self._centroids)
+
+        num_clients = np.arange(len(clients_params))[:, np.newaxis]
+        aligned_params = np.empty_like(clients_params)
+        aligned_params[num_clients, assignment] = clients_params
+        aligned_weights = np.empty_like(cluster_weights)
+        aligned_weights[num_clients, assignment] = cluster_weights
+
+        if self._counts:
+            aggregated_weights = aligned_params.sum(axis=0)
+            self._centroids = self._centroids_counts(aggregated_weights[np.newaxis], self._centroids)[0][0]
+        else:
+            total_weights = aligned_weights.sum(axis=0)[:, np.newaxis]
+            weighted_sum = (aligned_params * aligned_weights[:, :, np.newaxis]).sum(axis=0)
+            aggregated_weights = np.divide(weighted_sum, total_weights, out=self._centroids.copy(),
+                                           where=total_weights > 0)
+            self._centroids = aggregated_weights
+
+        layout = self._layout
+        self.begin()
+        if layout is not None:
+            aggregated_weights = ParamVector.from_params(aggregated_weights, layout.buffer.dtype)
+
+        return aggregated_weights
+
+    @staticmethod
+    def _centroids_counts(statistics, previous=None):
+        """
+        Centroids and counts of the clusters from their sums and counts. Empty clusters get the previous \
+        centroids, or the origin.
+        """
+        counts = statistics[:, :, -1]
+        centroids = np.zeros(statistics[:, :, :-1].shape) if previous is None else \
+            np.repeat(previous[np.newaxis], len(statistics), axis=0)
+        non_empty = counts > 0
+        centroids[non_empty] = statistics[:, :, :-1][non_empty] / counts[non_empty][:, np.newaxis]
+
+        return centroids, counts
+
+    @staticmethod
+    def _match(centroids, reference):
+        """
+        Matches the centroids of every client to the reference centroids.
+
+        # Arguments:
+            centroids: Array of shape (n_clients, n_clusters, n_features) with the centroids of every client
+            reference: Array of shape (n_clusters, n_features) with the reference centroids
+
+        # Returns:
+            assignment: Array of shape (n_clients, n_clusters) with the reference centroid matched to every \
+            centroid of every client
+        """
+        distances = (centroids ** 2).sum(axis=2)[:, :, np.newaxis] + (reference ** 2).sum(axis=1) \
+            - 2 * np.matmul(centroids, reference.T)
+
+        assignment = np.empty(distances.shape[:2], dtype=int)
+        for client, client_distances in enumerate(distances):
+            rows, columns = linear_sum_assignment(client_distances)
+            assignment[client, rows] = columns
+
+        return assignment
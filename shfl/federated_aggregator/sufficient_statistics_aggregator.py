@@ -0,0 +1,79 @@
+import numpy as np
+
+from shfl.federated_aggregator.federated_aggregator import FederatedAggregator
+
+
+class SufficientStatisticsAggregator(FederatedAggregator):
+    """
+    Implementation of an aggregator fitting a linear regression exactly from the sufficient statistics of the \
+    clients (see: [SufficientStatistics](../private/query/#sufficientstatistics-class)) instead of their \
+    params. The statistics are added up and the normal equations of all the data are solved, so the result \
+    is the centralized least squares solution, in a single round.
+
+    The statistics may come from a differentially private mechanism. Since noise breaks their symmetry, the \
+    sum is symmetrized before solving it, and the ridge term helps keeping the noisy equations well posed.
+
+    The aggregated weights have the layout of the params of \
+    [LinearRegressionModel](../model/#linearregressionmodel-class), with the intercept in the first column.
+
+    It implements [Federated Aggregator](../federated_aggregator/#federatedaggregator-class)
+
+    # Arguments:
+        n_targets: Number of targets of the linear regression (default 1)
+        ridge: Weight of the L2 regularization of the coefficients, the intercept is not regularized (default 0)
+    """
+
+    def __init__(self, n_targets=1, ridge=0):
+        super().__init__()
+        self._n_targets = n_targets
+        self._ridge = ridge
+        self.begin()
+
+    def aggregate_weights(self, clients_params):
+        """
+        Implementation of abstract method of class [AggregateWeightsFunction](../federated_aggregator/#federatedaggregator-class)
+
+        # Arguments:
+            clients_params: list with the sufficient statistics of every client
+
+        # Returns
+            aggregated_weights: params of the linear regression, of shape (n_targets, n_features + 1)
+        """
+        self.begin()
+        for statistics in clients_params:
+            self.add(statistics)
+
+        return self.finalize()
+
+    def begin(self):
+        self._statistics = None
+
+    def add(self, params, weight=None):
+        """
+        Adds the sufficient statistics of one client to the running sum.
+
+        # Arguments:
+            params: Sufficient statistics of the data of the client
+            weight: Weight of the statistics of the client (default None, 1)
+        """
+        if weight is None:
+            weight = 1
+        statistics = np.multiply(params, weight, dtype=np.float64)
+        if self._statistics is None:
+            self._statistics = statistics
+        else:
+            self._statistics += statistics
+
+    def finalize(self):
+        statistics = (self._statistics + self._statistics.T) / 2
+        self.begin()
+
+        num_params = len(statistics) - self._n_targets
+        gram = statistics[:num_params, :num_params] + self._ridge * np.diag(np.r_[0, np.ones(num_params - 1)])
+        moments = statistics[:num_params, num_params:]
+        try:
+            coefficients = np.linalg.solve(gram, moments)
+        except np.linalg.LinAlgError:
+            coefficients = np.linalg.lstsq(gram, moments, rcond=None)[0]
+
+        return coefficients.T
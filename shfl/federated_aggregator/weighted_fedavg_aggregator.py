@@ -1,6 +1,10 @@
 import numpy as np
 
 from shfl.federated_aggregator.federated_aggregator import FederatedAggregator
+from shfl.federated_aggregator.federated_aggregator import _add_weighted_params
+from shfl.federated_aggregator.federated_aggregator import _params_dtypes
+from shfl.federated_aggregator.federated_aggregator import _normalize_params
+from shfl.model.param_vector import ParamVector
 
 
 class WeightedFedAvgAggregator(FederatedAggregator):
@@ -8,9 +12,20 @@ class WeightedFedAvgAggregator(FederatedAggregator):
     Implementation of Weighted Federated Avegaring Aggregator. The aggregation of the parameters is based in the number of data \
     in every node.
 
+    The params of the clients can be given as [ParamVector](../model/#paramvector-class), in which case each \
+    client is added to the aggregate with a single operation over its whole buffer.
+
+    Parameters added one at a time are kept as a running weighted sum per layer, so the memory used does not \
+    depend on the number of clients. The sum is divided by the total weight of the clients added, so the \
+    weights of a subset of the clients, such as those selected in a round, are normalized.
+
     It implements [Federated Aggregator](../federated_aggregator/#federatedaggregator-class)
     """
 
+    def __init__(self, percentage=None):
+        super().__init__(percentage)
+        self.begin()
+
     def aggregate_weights(self, clients_params):
         """
         Implementation of abstract method of class [AggregateWeightsFunction](../federated_aggregator/#federatedaggregator-class)
@@ -21,12 +36,47 @@ class WeightedFedAvgAggregator(FederatedAggregator):
         # Returns:
             aggregated_weights: aggregator weights representing the global learning model
         """
-        clients_params_array = np.array(clients_params)
+        self.begin()
+        for params in clients_params:
+            self.add(params)
+
+        aggregated_weights = self.finalize()
+        if isinstance(aggregated_weights, ParamVector):
+            return aggregated_weights
+
+        return np.array(aggregated_weights)
+
+    def begin(self):
+        self._weighted_sum = None
+        self._dtypes = None
+        self._layout = None
+        self._num_clients = 0
+        self._sum_weights = 0
+
+    def add(self, params, weight=None):
+        """
+        Adds the parameters of one client to the running weighted sum.
 
-        num_clients = clients_params_array.shape[0]
-        num_layers = clients_params_array.shape[1]
+        # Arguments:
+            params: Parameters of the local model of the client
+            weight: Weight of the client (default None, the percentage of the client in the order they are added). \
+            Clients added out of order must be given their own weight (see: client_weight)
+        """
+        if weight is None:
+            weight = self._percentage[self._num_clients]
+        if isinstance(params, ParamVector):
+            self._layout = params
+            params = params.buffer
+        if self._weighted_sum is None:
+            self._dtypes = _params_dtypes(params)
+        self._weighted_sum = _add_weighted_params(self._weighted_sum, params, weight)
+        self._num_clients += 1
+        self._sum_weights += weight
 
-        ponderated_weights = np.array([self._percentage[client] * clients_params_array[client, :] for client in range(num_clients)])
-        aggregated_weights = np.array([np.sum(ponderated_weights[:, layer], axis=0) for layer in range(num_layers)])
+    def finalize(self):
+        aggregated_weights = _normalize_params(self._weighted_sum, self._sum_weights, self._dtypes)
+        if self._layout is not None:
+            aggregated_weights = self._layout.with_buffer(aggregated_weights)
+        self.begin()
 
         return aggregated_weights
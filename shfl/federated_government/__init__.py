@@ -7,4 +7,19 @@ from shfl.federated_government.federated_images_classifier import FederatedImage
 from shfl.federated_government.federated_clustering import FederatedClustering
 from shfl.federated_government.federated_linear_regression import FederatedLinearRegression
 from shfl.federated_government.iowa_federated_government import IowaFederatedGovernment
-
+from shfl.federated_government.asynchronous_federated_government import AsynchronousFederatedGovernment
+from shfl.federated_government.vectorized_federated_government import VectorizedFederatedGovernment
+from shfl.federated_government.training_executor import TrainingExecutor
+from shfl.federated_government.training_executor import SerialTrainingExecutor
+from shfl.federated_government.training_executor import ThreadPoolTrainingExecutor
+from shfl.federated_government.training_executor import ProcessPoolTrainingExecutor
+from shfl.federated_government.training_executor import PersistentProcessTrainingExecutor
+from shfl.federated_government.client_selector import ClientSelector
+from shfl.federated_government.client_selector import UniformClientSelector
+from shfl.federated_government.client_selector import SizeWeightedClientSelector
+from shfl.federated_government.client_selector import PowerOfChoiceClientSelector
+from shfl.federated_government.virtual_clock import VirtualClock
+from shfl.federated_government.evaluation_policy import EvaluationPolicy
+from shfl.federated_government.evaluation_policy import FullEvaluationPolicy
+from shfl.federated_government.evaluation_policy import SubsampleEvaluationPolicy
+from shfl.federated_government.evaluation_policy import ShardedEvaluationPolicy
@@ -0,0 +1,155 @@
+import random
+from concurrent import futures
+
+from shfl.federated_aggregator.fedavg_aggregator import FedAvgAggregator
+from shfl.federated_government.federated_government import FederatedGovernment
+
+
+class AsynchronousFederatedGovernment(FederatedGovernment):
+    """
+    Class used to represent an asynchronous [FederatedGovernment](./#federatedgovernment-class), where the global \
+    model is updated as soon as the clients finish their training instead of waiting for all of them.
+
+    Clients are trained through the executor and, whenever one finishes, its parameters are added to the \
+    aggregator with the weight of the client (see: [FederatedAggregator](../federated_aggregator/#federatedaggregator-class)). Every time buffer_size clients have arrived, the aggregated parameters are mixed into the global \
+    model as global = (1 - alpha) * global + alpha * aggregated, where alpha is the mixing rate multiplied by the \
+    mean staleness weight (1 + staleness) ^ -staleness_exponent of the arrived clients. The staleness of a client \
+    is the number of global updates made since the global model was deployed to it. The finished clients then \
+    receive the current global model and start training again.
+
+    A buffer_size of 1 corresponds to FedAsync and bigger buffers to FedBuff. Concurrent training needs an \
+    executor training the clients in the background, such as \
+    [ThreadPoolTrainingExecutor](./#threadpooltrainingexecutor-class); with the default serial executor \
+    clients are trained one after another.
+
+    # Arguments:
+        model_builder: Function that return a trainable model (see: [Model](../model))
+        federated_data: Federated data to use. (see: [FederatedData](../private/federated_operation/#federateddata-class))
+        aggregator: Federated aggregator function (see: [Federated Aggregator](../federated_aggregator))
+        model_param_access: Policy to access model's parameters, by default non-protected (see: [DataAccessDefinition](../private/data/#dataaccessdefinition-class))
+        executor: Strategy used to train the clients, by default serial (see: [TrainingExecutor](./#trainingexecutor-class))
+        client_selector: Strategy choosing the clients taking part in the training, selected once at the start, \
+        by default all of them (see: [ClientSelector](./#clientselector-class))
+        buffer_size: Number of client arrivals aggregated in every update of the global model (default 1)
+        mixing_rate: Weight of the aggregated parameters when mixed into the global model (default 0.6)
+        staleness_exponent: Exponent of the polynomial staleness weight (default 0.5)
+        concurrency: Maximum number of clients training at the same time (default None, all of them)
+
+    # References:
+        [Asynchronous Federated Optimization](https://arxiv.org/abs/1903.03934)
+        [Federated Learning with Buffered Asynchronous Aggregation](https://arxiv.org/abs/2106.06639)
+    """
+
+    def __init__(self, model_builder, federated_data, aggregator, model_params_access=None, executor=None,
+                 client_selector=None, buffer_size=1, mixing_rate=0.6, staleness_exponent=0.5, concurrency=None):
+        super().__init__(model_builder, federated_data, aggregator, model_params_access, executor, client_selector)
+        if buffer_size < 1:
+            raise ValueError("The buffer size must be at least 1")
+        if not 0 < mixing_rate <= 1:
+            raise ValueError("The mixing rate must be between 0 and 1")
+
+        self._buffer_size = buffer_size
+        self._mixing_rate = mixing_rate
+        self._staleness_exponent = staleness_exponent
+        self._concurrency = concurrency
+        self._mixer = FedAvgAggregator()
+        self._version = 0
+        self._buffered_staleness = []
+
+    @property
+    def version(self):
+        return self._version
+
+    def staleness_weight(self, staleness):
+        """
+        Weight of an update according to its staleness.
+
+        # Arguments:
+            staleness: Number of global updates made since the client received the global model
+
+        # Returns:
+            weight: Polynomial staleness weight, 1 for fresh updates
+        """
+        return (1 + staleness) ** -self._staleness_exponent
+
+    def add_client_update(self, data_node, staleness):
+        """
+        Adds the parameters of a client that finished its training to the buffer, updating the global model \
+        when the buffer is full.
+
+        # Arguments:
+            data_node: [FederatedDataNode](../private/federated_operation/#federateddatanode-class) that finished
+            staleness: Staleness of the update of the client
+
+        # Returns:
+            updated: Whether the global model was updated
+        """
+        if not self._buffered_staleness:
+            self._aggregator.begin()
+        self._aggregator.add(data_node.query_model_params(), self._aggregator.client_weight(self._node_index(data_node)))
+        self._buffered_staleness.append(staleness)
+
+        if len(self._buffered_staleness) < self._buffer_size:
+            return False
+
+        aggregated_weights = self._aggregator.finalize()
+        weights = [self.staleness_weight(staleness) for staleness in self._buffered_staleness]
+        alpha = self._mixing_rate * sum(weights) / len(weights)
+        self._buffered_staleness = []
+
+        self._mixer.begin()
+        self._mixer.add(self._model.get_model_params(), 1 - alpha)
+        self._mixer.add(aggregated_weights, alpha)
+        self._model.set_model_params(self._mixer.finalize())
+        self._version += 1
+
+        return True
+
+    def run_rounds(self, n, test_data, test_label):
+        """
+        Trains asynchronously until the global model has been updated n times, testing the global model \
+        after every update.
+
+        # Arguments:
+            n: Number of updates of the global model
+            test_data: Test data for evaluation between updates
+            test_label: Test label for evaluation between updates
+        """
+        self.select_clients()
+        idle = list(self._selected_data)
+        random.shuffle(idle)
+        concurrency = len(idle) if self._concurrency is None else self._concurrency
+
+        in_flight = {}
+        for _ in range(min(concurrency, len(idle))):
+            self._start_client(idle.pop(), in_flight)
+
+        updates = 0
+        while updates < n and in_flight:
+            done, _ = futures.wait(in_flight, return_when=futures.FIRST_COMPLETED)
+            for future in done:
+                data_node, version = in_flight.pop(future)
+                future.result()
+                idle.append(data_node)
+
+                if updates < n and self.add_client_update(data_node, self._version - version):
+                    print("Accuracy update " + str(updates))
+                    self.evaluate_global_model(test_data, test_label)
+                    print("\n\n")
+                    updates += 1
+
+            while updates < n and idle and len(in_flight) < concurrency:
+                self._start_client(idle.pop(random.randrange(len(idle))), in_flight)
+
+        futures.wait(in_flight)
+
+    def _start_client(self, data_node, in_flight):
+        """
+        Deploys the global model to a client and starts training it.
+
+        # Arguments:
+            data_node: Data node to train
+            in_flight: Dictionary of the clients training, by future, updated with the new client
+        """
+        data_node.set_model_params(self._model.get_model_params(), ownership="shared")
+        in_flight[self._executor.submit(data_node)] = (data_node, self._version)
@@ -0,0 +1,149 @@
+import abc
+import numpy as np
+
+
+class ClientSelector(abc.ABC):
+    """
+    Interface defining which clients take part in every round of a [FederatedGovernment](./#federatedgovernment-class).
+
+    Only the selected clients receive the global model, are trained, evaluated and aggregated in the round. \
+    Custom strategies are defined extending this class.
+    """
+
+    @abc.abstractmethod
+    def select(self, federated_data, global_model=None):
+        """
+        Chooses the clients of the next round.
+
+        # Arguments:
+            federated_data: [FederatedData](../private/federated_operation/#federateddata-class) with all the clients
+            global_model: Current global model (see: [Model](../model)), for strategies depending on it (default None)
+
+        # Returns:
+            indices: Indices of the selected clients in the federated data
+        """
+
+
+class UniformClientSelector(ClientSelector):
+    """
+    Selects a fraction of the clients uniformly at random, without replacement.
+
+    It implements [ClientSelector](./#clientselector-class)
+
+    # Arguments:
+        fraction: Fraction of the clients selected in every round (between 0 and 1)
+        min_clients: Minimum number of clients selected in every round (default 1)
+    """
+
+    def __init__(self, fraction, min_clients=1):
+        if not 0 < fraction <= 1:
+            raise ValueError("The fraction of selected clients must be between 0 and 1")
+        self._fraction = fraction
+        self._min_clients = min_clients
+
+    def select(self, federated_data, global_model=None):
+        num_nodes = federated_data.num_nodes()
+        return np.sort(np.random.choice(num_nodes, self._num_selected(num_nodes), replace=False))
+
+    def _num_selected(self, num_nodes):
+        """
+        Number of clients to select from the given number of clients.
+        """
+        return min(num_nodes, max(self._min_clients, int(round(self._fraction * num_nodes))))
+
+
+class SizeWeightedClientSelector(UniformClientSelector):
+    """
+    Selects a fraction of the clients at random, without replacement, with probability proportional to \
+    their number of samples.
+
+    It implements [ClientSelector](./#clientselector-class)
+
+    # Arguments:
+        fraction: Fraction of the clients selected in every round (between 0 and 1)
+        min_clients: Minimum number of clients selected in every round (default 1)
+    """
+
+    def select(self, federated_data, global_model=None):
+        sizes = np.array([data_node.num_samples() for data_node in federated_data], dtype=float)
+        num_selected = self._num_selected(len(sizes))
+        num_selected = min(num_selected, np.count_nonzero(sizes))
+
+        return np.sort(np.random.choice(len(sizes), num_selected, replace=False, p=sizes / sizes.sum()))
+
+
+class PowerOfChoiceClientSelector(UniformClientSelector):
+    """
+    Selects the clients with the worst performance of the global model among a set of candidates \
+    (power-of-choice strategy). Candidates are drawn without replacement with probability proportional to \
+    their number of samples, the global model is deployed to all of them and only the fraction of clients with \
+    the highest loss is kept.
+
+    The candidates are probed all at once, through the local performance of the selected \
+    [FederatedData](../private/federated_operation/#federateddata-class), so models of the same class evaluate \
+    all the candidates together. Their performances are cached until the next selection, so only the \
+    candidates are evaluated in every round.
+
+    It implements [ClientSelector](./#clientselector-class)
+
+    # Arguments:
+        fraction: Fraction of the clients selected in every round (between 0 and 1)
+        num_candidates: Number of candidates probed in every round
+        min_clients: Minimum number of clients selected in every round (default 1)
+        performance_is_loss: Whether the performance of the model is a loss, the lower the better, as in \
+        [DeepLearningModel](../model/#deeplearningmodel-class) (default False)
+        max_samples: Maximum number of samples of every candidate used to probe it (default None, all of them)
+
+    # Properties:
+        candidates_performance: Dictionary with the performance of every candidate of the last selection, \
+        by index of the client
+
+    # References:
+        [Client Selection in Federated Learning: Convergence Analysis and Power-of-Choice Selection Strategies](https://arxiv.org/abs/2010.01243)
+    """
+
+    def __init__(self, fraction, num_candidates, min_clients=1, performance_is_loss=False, max_samples=None):
+        super().__init__(fraction, min_clients)
+        self._num_candidates = num_candidates
+        self._performance_is_loss = performance_is_loss
+        self._max_samples = max_samples
+        self._candidates_performance = {}
+
+    @property
+    def candidates_performance(self):
+        return self._candidates_performance
+
+    def select(self, federated_data, global_model=None):
+        sizes = np.array([data_node.num_samples() for data_node in federated_data], dtype=float)
+        num_selected = self._num_selected(len(sizes))
+        num_candidates = min(max(self._num_candidates, num_selected), np.count_nonzero(sizes))
+
+        candidates = np.random.choice(len(sizes), num_candidates, replace=False, p=sizes / sizes.sum())
+        self._candidates_performance = self._probe(federated_data, candidates, global_model)
+
+        losses = np.array([self._candidates_performance[candidate] for candidate in candidates])
+        if not self._performance_is_loss:
+            losses = -losses
+        worst = np.argsort(-losses, kind="stable")[:num_selected]
+
+        return np.sort(candidates[worst])
+
+    def _probe(self, federated_data, candidates, global_model):
+        """
+        Deploys the global model to the candidates and evaluates it over their private data.
+
+        # Arguments:
+            federated_data: Federated data with all the clients
+            candidates: Indices of the candidates
+            global_model: Current global model. If None, the current models of the candidates are evaluated
+
+        # Returns:
+            performance: Dictionary with the performance of every candidate
+        """
+        candidates_data = federated_data.select(candidates)
+        if global_model is not None:
+            global_params = global_model.get_model_params()
+            for data_node in candidates_data:
+                data_node.set_model_params(global_params, ownership="shared")
+
+        return dict(zip(candidates, candidates_data.local_performance(self._max_samples)))
@@ -0,0 +1,182 @@
+import abc
+import numpy as np
+
+
+class EvaluationPolicy(abc.ABC):
+    """
+    Interface defining when and over which test data the models of a \
+    [FederatedGovernment](./#federatedgovernment-class) are evaluated.
+
+    The test data of every client is prepared once per test set and cached, so rounds evaluating over the same \
+    test set do not copy or split it again. Custom policies are defined extending this class.
+
+    # Arguments:
+        every: Number of rounds between evaluations, the last round of every period is evaluated (default 1)
+    """
+
+    def __init__(self, every=1):
+        if every < 1:
+            raise ValueError("The number of rounds between evaluations must be at least 1")
+        self._every = every
+        self._cache_key = None
+        self._cache = None
+
+    def evaluates(self, round_number):
+        """
+        Whether a round is evaluated.
+
+        # Arguments:
+            round_number: Number of the round, starting from 0
+
+        # Returns:
+            evaluates: True if the models are evaluated after the round
+        """
+        return (round_number + 1) % self._every == 0
+
+    def client_test_data(self, data_test, label_test, num_clients):
+        """
+        Test data used to evaluate every client.
+
+        # Arguments:
+            data_test: Global test data
+            label_test: Labels of the global test data
+            num_clients: Number of clients evaluated
+
+        # Returns:
+            test_data: List with the test data and labels of every client
+        """
+        return self._cached(data_test, label_test, num_clients)
+
+    def global_test_data(self, data_test, label_test):
+        """
+        Test data used to evaluate the global model. By default the whole test data.
+
+        # Arguments:
+            data_test: Global test data
+            label_test: Labels of the global test data
+
+        # Returns:
+            data: Test data
+            labels: Labels of the test data
+        """
+        return data_test, label_test
+
+    def combine(self, evaluations, test_data):
+        """
+        Combines the evaluations of the clients into a single evaluation. By default they are not combined.
+
+        # Arguments:
+            evaluations: List with the evaluation of every client
+            test_data: List with the test data and labels of every client, as returned by client_test_data
+
+        # Returns:
+            evaluation: Combined evaluation, or None if the evaluations are not combined
+        """
+        return None
+
+    @abc.abstractmethod
+    def _prepare(self, data_test, label_test, num_clients):
+        """
+        Prepares the test data of the clients, called once per test set.
+
+        # Returns:
+            prepared: Prepared test data, by default the list with the test data and labels of every client
+        """
+
+    def _cached(self, data_test, label_test, num_clients):
+        """
+        Returns the prepared test data, preparing it only if the test set or the number of clients changed.
+        """
+        if self._cache_key is None or self._cache_key[0] is not data_test or self._cache_key[1] is not label_test \
+                or self._cache_key[2] != num_clients:
+            self._cache = self._prepare(data_test, label_test, num_clients)
+            self._cache_key = (data_test, label_test, num_clients)
+
+        return self._cache
+
+
+class FullEvaluationPolicy(EvaluationPolicy):
+    """
+    Evaluates every client and the global model over the whole test data. This is the default behaviour \
+    of [FederatedGovernment](./#federatedgovernment-class).
+
+    It implements [EvaluationPolicy](./#evaluationpolicy-class)
+
+    # Arguments:
+        every: Number of rounds between evaluations (default 1)
+    """
+
+    def _prepare(self, data_test, label_test, num_clients):
+        return [(data_test, label_test)] * num_clients
+
+
+class SubsampleEvaluationPolicy(EvaluationPolicy):
+    """
+    Evaluates every client and the global model over a fixed stratified subsample of the test data, drawn \
+    once per test set.
+
+    The test samples are sorted by label and taken at regular intervals from a random offset, so every label \
+    keeps its proportion in the subsample. Labels can be one hot encoded, integer or continuous.
+
+    It implements [EvaluationPolicy](./#evaluationpolicy-class)
+
+    # Arguments:
+        num_samples: Number of test samples in the subsample
+        every: Number of rounds between evaluations (default 1)
+    """
+
+    def __init__(self, num_samples, every=1):
+        super().__init__(every)
+        self._num_samples = num_samples
+
+    def global_test_data(self, data_test, label_test):
+        return self._cached(data_test, label_test, None)
+
+    def client_test_data(self, data_test, label_test, num_clients):
+        return [self.global_test_data(data_test, label_test)] * num_clients
+
+    def _prepare(self, data_test, label_test, num_clients):
+        indices = self._stratified_indices(label_test)
+        return np.ascontiguousarray(data_test[indices]), np.ascontiguousarray(label_test[indices])
+
+    def _stratified_indices(self, label_test):
+        """
+        Indices of the stratified subsample, in increasing order.
+        """
+        num_test = len(label_test)
+        if self._num_samples >= num_test:
+            return np.arange(num_test)
+
+        labels = np.asarray(label_test)
+        if labels.ndim > 1:
+            labels = labels.reshape(num_test, -1).argmax(axis=1)
+
+        permutation = np.random.permutation(num_test)
+        order = permutation[np.argsort(labels[permutation], kind="stable")]
+        positions = ((np.arange(self._num_samples) + np.random.rand()) * num_test / self._num_samples).astype(int)
+
+        return np.sort(order[positions])
+
+
+class ShardedEvaluationPolicy(EvaluationPolicy):
+    """
+    Splits the test data in disjoint random shards, one for every client, so the test data is evaluated once \
+    per round instead of once per client. The evaluations of the clients are combined averaging them, \
+    weighted by the size of their shards. The global model is evaluated over the whole test data.
+
+    It implements [EvaluationPolicy](./#evaluationpolicy-class)
+
+    # Arguments:
+        every: Number of rounds between evaluations (default 1)
+    """
+
+    def combine(self, evaluations, test_data):
+        sizes = [len(label) for _, label in test_data]
+        evaluations = np.array(evaluations, dtype=float)
+
+        return np.average(evaluations, axis=0, weights=sizes)
+
+    def _prepare(self, data_test, label_test, num_clients):
+        shards = np.array_split(np.random.permutation(len(label_test)), num_clients)
+
+        return [(data_test[np.sort(shard)], label_test[np.sort(shard)]) for shard in shards]
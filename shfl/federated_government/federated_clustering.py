@@ -1,8 +1,10 @@
 from shfl.federated_government.federated_government import FederatedGovernment
 from shfl.data_distribution.data_distribution_iid import IidDataDistribution
 from shfl.data_distribution.data_distribution_non_iid import NonIidDataDistribution
-from shfl.federated_aggregator.cluster_fedavg_aggregator import ClusterFedAvgAggregator
+from shfl.federated_aggregator.matched_cluster_fedavg_aggregator import MatchedClusterFedAvgAggregator
+from shfl.federated_aggregator.fedavg_aggregator import FedAvgAggregator
 from shfl.model.kmeans_model import KMeansModel
+from shfl.model.kmeans_model import LloydKMeansModel
 from shfl.data_base.iris import Iris
 
 from enum import Enum
@@ -21,14 +23,21 @@ class FederatedClustering(FederatedGovernment):
     Class used to represent a high-level federated clustering using k-means
     (see: [FederatedGoverment](../federated_government/#federatedgovernment-class)).
 
+    The centroids of the nodes are aggregated matching them to the global centroids \
+    (see: [MatchedClusterFedAvgAggregator](../federated_aggregator/#matchedclusterfedavgaggregator-class)).
+
     # Arguments:
         data_base_name_key: key of the enumeration of valid data bases (see: [ClusteringDataBases](./#clusteringdatabases-class))
         iid: boolean which specifies if the distribution if IID (True) or non-IID (False) (True by default)
         num_nodes: number of clients.
         percent: percentage of the database to distribute among nodes.
+        lloyd: boolean which specifies if the nodes run federated Lloyd steps from the global centers, sending \
+        the statistics of their clusters, instead of fitting their own k-means (False by default, \
+        see: [LloydKMeansModel](../model/#lloydkmeansmodel-class)). The global centers are seeded with \
+        k-means++ over the data of a random node.
     """
 
-    def __init__(self, data_base_name_key, iid=True, num_nodes=20, percent=100):
+    def __init__(self, data_base_name_key, iid=True, num_nodes=20, percent=100, lloyd=False):
         if data_base_name_key in ClusteringDataBases.__members__.keys():
             module = ClusteringDataBases.__members__[data_base_name_key].value
             data_base = module()
@@ -45,10 +54,17 @@ class FederatedClustering(FederatedGovernment):
             federated_data, self._test_data, self._test_labels = distribution.get_federated_data(num_nodes=num_nodes,
                                                                                                  percent=percent)
 
-            aggregator = ClusterFedAvgAggregator()
+            self._lloyd = lloyd
+            if lloyd:
+                aggregator = FedAvgAggregator()
+            else:
+                aggregator = MatchedClusterFedAvgAggregator()
 
             super().__init__(self.model_builder, federated_data, aggregator)
 
+            if lloyd:
+                self.seed_centers()
+
         else:
             print("The data base name is not included. Try with: " + str(", ".join([e.name for e in ClusteringDataBases])))
             self._test_data = None
@@ -65,6 +81,7 @@ class FederatedClustering(FederatedGovernment):
         if self._test_data is not None:
             for i in range(0, n):
                 print("Accuracy round " + str(i))
+                self.select_clients()
                 self.deploy_central_model()
                 self.train_all_clients()
                 self.evaluate_clients(self._test_data, self._test_labels)
@@ -74,12 +91,27 @@ class FederatedClustering(FederatedGovernment):
         else:
             print("Federated images classifier is not properly initialised")
 
+    def seed_centers(self):
+        """
+        Seeds the global centers of federated Lloyd training with k-means++ over the data of a random node, \
+        followed by a Lloyd step over the same data.
+        """
+        data_node = self._federated_data[np.random.randint(self._federated_data.num_nodes())]
+        data_node.set_model(LloydKMeansModel(n_clusters=self._num_clusters, n_features=self._num_features,
+                                             init="k-means++"), ownership="transfer")
+        data_node.train_model()
+        self._model.set_model_params(data_node.query_model_params())
+
     def model_builder(self):
         """
         Build a KMeans model with the class params.
 
         # Returns:
-            model: KMeans model.
+            model: KMeans model, warm started from the global centers, or a LloydKMeansModel for federated \
+            Lloyd training.
         """
-        model = KMeansModel(n_clusters=self._num_clusters, n_features=self._num_features)
+        if self._lloyd:
+            return LloydKMeansModel(n_clusters=self._num_clusters, n_features=self._num_features)
+
+        model = KMeansModel(n_clusters=self._num_clusters, n_features=self._num_features, warm_start=True)
         return model
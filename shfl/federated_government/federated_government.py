@@ -1,3 +1,13 @@
+import copy
+import numpy as np
+from concurrent import futures
+
+from shfl.federated_government.training_executor import SerialTrainingExecutor
+from shfl.federated_government.evaluation_policy import FullEvaluationPolicy
+from shfl.federated_government.virtual_clock import VirtualClock
+from shfl.federated_government.virtual_clock import params_nbytes
+
+
 class FederatedGovernment:
     """
     Class used to represent the central class FederatedGoverment.
@@ -7,17 +17,57 @@ class FederatedGovernment:
        federated_data: Federated data to use. (see: [FederatedData](../private/federated_operation/#federateddata-class))
        aggregator: Federated aggregator function (see: [Federated Aggregator](../federated_aggregator))
        model_param_access: Policy to access model's parameters, by default non-protected (see: [DataAccessDefinition](../private/data/#dataaccessdefinition-class))
+       executor: Strategy used to train the clients, by default serial (see: [TrainingExecutor](./#trainingexecutor-class))
+       client_selector: Strategy choosing the clients of every round, by default all of them (see: [ClientSelector](./#clientselector-class))
+       deadline: Maximum simulated time of a round in seconds, by default no deadline. The simulated time of every \
+       client comes from its [DeviceProfile](../private/device_profile/#deviceprofile-class)
+       straggler_policy: What to do with the clients missing the deadline: "drop" them without training them, or \
+       "partial", adding them to the aggregator with their weight multiplied by the fraction of the round they \
+       completed (default "drop")
+       pipelined: Whether run_rounds evaluates every round in a background worker, over a snapshot of the params \
+       of the global model and the clients, while the next round is trained. The results are printed in order, \
+       once the next round has been trained (default False)
+       evaluation_policy: When and over which test data the models are evaluated, by default every round over the \
+       whole test data (see: [EvaluationPolicy](./#evaluationpolicy-class))
 
     # Properties:
         global_model: Return the global model.
+        clock: [VirtualClock](./#virtualclock-class) with the simulated time of the experiment
+        timing_reports: List with the timing report of every round trained. Every report is a dictionary with \
+        the round number, its start time, its duration, the number of selected clients, the number of stragglers \
+        and the simulated time of every selected client.
     """
 
-    def __init__(self, model_builder, federated_data, aggregator, model_params_access=None):
+    def __init__(self, model_builder, federated_data, aggregator, model_params_access=None, executor=None,
+                 client_selector=None, deadline=None, straggler_policy="drop", pipelined=False,
+                 evaluation_policy=None):
+        if executor is None:
+            executor = SerialTrainingExecutor()
+        if evaluation_policy is None:
+            evaluation_policy = FullEvaluationPolicy()
+        if straggler_policy not in ("drop", "partial"):
+            raise ValueError("Straggler policy must be 'drop' or 'partial'")
         self._federated_data = federated_data
+        self._selected_data = federated_data
+        self._aggregated_data = federated_data
+        self._completed_fractions = None
+        self._node_indices = None
+        self._client_selector = client_selector
+        self._deadline = deadline
+        self._straggler_policy = straggler_policy
+        self._clock = VirtualClock()
+        self._timing_reports = []
+        self._model_builder = model_builder
+        self._pipelined = pipelined
+        self._evaluation_policy = evaluation_policy
+        self._evaluation_model = None
+        self._evaluation_executor = None
+        self._pending_evaluation = None
         self._model = model_builder()
         self._aggregator = aggregator
+        self._executor = executor
         for data_node in federated_data:
-            data_node.model = model_builder()
+            data_node.set_model(model_builder(), ownership="transfer")
             if model_params_access is not None:
                 data_node.configure_model_params_access(model_params_access)
 
@@ -25,6 +75,14 @@ class FederatedGovernment:
     def global_model(self):
         return self._model
 
+    @property
+    def clock(self):
+        return self._clock
+
+    @property
+    def timing_reports(self):
+        return self._timing_reports
+
     def evaluate_global_model(self, data_test, label_test):
         """
         Evaluation of the performance of the global model.
@@ -33,53 +91,159 @@ class FederatedGovernment:
             test_data: test dataset
             test_label: corresponding labels to test dataset
         """
+        data_test, label_test = self._evaluation_policy.global_test_data(data_test, label_test)
         evaluation = self._model.evaluate(data_test, label_test)
         print("Global model test performance : " + str(evaluation))
 
+    def select_clients(self):
+        """
+        Chooses the clients taking part in the next round using the client selector. The following calls to \
+        deploy_central_model, train_all_clients, evaluate_clients and aggregate_weights only use those clients.
+        """
+        if self._client_selector is not None:
+            selected = self._client_selector.select(self._federated_data, self._model)
+            self._selected_data = self._federated_data.select(selected)
+        self._aggregated_data = self._selected_data
+        self._completed_fractions = None
+
     def deploy_central_model(self):
         """
-        Deployment of the global learning model to each client (node) in the simulation.
+        Deployment of the global learning model to each selected client (node) in the simulation.
         """
-        for data_node in self._federated_data:
-            data_node.set_model_params(self._model.get_model_params())
+        for data_node in self._selected_data:
+            data_node.set_model_params(self._model.get_model_params(), ownership="shared")
 
     def evaluate_clients(self, data_test, label_test):
         """
-        Evaluation of local learning models over global test dataset.
+        Evaluation of the local learning models trained in the round over global test dataset. When the clients \
+        share the test data and hold models of the same class, they are evaluated together (see: \
+        [FederatedData](../private/federated_operation/#federateddata-class)).
 
         # Arguments:
             test_data: test dataset
             test_label: corresponding labels to test dataset
         """
-        for data_node in self._federated_data:
-            # Predict local model in test
-            evaluation, local_evaluation = data_node.evaluate(data_test, label_test)
+        test_data = self._evaluation_policy.client_test_data(data_test, label_test,
+                                                             self._aggregated_data.num_nodes())
+        # Predict local models in test, all of them at once if they share the test data
+        if test_data and all(data is test_data[0][0] and label is test_data[0][1] for data, label in test_data):
+            evaluations = self._aggregated_data.evaluate(*test_data[0])
+        else:
+            evaluations = [data_node.evaluate(data, label)
+                           for data_node, (data, label) in zip(self._aggregated_data, test_data)]
+
+        for line in self._clients_report(self._aggregated_data, evaluations, test_data):
+            print(line)
+
+    def _clients_report(self, data_nodes, evaluations, test_data):
+        """
+        Lines reporting the evaluation of the clients, with their combination if the evaluation policy \
+        combines them.
+
+        # Arguments:
+            data_nodes: Evaluated data nodes
+            evaluations: Tuple with the evaluation over the test data and the local evaluation of every node
+            test_data: Test data and labels of every node
+
+        # Returns:
+            lines: Lines of the report
+        """
+        lines = []
+        for data_node, (evaluation, local_evaluation) in zip(data_nodes, evaluations):
             if local_evaluation is not None:
-                print("Performance client " + str(data_node) + ": Global test: " + str(evaluation)
-                     + ", Local test: " + str(local_evaluation))
+                lines.append("Performance client " + str(data_node) + ": Global test: " + str(evaluation)
+                             + ", Local test: " + str(local_evaluation))
             else:
-                print("Test performance client " + str(data_node) + ": " + str(evaluation))
+                lines.append("Test performance client " + str(data_node) + ": " + str(evaluation))
+
+        if evaluations:
+            combined = self._evaluation_policy.combine([evaluation for evaluation, _ in evaluations], test_data)
+            if combined is not None:
+                lines.append("Combined clients test performance : " + str(combined))
+
+        return lines
 
     def train_all_clients(self):
         """
-        Train all the clients
+        Train all the selected clients using the configured executor.
+
+        The simulated time of every client is computed and the virtual clock advances by the duration of the \
+        round, limited by the deadline. Clients missing the deadline are handled according to the straggler policy.
         """
-        for data_node in self._federated_data:
-            data_node.train_model()
+        num_bytes = params_nbytes(self._model.get_model_params())
+        node_times = np.array([data_node.simulated_time(num_bytes) for data_node in self._selected_data], dtype=float)
+        stragglers = np.zeros(len(node_times), dtype=bool)
+        duration = node_times.max(initial=0)
+
+        if self._deadline is not None:
+            stragglers = node_times > self._deadline
+            duration = min(duration, self._deadline)
+            if self._straggler_policy == "drop":
+                self._aggregated_data = self._selected_data.select(np.flatnonzero(~stragglers))
+            else:
+                self._completed_fractions = np.ones(len(node_times))
+                self._completed_fractions[stragglers] = self._deadline / node_times[stragglers]
+
+        self._executor.train(self._aggregated_data)
+
+        self._timing_reports.append({"round": len(self._timing_reports),
+                                     "start": self._clock.now,
+                                     "duration": duration,
+                                     "num_selected": len(node_times),
+                                     "num_stragglers": int(stragglers.sum()),
+                                     "node_times": node_times})
+        self._clock.advance(duration)
 
     def aggregate_weights(self):
         """
-        Aggregate weights from all data nodes in the server model
+        Aggregate weights from all the selected data nodes in the server model. The parameters of every node are added to \
+        the aggregator as they are queried, so they are not all held at the same time, with the weight of the node. Clients dropped for missing \
+        the deadline are not aggregated, and if there are no clients left the global model is not changed.
         """
-        weights = []
-        for data_node in self._federated_data:
-            weights.append(data_node.query_model_params())
+        if self._aggregated_data.num_nodes() == 0:
+            return
+
+        weights = self._client_weights()
+        if self._completed_fractions is not None:
+            weights = [weight * completed_fraction
+                       for weight, completed_fraction in zip(weights, self._completed_fractions)]
+
+        self._aggregator.begin()
+        for data_node, weight in zip(self._aggregated_data, weights):
+            self._aggregator.add(data_node.query_model_params(), weight)
 
-        aggregated_weights = self._aggregator.aggregate_weights(weights)
+        aggregated_weights = self._aggregator.finalize()
 
         # Update server weights
         self._model.set_model_params(aggregated_weights)
 
+    def _client_weights(self):
+        """
+        Weight of every aggregated client, the weight the aggregator gives to the data node by its index in the \
+        federated data, so it does not depend on the clients selected or dropped in the round \
+        (see: [FederatedAggregator](../federated_aggregator/#federatedaggregator-class)).
+
+        # Returns:
+            weights: List with the weight of every aggregated client
+        """
+        return [self._aggregator.client_weight(self._node_index(data_node)) for data_node in self._aggregated_data]
+
+    def _node_index(self, data_node):
+        """
+        Index of a data node in the federated data. The indices are cached, and computed again when a node is \
+        not found, for instance if nodes were added to the federated data.
+
+        # Arguments:
+            data_node: Data node of the federated data
+
+        # Returns:
+            index: Index of the data node
+        """
+        if self._node_indices is None or id(data_node) not in self._node_indices:
+            self._node_indices = {id(node): index for index, node in enumerate(self._federated_data)}
+
+        return self._node_indices[id(data_node)]
+
     def run_rounds(self, n, test_data, test_label):
         """
         Run one more round beginning in the actual state testing in test data and federated_local_test.
@@ -90,11 +254,94 @@ class FederatedGovernment:
             test_label: Test label for evaluation between rounds
 
         """
+        if self._pipelined:
+            self._run_pipelined_rounds(n, test_data, test_label)
+            return
+
         for i in range(0, n):
             print("Accuracy round " + str(i))
+            self.select_clients()
             self.deploy_central_model()
             self.train_all_clients()
-            self.evaluate_clients(test_data, test_label)
+            evaluates = self._evaluation_policy.evaluates(i)
+            if evaluates:
+                self.evaluate_clients(test_data, test_label)
             self.aggregate_weights()
-            self.evaluate_global_model(test_data, test_label)
+            if evaluates:
+                self.evaluate_global_model(test_data, test_label)
             print("\n\n")
+
+    def _run_pipelined_rounds(self, n, test_data, test_label):
+        """
+        Runs the rounds evaluating each of them in the background while the next one is trained. At most one \
+        evaluation is pending, so at most one snapshot of the clients is held at the same time. The evaluation \
+        worker is shut down once the rounds finish, even if they fail.
+        """
+        try:
+            for i in range(0, n):
+                self.select_clients()
+                self.deploy_central_model()
+                self.train_all_clients()
+                self.aggregate_weights()
+                if self._evaluation_policy.evaluates(i):
+                    self._print_pending_evaluation()
+                    self._pending_evaluation = self._submit_evaluation(i, test_data, test_label)
+
+            self._print_pending_evaluation()
+        finally:
+            self._pending_evaluation = None
+            if self._evaluation_executor is not None:
+                self._evaluation_executor.shutdown()
+                self._evaluation_executor = None
+
+    def _submit_evaluation(self, round_number, test_data, test_label):
+        """
+        Takes a snapshot of the params of the global model and the clients aggregated in the round and \
+        evaluates it in the evaluation worker.
+
+        # Returns:
+            future: concurrent.futures.Future whose result is the list of lines of the evaluation report
+        """
+        if self._evaluation_executor is None:
+            self._evaluation_executor = futures.ThreadPoolExecutor(max_workers=1)
+        if self._evaluation_model is None:
+            self._evaluation_model = self._model_builder()
+
+        clients = [(data_node, data_node.snapshot_model_params()) for data_node in self._aggregated_data]
+        global_params = copy.deepcopy(self._model.get_model_params())
+
+        return self._evaluation_executor.submit(self._evaluate_snapshot, round_number, clients, global_params,
+                                                test_data, test_label)
+
+    def _evaluate_snapshot(self, round_number, clients, global_params, test_data, test_label):
+        """
+        Evaluates the snapshot of a round with the evaluation model, as evaluate_clients and \
+        evaluate_global_model do.
+
+        # Returns:
+            lines: Lines of the evaluation report
+        """
+        clients_test_data = self._evaluation_policy.client_test_data(test_data, test_label, len(clients))
+        evaluations = [data_node.evaluate_snapshot(model_params, self._evaluation_model, data, label)
+                       for (data_node, model_params), (data, label) in zip(clients, clients_test_data)]
+        lines = ["Accuracy round " + str(round_number)]
+        lines.extend(self._clients_report([data_node for data_node, _ in clients], evaluations, clients_test_data))
+
+        self._evaluation_model.set_model_params(global_params)
+        evaluation = self._evaluation_model.evaluate(*self._evaluation_policy.global_test_data(test_data, test_label))
+        lines.append("Global model test performance : " + str(evaluation))
+        lines.append("\n\n")
+
+        return lines
+
+    def _print_pending_evaluation(self):
+        """
+        Waits for the pending evaluation, if any, and prints its report.
+        """
+        if self._pending_evaluation is None:
+            return
+
+        lines = self._pending_evaluation.result()
+        self._pending_evaluation = None
+        for line in lines:
+            print(line)
@@ -84,6 +84,7 @@ class FederatedImagesClassifier(FederatedGovernment):
                                                            self._test_data.shape[1], self._test_data.shape[2], 1))
             for i in range(0, n):
                 print("Accuracy round " + str(i))
+                self.select_clients()
                 self.deploy_central_model()
                 self.train_all_clients()
                 self.evaluate_clients(self._test_data, self._test_labels)
@@ -115,6 +116,7 @@ class FederatedImagesClassifier(FederatedGovernment):
         model.add(tf.keras.layers.Dense(64, activation='relu'))
         model.add(tf.keras.layers.Dense(10, activation='softmax'))
 
-        model.compile(optimizer="rmsprop", loss="categorical_crossentropy", metrics=["accuracy"])
+        metrics = ["accuracy"]
+        model.compile(optimizer="rmsprop", loss="categorical_crossentropy", metrics=metrics)
 
-        return DeepLearningModel(model)
+        return DeepLearningModel(model, metrics=metrics)
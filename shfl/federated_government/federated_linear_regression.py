@@ -1,8 +1,11 @@
 from shfl.federated_government.federated_government import FederatedGovernment
 from shfl.data_distribution.data_distribution_iid import IidDataDistribution
 from shfl.federated_aggregator.fedavg_aggregator import FedAvgAggregator
+from shfl.federated_aggregator.sufficient_statistics_aggregator import SufficientStatisticsAggregator
 from shfl.model.linear_regression_model import LinearRegressionModel
 from shfl.data_base.california_housing import CaliforniaHousing
+from shfl.private.data import UnprotectedAccess
+from shfl.private.query import SufficientStatistics
 
 from enum import Enum
 
@@ -24,9 +27,17 @@ class FederatedLinearRegression(FederatedGovernment):
         iid: boolean which specifies if the distribution if IID (True) or non-IID (False) (True by default)
         num_nodes: number of clients.
         percent: percentage of the database to distribute among nodes.
+        sufficient_statistics: boolean which specifies if the nodes send the sufficient statistics of their data \
+        instead of their params, fitting the exact centralized solution in a single round (False by default, \
+        see: [SufficientStatisticsAggregator](../federated_aggregator/#sufficientstatisticsaggregator-class))
+        ridge: weight of the L2 regularization of the exact solution (0 by default)
+        data_access: policy used by the nodes to answer the sufficient statistics query, for instance a \
+        differentially private mechanism with a [SufficientStatistics](../private/query/#sufficientstatistics-class) \
+        query (by default non-protected)
     """
 
-    def __init__(self, data_base_name_key, num_nodes=20, percent=100):
+    def __init__(self, data_base_name_key, num_nodes=20, percent=100, sufficient_statistics=False, ridge=0,
+                 data_access=None):
         if data_base_name_key in LinearRegressionDataBases.__members__.keys():
             module = LinearRegressionDataBases.__members__[data_base_name_key].value
             data_base = module()
@@ -39,7 +50,14 @@ class FederatedLinearRegression(FederatedGovernment):
             federated_data, self._test_data, self._test_labels = distribution.get_federated_data(num_nodes=num_nodes,
                                                                                                  percent=percent)
 
-            aggregator = FedAvgAggregator()
+            self._sufficient_statistics = sufficient_statistics
+            if sufficient_statistics:
+                aggregator = SufficientStatisticsAggregator(ridge=ridge)
+                if data_access is None:
+                    data_access = UnprotectedAccess(query=SufficientStatistics())
+                federated_data.configure_data_access(data_access)
+            else:
+                aggregator = FedAvgAggregator()
 
             super().__init__(self.model_builder, federated_data, aggregator)
 
@@ -51,14 +69,20 @@ class FederatedLinearRegression(FederatedGovernment):
         """
         Overriding of the method of run_rounds of [FederatedGoverment](../federated_government/#federatedgovernment-class)).
 
-        Run one more round beginning in the actual state testing in test data and federated_local_test.
+        Run one more round beginning in the actual state testing in test data and federated_local_test. With \
+        sufficient statistics, the model is fitted in a single round instead.
 
         # Arguments:
             n: Number of rounds (2 by default)
         """
-        if self._test_data is not None:
+        if self._test_data is not None and self._sufficient_statistics:
+            print("Exact fit from sufficient statistics")
+            self.aggregate_statistics()
+            self.evaluate_global_model(self._test_data, self._test_labels)
+        elif self._test_data is not None:
             for i in range(0, n):
                 print("Accuracy round " + str(i))
+                self.select_clients()
                 self.deploy_central_model()
                 self.train_all_clients()
                 self.evaluate_clients(self._test_data, self._test_labels)
@@ -68,6 +92,17 @@ class FederatedLinearRegression(FederatedGovernment):
         else:
             print("Federated images classifier is not properly initialised")
 
+    def aggregate_statistics(self):
+        """
+        Queries the sufficient statistics of every node and sets in the global model the exact solution \
+        of all their data.
+        """
+        self._aggregator.begin()
+        for data_node in self._federated_data:
+            self._aggregator.add(data_node.query())
+
+        self._model.set_model_params(self._aggregator.finalize())
+
     def model_builder(self):
         """
         Create a Linear Regression Model.
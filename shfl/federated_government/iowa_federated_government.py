@@ -18,11 +18,17 @@ class IowaFederatedGovernment(FederatedGovernment):
         c: third argument of linguistic quantifier (default 0.8)
         y_b: fourth argument of linguistic quantifier (default 0.4)
         k: distance param of the dynamic version (default 3/4)
+        executor: Strategy used to train the clients, by default serial (see: [TrainingExecutor](./#trainingexecutor-class))
+        client_selector: Strategy choosing the clients of every round, by default all of them (see: [ClientSelector](./#clientselector-class))
+        deadline: Maximum simulated time of a round in seconds, by default no deadline (see: [FederatedGovernment](./#federatedgovernment-class))
+        straggler_policy: What to do with the clients missing the deadline, "drop" or "partial" (default "drop")
     """
 
     def __init__(self, model_builder, federated_data, model_params_access=None, dynamic=True, a=0,
-                 b=0.2, c=0.8, y_b=0.4, k=3/4):
-        super().__init__(model_builder, federated_data, IowaFederatedAggregator(), model_params_access)
+                 b=0.2, c=0.8, y_b=0.4, k=3/4, executor=None, client_selector=None, deadline=None,
+                 straggler_policy="drop"):
+        super().__init__(model_builder, federated_data, IowaFederatedAggregator(), model_params_access, executor,
+                         client_selector, deadline, straggler_policy)
 
         self._a = a
         self._b = b
@@ -33,7 +39,8 @@ class IowaFederatedGovernment(FederatedGovernment):
 
     def performance_clients(self, data_val, label_val):
         """
-        Evaluation of local learning models over global test dataset.
+        Evaluation of the local learning models trained in the round over global test dataset. Models of the \
+        same class are evaluated together (see: [FederatedData](../private/federated_operation/#federateddata-class)).
 
         # Arguments:
             val_data: validation dataset
@@ -42,13 +49,17 @@ class IowaFederatedGovernment(FederatedGovernment):
         # Returns:
             client_performance: Performance for each client.
         """
-        client_performance = []
-        for data_node in self._federated_data:
-            # Predict local model in test
-            local_performance = data_node.performance(data_val, label_val)
-            client_performance.append(local_performance)
+        return np.array(self._aggregated_data.performance(data_val, label_val))
 
-        return np.array(client_performance)
+    def _client_weights(self):
+        """
+        Weight of every aggregated client. The ponderation weights of the aggregator are computed over the \
+        performance of the aggregated clients, so they are taken in the same order.
+
+        # Returns:
+            weights: List with the weight of every aggregated client
+        """
+        return [self._aggregator.client_weight(position) for position in range(self._aggregated_data.num_nodes())]
 
     def run_rounds(self, n, test_data, test_label):
         """
@@ -76,6 +87,7 @@ class IowaFederatedGovernment(FederatedGovernment):
 
         for i in range(0, n):
             print("Accuracy round " + str(i))
+            self.select_clients()
             self.deploy_central_model()
             self.train_all_clients()
             self.evaluate_clients(test_data, test_label)
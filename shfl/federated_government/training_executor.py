@@ -0,0 +1,355 @@
+import abc
+import heapq
+import multiprocessing
+import os
+import traceback
+from concurrent import futures
+
+
+class TrainingExecutor(abc.ABC):
+    """
+    Interface defining how the local models of the data nodes are trained in every round of a
+    [FederatedGovernment](./#federatedgovernment-class).
+
+    Whatever the strategy, the trained parameters must end up in the same
+    [FederatedDataNode](../private/federated_operation/#federateddatanode-class) objects that were passed,
+    so the aggregation step sees exactly the same models as in a serial execution.
+    """
+
+    @abc.abstractmethod
+    def train(self, data_nodes):
+        """
+        Trains the model of every data node using its private data.
+
+        # Arguments:
+            data_nodes: Iterable of [FederatedDataNode](../private/federated_operation/#federateddatanode-class)
+        """
+
+    def submit(self, data_node):
+        """
+        Starts training the model of a single data node. By default the node is trained before returning.
+
+        # Arguments:
+            data_node: [FederatedDataNode](../private/federated_operation/#federateddatanode-class) to train
+
+        # Returns:
+            future: concurrent.futures.Future done once the trained parameters are in the data node
+        """
+        future = futures.Future()
+        try:
+            self.train([data_node])
+            future.set_result(None)
+        except Exception as error:
+            future.set_exception(error)
+
+        return future
+
+    def shutdown(self):
+        """
+        Releases the resources held by the executor. By default there is nothing to release.
+        """
+
+
+class SerialTrainingExecutor(TrainingExecutor):
+    """
+    Trains the data nodes one after another in the current process. This is the default behaviour of
+    [FederatedGovernment](./#federatedgovernment-class).
+
+    It implements [TrainingExecutor](./#trainingexecutor-class)
+    """
+
+    def train(self, data_nodes):
+        for data_node in data_nodes:
+            data_node.train_model()
+
+
+class ThreadPoolTrainingExecutor(TrainingExecutor):
+    """
+    Trains the data nodes concurrently using a pool of threads. The nodes are trained in place, so no data or \
+    model is copied.
+
+    It is intended for models whose training releases the GIL, as the scikit-learn based ones \
+    ([LinearRegressionModel](../model/#linearregressionmodel-class), \
+    [LogisticRegressionModel](../model/#logisticregressionmodel-class) and \
+    [KMeansModel](../model/#kmeansmodel-class)). Keras models share a global session state and must be trained \
+    with a [ProcessPoolTrainingExecutor](./#processpooltrainingexecutor-class) instead.
+
+    It implements [TrainingExecutor](./#trainingexecutor-class)
+
+    # Arguments:
+        max_workers: Maximum number of threads (default None, the choice of concurrent.futures)
+    """
+
+    def __init__(self, max_workers=None):
+        self._max_workers = max_workers
+        self._pool = None
+
+    def train(self, data_nodes):
+        if self._pool is None:
+            self._pool = futures.ThreadPoolExecutor(max_workers=self._max_workers)
+
+        pending = [self._pool.submit(data_node.train_model) for data_node in data_nodes]
+        for future in pending:
+            future.result()
+
+    def submit(self, data_node):
+        if self._pool is None:
+            self._pool = futures.ThreadPoolExecutor(max_workers=self._max_workers)
+
+        return self._pool.submit(data_node.train_model)
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+
+class ProcessPoolTrainingExecutor(TrainingExecutor):
+    """
+    Trains the data nodes concurrently in a pool of worker processes. Every node is sent to a worker, trained there \
+    and only its trained model parameters travel back to the original node.
+
+    Process isolation is required by [DeepLearningModel](../model/#deeplearningmodel-class) nodes, since \
+    Tensorflow models cannot be trained concurrently in the same process.
+
+    It implements [TrainingExecutor](./#trainingexecutor-class)
+
+    # Arguments:
+        max_workers: Maximum number of processes (default None, the number of CPUs)
+        mp_context: Multiprocessing context used to start the workers (default "spawn", as Tensorflow \
+        is not fork-safe)
+    """
+
+    def __init__(self, max_workers=None, mp_context=None):
+        if mp_context is None:
+            mp_context = multiprocessing.get_context("spawn")
+        self._max_workers = max_workers
+        self._mp_context = mp_context
+        self._pool = None
+
+    def train(self, data_nodes):
+        if self._pool is None:
+            self._pool = futures.ProcessPoolExecutor(max_workers=self._max_workers, mp_context=self._mp_context)
+
+        data_nodes = list(data_nodes)
+        pending = [self._pool.submit(_train_data_node, data_node) for data_node in data_nodes]
+        for data_node, future in zip(data_nodes, pending):
+            data_node.set_model_params(future.result(), ownership="transfer")
+
+    def submit(self, data_node):
+        if self._pool is None:
+            self._pool = futures.ProcessPoolExecutor(max_workers=self._max_workers, mp_context=self._mp_context)
+
+        trained = futures.Future()
+
+        def set_trained_params(future):
+            try:
+                data_node.set_model_params(future.result(), ownership="transfer")
+                trained.set_result(None)
+            except Exception as error:
+                trained.set_exception(error)
+
+        self._pool.submit(_train_data_node, data_node).add_done_callback(set_trained_params)
+
+        return trained
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+
+class PersistentProcessTrainingExecutor(TrainingExecutor):
+    """
+    Trains the data nodes in a persistent pool of worker processes where every data node is pinned to one worker \
+    for the whole experiment.
+
+    The first time a data node is trained, its private data and its model are sent to its worker, where they stay \
+    resident. From then on, in every round only the current model parameters of the node are sent to the worker \
+    and only the trained parameters are sent back to the original node.
+
+    Nodes are placed balancing the total number of samples held by each worker, assigning the biggest nodes \
+    first to the least loaded worker. Changes made to the private data of a node after its placement are not \
+    propagated to the workers; call shutdown to discard the resident copies.
+
+    It implements [TrainingExecutor](./#trainingexecutor-class)
+
+    # Arguments:
+        num_workers: Number of worker processes (default None, the number of CPUs)
+        mp_context: Multiprocessing context used to start the workers (default "spawn", as Tensorflow \
+        is not fork-safe)
+
+    # Properties:
+        placement: Dictionary mapping the id of every placed data node to the index of its worker
+    """
+
+    def __init__(self, num_workers=None, mp_context=None):
+        if num_workers is None:
+            num_workers = os.cpu_count()
+        if mp_context is None:
+            mp_context = multiprocessing.get_context("spawn")
+        self._num_workers = num_workers
+        self._mp_context = mp_context
+        self._workers = []
+        self._connections = []
+        self._worker_loads = []
+        self._placement = {}
+        self._data_nodes = {}
+
+    @property
+    def placement(self):
+        return self._placement
+
+    def train(self, data_nodes):
+        data_nodes = list(data_nodes)
+        if not self._workers:
+            self._start_workers()
+        self._place_data_nodes([data_node for data_node in data_nodes if id(data_node) not in self._placement])
+
+        params_per_worker = [[] for _ in range(self._num_workers)]
+        for data_node in data_nodes:
+            params_per_worker[self._placement[id(data_node)]].append((id(data_node),
+                                                                      data_node.trained_model_params()))
+
+        for connection, params in zip(self._connections, params_per_worker):
+            if params:
+                connection.send(("train", params))
+
+        busy_connections = [connection for connection, params in zip(self._connections, params_per_worker) if params]
+        for answer in self._receive_all(busy_connections):
+            for key, trained_params in answer:
+                self._data_nodes[key].set_model_params(trained_params, ownership="transfer")
+
+    def shutdown(self):
+        for connection in self._connections:
+            connection.send(("stop", None))
+        for worker in self._workers:
+            worker.join()
+        self._workers = []
+        self._connections = []
+        self._worker_loads = []
+        self._placement = {}
+        self._data_nodes = {}
+
+    def _start_workers(self):
+        """
+        Starts the worker processes
+        """
+        for _ in range(self._num_workers):
+            parent_connection, child_connection = self._mp_context.Pipe()
+            worker = self._mp_context.Process(target=_persistent_worker, args=(child_connection,), daemon=True)
+            worker.start()
+            child_connection.close()
+            self._workers.append(worker)
+            self._connections.append(parent_connection)
+        self._worker_loads = [0] * self._num_workers
+
+    def _place_data_nodes(self, data_nodes):
+        """
+        Pins every data node to the least loaded worker, biggest nodes first, and sends it to its worker.
+
+        # Arguments:
+            data_nodes: List of data nodes not placed yet
+        """
+        if not data_nodes:
+            return
+
+        sizes = [data_node.num_samples() for data_node in data_nodes]
+        placement = _balance_placement(sizes, self._worker_loads)
+
+        nodes_per_worker = [[] for _ in range(self._num_workers)]
+        for data_node, size, worker in zip(data_nodes, sizes, placement):
+            self._placement[id(data_node)] = worker
+            self._data_nodes[id(data_node)] = data_node
+            self._worker_loads[worker] += size
+            nodes_per_worker[worker].append((id(data_node), data_node))
+
+        for connection, nodes in zip(self._connections, nodes_per_worker):
+            if nodes:
+                connection.send(("load", nodes))
+        self._receive_all([connection for connection, nodes in zip(self._connections, nodes_per_worker) if nodes])
+
+    @staticmethod
+    def _receive_all(connections):
+        """
+        Receives the answer of every worker of a round. If any worker failed, its error is raised once all \
+        the answers have been received, so no answer is left in the pipes for the next round.
+
+        # Arguments:
+            connections: Connections of the workers with a pending answer
+
+        # Returns:
+            answers: List with the answer of every worker
+        """
+        replies = [connection.recv() for connection in connections]
+        errors = [answer for status, answer in replies if status == "error"]
+        if errors:
+            raise RuntimeError("Error in training worker:\n" + errors[0])
+        return [answer for _, answer in replies]
+
+
+def _balance_placement(sizes, worker_loads):
+    """
+    Assigns items to workers so that the total size held by each worker is balanced. Items are assigned from the \
+    biggest to the smallest to the worker with the lowest load.
+
+    # Arguments:
+        sizes: Size of every item to place
+        worker_loads: Current load of every worker
+
+    # Returns:
+        placement: List with the index of the worker assigned to every item
+    """
+    heap = [(load, worker) for worker, load in enumerate(worker_loads)]
+    heapq.heapify(heap)
+
+    placement = [0] * len(sizes)
+    for item in sorted(range(len(sizes)), key=lambda i: sizes[i], reverse=True):
+        load, worker = heapq.heappop(heap)
+        placement[item] = worker
+        heapq.heappush(heap, (load + sizes[item], worker))
+
+    return placement
+
+
+def _persistent_worker(connection):
+    """
+    Main loop of the worker processes of [PersistentProcessTrainingExecutor](./#persistentprocesstrainingexecutor-class). \
+    Data nodes stay resident in the worker between rounds.
+
+    # Arguments:
+        connection: Connection used to communicate with the main process
+    """
+    data_nodes = {}
+    while True:
+        command, payload = connection.recv()
+        if command == "stop":
+            break
+        try:
+            if command == "load":
+                data_nodes.update(payload)
+                answer = None
+            else:
+                answer = []
+                for key, params in payload:
+                    data_node = data_nodes[key]
+                    data_node.set_model_params(params, ownership="transfer")
+                    answer.append((key, _train_data_node(data_node)))
+            connection.send(("ok", answer))
+        except Exception:
+            connection.send(("error", traceback.format_exc()))
+    connection.close()
+
+
+def _train_data_node(data_node):
+    """
+    Trains a data node in a worker process.
+
+    # Arguments:
+        data_node: [FederatedDataNode](../private/federated_operation/#federateddatanode-class) to train
+
+    # Returns:
+        params: Parameters of the trained local model
+    """
+    data_node.train_model()
+    return data_node.trained_model_params()
@@ -0,0 +1,335 @@
+import numpy as np
+
+from shfl.model.linear_regression_model import LinearRegressionModel
+from shfl.model.logistic_regression_model import LogisticRegressionModel
+
+
+class VectorizedFederatedGovernment:
+    """
+    Class used to simulate many clients training a [LinearRegressionModel](../model/#linearregressionmodel-class) \
+    or a [LogisticRegressionModel](../model/#logisticregressionmodel-class) without a data node per client.
+
+    The data of all the clients is held in padded arrays, one row per client, and the local training of all of \
+    them runs at once with numpy. The params of every client are then added to the aggregator, as \
+    [FederatedGovernment](./#federatedgovernment-class) does, so any \
+    [FederatedAggregator](../federated_aggregator/#federatedaggregator-class) can be used.
+
+    By default every client fits its model exactly, as the scikit-learn models do: least squares for linear \
+    regression and the L2 regularized maximum likelihood, solved with Newton's method, for logistic regression. \
+    The results match those of the data nodes. With local_epochs, every client instead runs that many epochs of \
+    full-batch gradient descent from the global model, minimizing the mean of the same losses.
+
+    The exact logistic solver holds a Hessian of size (classes x features) ^ 2 for every client, so models with \
+    many classes and features should use gradient descent.
+
+    # Arguments:
+        model_builder: Function that returns a LinearRegressionModel or a LogisticRegressionModel. Logistic \
+        regression models must use the default L2 penalty and fit the intercept, and not use partial_fit
+        data: Array of shape (n_samples, n_features) with the data of all the clients, sorted by client
+        labels: Array with the labels of all the clients, sorted by client
+        sizes: Number of samples of every client
+        aggregator: Federated aggregator function (see: [Federated Aggregator](../federated_aggregator))
+        local_epochs: Number of epochs of gradient descent of every round (default None, exact fit)
+        learning_rate: Learning rate of gradient descent (default 0.1)
+
+    # Properties:
+        global_model: Return the global model.
+        clients_params: Array with the params of the model of every client, of shape \
+        (n_clients, n_outputs, n_features + 1)
+    """
+
+    def __init__(self, model_builder, data, labels, sizes, aggregator, local_epochs=None, learning_rate=0.1):
+        self._model = model_builder()
+        self._aggregator = aggregator
+        self._local_epochs = local_epochs
+        self._learning_rate = learning_rate
+
+        sizes = np.asarray(sizes, dtype=int)
+        if sizes.sum() != len(data) or len(data) != len(labels):
+            raise ValueError("The sizes of the clients do not match the number of samples")
+
+        self._logistic = isinstance(self._model, LogisticRegressionModel)
+        if self._logistic:
+            if self._model.C is None or self._model.penalty != "l2" or not self._model.fit_intercept:
+                raise ValueError("Only logistic regression with L2 penalty and intercept is supported")
+            self._inverse_c = 1 / self._model.C
+            targets = self._encode_classes(labels, sizes)
+        elif isinstance(self._model, LinearRegressionModel):
+            targets = np.asarray(labels, dtype=float).reshape(len(labels), -1)
+        else:
+            raise ValueError("Only linear and logistic regression models can be vectorized")
+
+        global_params = self._model.get_model_params()
+        if np.asarray(data).reshape(len(data), -1).shape[1] + 1 != global_params.shape[1]:
+            raise AssertionError("Data need to have the same number of features described by the model")
+
+        self._sizes = sizes
+        self._data, self._mask = self._pad(np.column_stack((np.ones(len(data)), data)), sizes)
+        self._targets, _ = self._pad(targets, sizes)
+        self._clients_params = np.repeat(global_params[np.newaxis].astype(float), len(sizes), axis=0)
+
+    @classmethod
+    def from_federated_data(cls, model_builder, federated_data, aggregator, **kwargs):
+        """
+        Creates the simulation with the data of the nodes of some federated data, whose data access must \
+        allow to query their labeled data.
+
+        # Arguments:
+            model_builder: Function that returns a LinearRegressionModel or a LogisticRegressionModel
+            federated_data: Federated data to use. (see: [FederatedData](../private/federated_operation/#federateddata-class))
+            aggregator: Federated aggregator function (see: [Federated Aggregator](../federated_aggregator))
+            kwargs: Other arguments of the simulation
+
+        # Returns:
+            government: VectorizedFederatedGovernment with a client per data node
+        """
+        labeled_data = federated_data.query()
+        data = np.concatenate([node_data.data for node_data in labeled_data])
+        labels = np.concatenate([node_data.label for node_data in labeled_data])
+        sizes = [len(node_data.label) for node_data in labeled_data]
+
+        return cls(model_builder, data, labels, sizes, aggregator, **kwargs)
+
+    @property
+    def global_model(self):
+        return self._model
+
+    @property
+    def clients_params(self):
+        return self._clients_params
+
+    def deploy_central_model(self):
+        """
+        Deployment of the global learning model to every client.
+        """
+        self._clients_params[:] = self._model.get_model_params()
+
+    def train_all_clients(self):
+        """
+        Trains the models of all the clients at once.
+        """
+        if self._local_epochs is None:
+            if self._logistic:
+                self._clients_params = self._newton()
+            else:
+                self._clients_params = self._least_squares()
+        else:
+            for _ in range(self._local_epochs):
+                self._clients_params -= self._learning_rate * self._gradient(self._clients_params)
+
+    def aggregate_weights(self):
+        """
+        Aggregate the params of all the clients in the global model, adding them to the aggregator one by one.
+        """
+        self._aggregator.begin()
+        for client_params in self._clients_params:
+            self._aggregator.add(client_params)
+
+        self._model.set_model_params(self._aggregator.finalize())
+
+    def evaluate_global_model(self, data_test, label_test):
+        """
+        Evaluation of the performance of the global model.
+
+        # Arguments:
+            data_test: test dataset
+            label_test: corresponding labels to test dataset
+        """
+        evaluation = self._model.evaluate(data_test, label_test)
+        print("Global model test performance : " + str(evaluation))
+
+    def run_rounds(self, n, test_data, test_label):
+        """
+        Run one more round beginning in the actual state testing in test data.
+
+        # Arguments:
+            n: Number of rounds
+            test_data: Test data for evaluation between rounds
+            test_label: Test label for evaluation between rounds
+        """
+        for i in range(0, n):
+            print("Accuracy round " + str(i))
+            self.deploy_central_model()
+            self.train_all_clients()
+            self.aggregate_weights()
+            self.evaluate_global_model(test_data, test_label)
+            print("\n\n")
+
+    def _encode_classes(self, labels, sizes):
+        """
+        Encodes the labels of logistic regression as the targets of every output of the model.
+
+        # Returns:
+            targets: Array of shape (n_samples, n_outputs) with 1 for the class of every sample
+        """
+        classes = self._model.classes
+        indices = np.searchsorted(classes, np.asarray(labels))
+        offsets = np.concatenate(([0], np.cumsum(sizes)))
+        counts = np.add.reduceat(np.eye(len(classes))[indices], offsets[:-1], axis=0) if len(indices) else []
+        if np.any(sizes == 0) or np.any(np.asarray(counts) == 0):
+            raise AssertionError("The labels of every client need to have all the classes described by the model, "
+                                 + str(classes))
+
+        if len(classes) == 2:
+            return indices[:, np.newaxis].astype(float)
+        return np.eye(len(classes))[indices]
+
+    @staticmethod
+    def _pad(array, sizes):
+        """
+        Arranges the rows of the clients in an array with a row per client, padded with zeros.
+
+        # Returns:
+            padded: Array of shape (n_clients, max_size, ...) with the rows of every client
+            mask: Array of shape (n_clients, max_size) with 1 in the rows holding samples
+        """
+        clients = np.repeat(np.arange(len(sizes)), sizes)
+        positions = np.arange(len(array)) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+        padded = np.zeros((len(sizes), sizes.max(initial=0)) + array.shape[1:])
+        padded[clients, positions] = array
+        mask = np.zeros(padded.shape[:2])
+        mask[clients, positions] = 1
+
+        return padded, mask
+
+    def _predictions(self, params, clients=slice(None)):
+        """
+        Predictions of some clients over their own data: the linear output for linear regression and the \
+        probabilities of every output for logistic regression.
+
+        # Arguments:
+            params: Array with the params of the clients
+            clients: Indices of the clients (default all the clients)
+
+        # Returns:
+            predictions: Array of shape (n_clients, max_size, n_outputs)
+        """
+        scores = np.matmul(self._data[clients], params.transpose(0, 2, 1))
+        if not self._logistic:
+            return scores
+        if scores.shape[2] == 1:
+            return 1 / (1 + np.exp(-scores))
+
+        scores = np.exp(scores - scores.max(axis=2, keepdims=True))
+        return scores / scores.sum(axis=2, keepdims=True)
+
+    def _gradient(self, params, clients=slice(None)):
+        """
+        Gradient of the mean loss of some clients.
+
+        # Arguments:
+            params: Array with the params of the clients
+            clients: Indices of the clients (default all the clients)
+
+        # Returns:
+            gradient: Array with the shape of the params
+        """
+        residuals = (self._predictions(params, clients) - self._targets[clients]) * \
+            self._mask[clients][:, :, np.newaxis]
+        gradient = np.matmul(residuals.transpose(0, 2, 1), self._data[clients])
+        if self._logistic:
+            gradient[:, :, 1:] += self._inverse_c * params[:, :, 1:]
+
+        return gradient / np.maximum(self._sizes[clients], 1)[:, np.newaxis, np.newaxis]
+
+    def _least_squares(self):
+        """
+        Least squares fit of every client, solving its normal equations.
+        """
+        masked_data = self._data * self._mask[:, :, np.newaxis]
+        gram = np.matmul(masked_data.transpose(0, 2, 1), self._data)
+        moments = np.matmul(masked_data.transpose(0, 2, 1), self._targets)
+
+        return np.matmul(np.linalg.pinv(gram, hermitian=True), moments).transpose(0, 2, 1)
+
+    def _loss(self, params, clients=slice(None)):
+        """
+        L2 regularized logistic loss of some clients over their own data, summed over their samples.
+
+        # Arguments:
+            params: Array with the params of the clients
+            clients: Indices of the clients (default all the clients)
+
+        # Returns:
+            loss: Array with the loss of every client
+        """
+        scores = np.matmul(self._data[clients], params.transpose(0, 2, 1))
+        targets = self._targets[clients]
+        if scores.shape[2] == 1:
+            losses = np.logaddexp(0, scores) - targets * scores
+        else:
+            max_scores = scores.max(axis=2, keepdims=True)
+            log_normalizer = max_scores + np.log(np.exp(scores - max_scores).sum(axis=2, keepdims=True))
+            losses = targets * (log_normalizer - scores)
+
+        return (losses.sum(axis=2) * self._mask[clients]).sum(axis=1) + \
+            0.5 * self._inverse_c * (params[:, :, 1:] ** 2).sum(axis=(1, 2))
+
+    def _newton_step(self, params, gradient, clients):
+        """
+        Newton step of some clients, solving their Hessian against the gradient of their summed loss.
+        """
+        num_clients, num_outputs, num_params = params.shape
+        data = self._data[clients]
+        probabilities = self._predictions(params, clients)
+        if num_outputs == 1:
+            curvature = (probabilities * (1 - probabilities))[:, :, :, np.newaxis]
+        else:
+            curvature = probabilities[:, :, :, np.newaxis] * \
+                (np.eye(num_outputs) - probabilities[:, :, np.newaxis, :])
+        curvature = curvature * self._mask[clients][:, :, np.newaxis, np.newaxis]
+
+        weighted_data = curvature[:, :, :, :, np.newaxis] * data[:, :, np.newaxis, np.newaxis, :]
+        hessian = np.matmul(data.transpose(0, 2, 1), weighted_data.reshape(num_clients, data.shape[1], -1))
+        hessian = hessian.reshape(num_clients, num_params, num_outputs, num_outputs, num_params)
+        hessian = hessian.transpose(0, 2, 1, 3, 4).reshape(num_clients, num_outputs * num_params, -1)
+        hessian += np.diag(np.tile(np.r_[0, np.full(num_params - 1, self._inverse_c)], num_outputs))
+
+        gradient = gradient.reshape(num_clients, -1, 1)
+        if num_outputs == 1:
+            return np.linalg.solve(hessian, gradient).reshape(params.shape)
+        return np.matmul(np.linalg.pinv(hessian, hermitian=True), gradient).reshape(params.shape)
+
+    def _newton(self, max_iter=100, tol=1e-4, max_halvings=30):
+        """
+        Fit of every client minimizing the L2 regularized logistic loss with Newton's method, starting from zero \
+        as scikit-learn does. The Hessian of multinomial models is singular along the intercepts, where the \
+        pseudo-inverse keeps the intercepts summing zero.
+
+        As in scikit-learn, a client converges when the largest absolute value of the gradient of its mean loss \
+        is below tol. It then takes a last Newton step, which refines its params quadratically, and it is not \
+        updated any more, so the iterations only cost as much as the clients still training. The step of a \
+        client is halved while its loss increases beyond round-off, so weakly regularized clients do not \
+        overshoot, and a client whose loss cannot decrease stops.
+        """
+        params = np.zeros_like(self._clients_params)
+        loss = self._loss(params)
+        active = np.arange(len(params))
+
+        for _ in range(max_iter):
+            if len(active) == 0:
+                break
+            gradient = self._gradient(params[active], active)
+            converged = np.abs(gradient).max(axis=(1, 2)) < tol
+            gradient *= np.maximum(self._sizes[active], 1)[:, np.newaxis, np.newaxis]
+            step = self._newton_step(params[active], gradient, active)
+            candidate = params[active] - step
+            candidate_loss = self._loss(candidate, active)
+            tolerance = 100 * np.finfo(float).eps * np.maximum(np.abs(loss[active]), 1)
+            increased = np.flatnonzero(candidate_loss - loss[active] > tolerance)
+            step_size = 1.
+            for _ in range(max_halvings):
+                if len(increased) == 0:
+                    break
+                step_size /= 2
+                candidate[increased] = params[active[increased]] - step_size * step[increased]
+                candidate_loss[increased] = self._loss(candidate[increased], active[increased])
+                increased = increased[candidate_loss[increased] - loss[active[increased]] > tolerance[increased]]
+
+            stuck = np.zeros(len(active), dtype=bool)
+            stuck[increased] = True
+            params[active[~stuck]] = candidate[~stuck]
+            loss[active[~stuck]] = candidate_loss[~stuck]
+            active = active[~(stuck | converged)]
+
+        return params
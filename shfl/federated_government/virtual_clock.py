@@ -0,0 +1,47 @@
+import numpy as np
+
+from shfl.model.param_vector import ParamVector
+
+
+class VirtualClock:
+    """
+    Clock measuring the simulated time of a federated experiment, which only moves forward when it is advanced.
+
+    # Properties:
+        now: Current simulated time in seconds
+    """
+
+    def __init__(self):
+        self._now = 0
+
+    @property
+    def now(self):
+        return self._now
+
+    def advance(self, seconds):
+        """
+        Moves the clock forward.
+
+        # Arguments:
+            seconds: Simulated time elapsed
+        """
+        self._now += seconds
+
+
+def params_nbytes(params):
+    """
+    Size in bytes of some model parameters, either an array, a list of arrays or a \
+    [ParamVector](../model/#paramvector-class).
+
+    # Arguments:
+        params: Model parameters
+
+    # Returns:
+        num_bytes: Size in bytes of the parameters
+    """
+    if isinstance(params, ParamVector):
+        return params.buffer.nbytes
+    if isinstance(params, (list, tuple)) or (isinstance(params, np.ndarray) and params.dtype == object):
+        return sum(params_nbytes(layer) for layer in params)
+
+    return np.asarray(params).nbytes
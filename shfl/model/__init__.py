@@ -5,5 +5,7 @@ from __future__ import print_function
 from shfl.model.deep_learning_model import DeepLearningModel
 from shfl.model.model import TrainableModel
 from shfl.model.kmeans_model import KMeansModel
+from shfl.model.kmeans_model import LloydKMeansModel
 from shfl.model.linear_regression_model import LinearRegressionModel
 from shfl.model.logistic_regression_model import LogisticRegressionModel
+from shfl.model.param_vector import ParamVector
@@ -1,5 +1,7 @@
 from tensorflow.keras.callbacks import EarlyStopping
 from shfl.model.model import TrainableModel
+from shfl.model.param_vector import ParamVector
+import numpy as np
 import tensorflow as tf
 import copy
 
@@ -13,9 +15,12 @@ class DeepLearningModel(TrainableModel):
         batch_size: batch_size to apply
         epochs: Number of epochs
         initialized: Indicates whether the model is initialized or not (default False)
+        metrics: List of the metrics the model was compiled with, used to compile the copies of the model \
+        (default None, no metrics)
     """
-    def __init__(self, model, batch_size=None, epochs=1):
+    def __init__(self, model, batch_size=None, epochs=1, metrics=None):
         self._model = model
+        self._metrics = [] if metrics is None else list(metrics)
         self._data_shape = model.layers[0].get_input_shape_at(0)[1:]
         self._labels_shape = model.layers[-1].get_output_shape_at(0)[1:]
 
@@ -34,8 +39,17 @@ class DeepLearningModel(TrainableModel):
         self._check_labels(labels)
 
         early_stopping = EarlyStopping(monitor='val_loss', patience=5, verbose=0, mode='min')
-        self._model.fit(x=data, y=labels, batch_size=self._batch_size, epochs=self._epochs, validation_split=0.2,
-                        verbose=0, shuffle=False, callbacks=[early_stopping])
+        if isinstance(data, np.memmap):
+            # Read memory-mapped data batch by batch, keeping the last 20% of the samples for validation
+            split = int(len(data) * 0.8)
+            batch_size = self._batch_size if self._batch_size is not None else 32
+            train_batches = BatchSequence(data, labels, batch_size, 0, split)
+            validation_batches = BatchSequence(data, labels, batch_size, split, len(data))
+            self._model.fit(x=train_batches, epochs=self._epochs, validation_data=validation_batches,
+                            verbose=0, shuffle=False, callbacks=[early_stopping])
+        else:
+            self._model.fit(x=data, y=labels, batch_size=self._batch_size, epochs=self._epochs, validation_split=0.2,
+                            verbose=0, shuffle=False, callbacks=[early_stopping])
 
     def predict(self, data):
         """
@@ -97,8 +111,10 @@ class DeepLearningModel(TrainableModel):
         Implementation of abstract method of class [TrainableModel](../model/#trainablemodel-class)
 
         # Arguments:
-            params: array with the model weights
+            params: array with the model weights, or a [ParamVector](../model/#paramvector-class)
         """
+        if isinstance(params, ParamVector):
+            params = params.to_params()
         self._model.set_weights(params)
 
     def _check_data(self, data):
@@ -128,10 +144,82 @@ class DeepLearningModel(TrainableModel):
             if k == "_model":
                 model = tf.keras.models.clone_model(v)
                 model.compile(optimizer=v.optimizer.__class__.__name__, loss=v.loss,
-                              metrics=v.compiled_metrics._user_metrics)
+                              metrics=self._deserialize_metrics(self._serialize_metrics(self._metrics)))
 
                 model.set_weights(v.get_weights())
                 setattr(result, k, model)
+            elif k == "_metrics":
+                setattr(result, k, self._deserialize_metrics(self._serialize_metrics(v)))
             else:
                 setattr(result, k, copy.deepcopy(v, memo))
         return result
+
+    def __getstate__(self):
+        """
+        Overwrite pickling of the model so it can be sent to worker processes
+        """
+        state = self.__dict__.copy()
+        model = state.pop("_model")
+        state["_metrics"] = self._serialize_metrics(self._metrics)
+        state["_model_config"] = {"json": model.to_json(),
+                                  "weights": model.get_weights(),
+                                  "optimizer": tf.keras.optimizers.serialize(model.optimizer),
+                                  "loss": model.loss}
+        return state
+
+    def __setstate__(self, state):
+        """
+        Rebuild the compiled model from its pickled state
+        """
+        state = state.copy()
+        model_config = state.pop("_model_config")
+        state["_metrics"] = self._deserialize_metrics(state["_metrics"])
+        model = tf.keras.models.model_from_json(model_config["json"])
+        model.compile(optimizer=tf.keras.optimizers.deserialize(model_config["optimizer"]), loss=model_config["loss"],
+                      metrics=state["_metrics"])
+        model.set_weights(model_config["weights"])
+        state["_model"] = model
+        self.__dict__.update(state)
+
+    @staticmethod
+    def _serialize_metrics(metrics):
+        """
+        Serializes the Keras metric objects of a list of metrics, keeping metric names and functions as they are.
+        """
+        return [tf.keras.metrics.serialize(metric) if isinstance(metric, tf.keras.metrics.Metric) else metric
+                for metric in metrics]
+
+    @staticmethod
+    def _deserialize_metrics(metrics):
+        """
+        Builds new Keras metric objects from a list of metrics serialized with _serialize_metrics.
+        """
+        return [tf.keras.metrics.deserialize(metric) if isinstance(metric, dict) else metric for metric in metrics]
+
+
+class BatchSequence(tf.keras.utils.Sequence):
+    """
+    Keras Sequence reading a range of samples batch by batch, so only one batch is loaded in memory at a time. \
+    It is used to train with memory-mapped data (see: [MemmapStorage](../private/data_storage/#memmapstorage-class)).
+
+    # Arguments:
+        data: Indexable array with the data
+        labels: Indexable array with the labels
+        batch_size: Number of samples per batch
+        start: First sample of the range
+        stop: Last sample (excluded) of the range
+    """
+    def __init__(self, data, labels, batch_size, start, stop):
+        self._data = data
+        self._labels = labels
+        self._batch_size = batch_size
+        self._start = start
+        self._stop = stop
+
+    def __len__(self):
+        return int(np.ceil((self._stop - self._start) / self._batch_size))
+
+    def __getitem__(self, index):
+        batch_start = self._start + index * self._batch_size
+        batch_stop = min(batch_start + self._batch_size, self._stop)
+        return np.asarray(self._data[batch_start:batch_stop]), np.asarray(self._labels[batch_start:batch_stop])
@@ -1,26 +1,49 @@
 from shfl.model.model import TrainableModel
+from shfl.model.param_vector import ParamVector
 import numpy as np
 from sklearn.cluster import KMeans
+from sklearn.cluster import MiniBatchKMeans
+from sklearn.cluster import kmeans_plusplus
 from sklearn import metrics
+from sklearn.base import clone
 
 
 class KMeansModel(TrainableModel):
     """
     This class offers support for scikit-learn K-Means model. It implements [TrainableModel](../model/#trainablemodel-class)
 
+    With warm_start, once some centers have been set, such as those of the global model in a federated round, \
+    they are the single initialization of the next training (n_init=1), instead of running n_init seeds. \
+    With mini_batch, the model is a scikit-learn MiniBatchKMeans and every call to train runs a single pass \
+    of partial_fit over the data, in batches of batch_size rows, so the memory and time of training are bounded \
+    by the batch size rather than by the size of the data. The batches are contiguous rows, taken in random \
+    order, so the rows of the data should not be sorted, for instance by cluster. A last batch with fewer rows \
+    than clusters is merged into the previous one.
+
     # Arguments:
         n_clusters: number of clusters.
         init: Method of initialization. {‘k-means++’, ‘random’, ndarray}, default=’k-means++’.
             If an ndarray is passed, it should be of shape (n_clusters, n_features) and gives the initial centers.
             When ‘random’: choose n_clusters observations  (rows) at random from data for the initial centroids.
         n_init: Number of time the k-means algorithm will be run with different centroid seeds (default 10).
+        warm_start: boolean indicating if training starts from the current centers, if they are set (default False)
+        mini_batch: boolean indicating if the model is trained with mini-batches, a pass every time (default False)
+        batch_size: number of rows of every mini-batch (default 1024)
     """
 
-    def __init__(self, n_clusters, n_features, init='k-means++', n_init=10):
-        self._k_means = KMeans(n_clusters=n_clusters, init=init, n_init=n_init)
+    def __init__(self, n_clusters, n_features, init='k-means++', n_init=10, warm_start=False, mini_batch=False,
+                 batch_size=1024):
+        if mini_batch:
+            self._k_means = MiniBatchKMeans(n_clusters=n_clusters, init=init, n_init=n_init, batch_size=batch_size)
+        else:
+            self._k_means = KMeans(n_clusters=n_clusters, init=init, n_init=n_init)
         self._init = init
+        self._n_clusters = n_clusters
         self._n_features = n_features
         self._n_init = n_init
+        self._warm_start = warm_start
+        self._mini_batch = mini_batch
+        self._batch_size = batch_size
 
         if type(init) is np.ndarray:
             self._k_means.cluster_centers_ = init
@@ -35,7 +58,22 @@ class KMeansModel(TrainableModel):
             data: Data, array-like of shape (n_samples, n_features)
             labels: None.
         """
-        self._k_means.fit(data)
+        if self._warm_start and np.any(self._k_means.cluster_centers_):
+            self._k_means.set_params(init=np.array(self._k_means.cluster_centers_), n_init=1)
+
+        if self._mini_batch:
+            # Fitted attributes are removed, so the first batch initializes the model as fit does
+            self._k_means = clone(self._k_means)
+            # Contiguous batches, slices of the data, taken in random order
+            starts = np.arange(0, len(data), self._batch_size)
+            ends = np.append(starts[1:], len(data))
+            if len(starts) > 1 and ends[-1] - starts[-1] < self._n_clusters:
+                # A tail smaller than the clusters can't initialize them, so it joins the previous batch
+                starts, ends = starts[:-1], np.append(ends[:-2], len(data))
+            for batch in np.random.permutation(len(starts)):
+                self._k_means.partial_fit(data[starts[batch]:ends[batch]])
+        else:
+            self._k_means.fit(data)
 
     def predict(self, data):
         """
@@ -108,10 +146,128 @@ class KMeansModel(TrainableModel):
         Implementation of abstract method of class [TrainableModel](../model/#trainablemodel-class)
 
         # Arguments:
-            params: representation of model params to assign
+            params: representation of model params to assign, or a [ParamVector](../model/#paramvector-class)
         """
+        if isinstance(params, ParamVector):
+            params = params.to_params()
         if np.array_equal(params, np.zeros((params.shape[0], params.shape[1]))):
             self.__init__(n_clusters=params.shape[0], n_features=self._n_features, init=self._init,
-                          n_init=self._n_init)
+                          n_init=self._n_init, warm_start=self._warm_start, mini_batch=self._mini_batch,
+                          batch_size=self._batch_size)
         else:
-            self.__init__(n_clusters=params.shape[0], n_features=self._n_features, init=params, n_init=self._n_init)
+            self.__init__(n_clusters=params.shape[0], n_features=self._n_features, init=params, n_init=self._n_init,
+                          warm_start=self._warm_start, mini_batch=self._mini_batch, batch_size=self._batch_size)
+
+
+class LloydKMeansModel(KMeansModel):
+    """
+    This class offers a K-Means model trained with federated Lloyd steps. It implements \
+    [TrainableModel](../model/#trainablemodel-class) extending [KMeansModel](../model/#kmeansmodel-class).
+
+    The params of the model are the sufficient statistics of its clusters, an array of shape \
+    (n_clusters, n_features + 1) with the sum of the points of every cluster followed by their number, and \
+    the centers are their ratio. Training assigns every point to the current centers and replaces the params \
+    with the statistics of the assignment, a single pass over the data. Averaging the params of several models \
+    with [FedAvgAggregator](../federated_aggregator/#fedavgaggregator-class) keeps the ratio of the total sums \
+    and counts. When all the models start from the same centers, the new global centers are exactly those of a \
+    centralized Lloyd step over all the data.
+
+    The server must therefore seed the global centers and deploy them before the first training, as \
+    [FederatedClustering](../federated_government/#federatedclustering-class) does, since centers seeded by every \
+    node over its own data would give unrelated clusters the same index. Training a model without centers \
+    raises an error, unless it is built to seed them itself with k-means++.
+
+    Clusters without points keep their previous center.
+
+    # Arguments:
+        n_clusters: number of clusters.
+        n_features: number of features.
+        init: Initial centers, array of shape (n_clusters, n_features), or "k-means++" to seed the centers \
+            with k-means++ over the data of the first call to train. If None, the centers must be set with \
+            set_model_params before training (default None).
+    """
+
+    def __init__(self, n_clusters, n_features, init=None):
+        seeded = init is not None and not isinstance(init, str)
+        if isinstance(init, str) and init != "k-means++":
+            raise ValueError("The initial centers must be an array, 'k-means++' or None")
+        super().__init__(n_clusters, n_features, init=init if seeded else "k-means++", n_init=1)
+        self._local_seeding = isinstance(init, str)
+        self._statistics = np.zeros((n_clusters, n_features + 1))
+        if seeded:
+            self._statistics = np.column_stack((init, np.ones(n_clusters)))
+
+    def train(self, data, labels=None):
+        """
+        Implementation of abstract method of class [TrainableModel](../model/#trainablemodel-class)
+
+        Runs the assignment step of Lloyd's algorithm from the current centers, which must be set unless the \
+        model seeds them with k-means++.
+
+        # Arguments
+            data: Data, array-like of shape (n_samples, n_features)
+            labels: None.
+        """
+        data = np.asarray(data, dtype=float)
+        centers = self._k_means.cluster_centers_
+        if not self._statistics[:, -1].any():
+            if not self._local_seeding:
+                raise ValueError("The centers of the model are not set. Seed the global centers and deploy them "
+                                 "before training, so the clusters of every node match")
+            centers, _ = kmeans_plusplus(data, n_clusters=len(centers))
+
+        assignment = self._assign(data, centers)
+        counts = np.bincount(assignment, minlength=len(centers))
+        sums = np.zeros_like(centers, dtype=float)
+        order = np.argsort(assignment, kind="stable")
+        clusters = np.flatnonzero(counts)
+        sums[clusters] = np.add.reduceat(data[order], (np.cumsum(counts) - counts)[clusters])
+
+        self._k_means.cluster_centers_ = centers
+        self.set_model_params(np.column_stack((sums, counts)))
+
+    def predict(self, data):
+        """
+        Implementation of abstract method of class [TrainableModel](../model/#trainablemodel-class)
+
+        # Arguments:
+            data: Data, array-like of shape (n_samples, n_features)
+
+        # Returns:
+            predicted_labels: array with the index of the closest center to every point.
+        """
+        return self._assign(np.asarray(data, dtype=float), self._k_means.cluster_centers_)
+
+    def get_model_params(self):
+        """
+        Implementation of abstract method of class [TrainableModel](../model/#trainablemodel-class)
+
+        # Returns:
+            statistics: array with the sum of the points of every cluster followed by their number.
+        """
+        return self._statistics
+
+    def set_model_params(self, params):
+        """
+        Implementation of abstract method of class [TrainableModel](../model/#trainablemodel-class)
+
+        # Arguments:
+            params: sufficient statistics of the clusters, or a [ParamVector](../model/#paramvector-class)
+        """
+        if isinstance(params, ParamVector):
+            params = params.to_params()
+        self._statistics = np.array(params, dtype=float)
+
+        centers = np.array(self._k_means.cluster_centers_, dtype=float)
+        non_empty = self._statistics[:, -1] > 0
+        centers[non_empty] = self._statistics[non_empty, :-1] / self._statistics[non_empty, -1:]
+        self._k_means.cluster_centers_ = centers
+
+    @staticmethod
+    def _assign(data, centers):
+        """
+        Index of the closest center to every point.
+        """
+        distances = (centers ** 2).sum(axis=1) - 2 * data @ centers.T
+
+        return distances.argmin(axis=1)
@@ -1,4 +1,5 @@
 from shfl.model.model import TrainableModel
+from shfl.model.param_vector import ParamVector
 import numpy as np
 from sklearn.linear_model import LinearRegression
 from sklearn import metrics
@@ -92,6 +93,104 @@ class LinearRegressionModel(TrainableModel):
 
         return -rmse
 
+    @classmethod
+    def evaluate_many(cls, models, data, labels):
+        """
+        Evaluates several linear regression models at once. Their params are stacked, so the predictions of \
+        all of them come from a single matrix product and the metrics are computed over all of them together.
+
+        # Arguments:
+            models: List of LinearRegressionModel with the same number of features and targets
+            data: Data, array-like of shape (n_samples, n_features)
+            labels: Target, array-like of shape (n_samples,) or (n_samples, n_targets)
+
+        # Returns:
+            evaluations: List with the RMSE and R2 values of every model, as returned by evaluate
+        """
+        if not models:
+            return []
+
+        errors = cls._errors_many(models, data, labels)
+        squared_errors = (errors ** 2).sum(axis=1)
+        rmse = np.sqrt(squared_errors.mean(axis=1) / errors.shape[1])
+
+        labels = np.asarray(labels).reshape(len(labels), -1)
+        total_squares = ((labels - labels.mean(axis=0)) ** 2).sum(axis=0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            r2 = np.where(total_squares > 0, 1 - squared_errors / total_squares,
+                          np.where(squared_errors == 0, 1.0, 0.0))
+
+        return list(zip(rmse, r2.mean(axis=1)))
+
+    @classmethod
+    def performance_many(cls, models, data, labels):
+        """
+        Performance of several linear regression models at once, as in evaluate_many.
+
+        # Arguments:
+            models: List of LinearRegressionModel with the same number of features and targets
+            data: Data, array-like of shape (n_samples, n_features)
+            labels: Target, array-like of shape (n_samples,) or (n_samples, n_targets)
+
+        # Returns:
+            performances: List with the negative RMSE value of every model
+        """
+        if not models:
+            return []
+
+        errors = cls._errors_many(models, data, labels)
+
+        return list(-np.sqrt((errors ** 2).mean(axis=(1, 2))))
+
+    @classmethod
+    def performance_each(cls, models, data, labels):
+        """
+        Performance of several linear regression models, every one over its own data. The data of all the \
+        models is concatenated and every row is predicted with the params of its model in a single product.
+
+        # Arguments:
+            models: List of LinearRegressionModel with the same number of features and targets
+            data: List with the data of every model, array-like of shape (n_samples, n_features)
+            labels: List with the targets of every model, array-like of shape (n_samples,) or \
+            (n_samples, n_targets)
+
+        # Returns:
+            performances: List with the negative RMSE value of every model
+        """
+        if not models:
+            return []
+        for model_data, model_labels in zip(data, labels):
+            models[0]._check_data(model_data)
+            models[0]._check_labels(model_labels)
+
+        sizes = np.array([len(model_labels) for model_labels in labels])
+        rows_model = np.repeat(np.arange(len(models)), sizes)
+        params = np.stack([model.get_model_params() for model in models])[rows_model]
+        data = np.concatenate([np.asarray(model_data).reshape(len(model_data), -1) for model_data in data])
+        labels = np.concatenate([np.asarray(model_labels).reshape(len(model_labels), -1) for model_labels in labels])
+
+        errors = params[:, :, 0] + np.einsum("nf,ntf->nt", data, params[:, :, 1:]) - labels
+        squared_errors = np.bincount(rows_model, weights=(errors ** 2).sum(axis=1), minlength=len(models))
+
+        return list(-np.sqrt(squared_errors / (sizes * errors.shape[1])))
+
+    @staticmethod
+    def _errors_many(models, data, labels):
+        """
+        Prediction errors of several models over the same data.
+
+        # Returns:
+            errors: Array of shape (n_models, n_samples, n_targets)
+        """
+        models[0]._check_data(data)
+        models[0]._check_labels(labels)
+
+        params = np.stack([model.get_model_params() for model in models])
+        data = np.asarray(data).reshape(len(data), -1)
+        predictions = params[:, np.newaxis, :, 0] + np.matmul(data, params[:, :, 1:].transpose(0, 2, 1))
+
+        return predictions - np.asarray(labels).reshape(len(labels), -1)
+
     def get_model_params(self):
         """
         Implementation of abstract method of class [TrainableModel](../model/#trainablemodel-class)
@@ -111,8 +210,10 @@ class LinearRegressionModel(TrainableModel):
         Implementation of abstract method of class [TrainableModel](../model/#trainablemodel-class)
 
         # Arguments:
-            params: representation of model params to assign
+            params: representation of model params to assign, or a [ParamVector](../model/#paramvector-class)
         """
+        if isinstance(params, ParamVector):
+            params = params.to_params()
         if self._n_targets == 1:
             self._model.intercept_ = params[0][0]               
             self._model.coef_ = params[0][1:]
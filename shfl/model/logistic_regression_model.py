@@ -1,6 +1,10 @@
 from shfl.model.model import TrainableModel
+from shfl.model.param_vector import ParamVector
 import numpy as np
+import warnings
+from sklearn.exceptions import ConvergenceWarning
 from sklearn.linear_model import LogisticRegression
+from sklearn.linear_model import SGDClassifier
 from sklearn import metrics
 
 
@@ -8,16 +12,41 @@ class LogisticRegressionModel(TrainableModel):
     """
     This class offers support for scikit-learn logistic regression model. It implements [TrainableModel](../model/#trainablemodel-class)
 
+    By default every call to train fits the model from scratch, so the params set before, such as those of the \
+    global model in a federated round, are discarded. With warm_start, training resumes from the current params \
+    and the number of iterations of every call is bounded by max_iter in model_inputs, so every round does a \
+    bounded amount of work over the previous global model. Instead, with partial_fit, the model is a \
+    scikit-learn SGDClassifier with logistic loss and every call to train runs a single epoch of stochastic \
+    gradient descent from the current params.
+
     # Arguments:
         n_features: integer number of features (independent variables).
         classes: array of classes to predict. At least 2 classes must be provided.
-        model_inputs: optional dictionary containing the [model input parameters](https://scikit-learn.org/stable/modules/generated/sklearn.linear_model.LogisticRegression.html)
+        model_inputs: optional dictionary containing the [model input parameters](https://scikit-learn.org/stable/modules/generated/sklearn.linear_model.LogisticRegression.html), \
+        or those of [SGDClassifier](https://scikit-learn.org/stable/modules/generated/sklearn.linear_model.SGDClassifier.html) with partial_fit
+        warm_start: boolean indicating if training resumes from the current params (default False). \
+        It is not supported by the liblinear solver
+        partial_fit: boolean indicating if the model is trained with stochastic gradient descent, one epoch \
+        every time (default False)
+
+    # Properties:
+        classes: Sorted array with the classes of the model
+        penalty: Regularization term of the model, as in scikit-learn
+        C: Inverse of the regularization strength, None with partial_fit
+        fit_intercept: Whether the model fits an intercept
     """
-    def __init__(self, n_features, classes, model_inputs=None):
+    def __init__(self, n_features, classes, model_inputs=None, warm_start=False, partial_fit=False):
         if model_inputs is None:
             model_inputs = {}
         self._check_initialization(n_features, classes)
-        self._model = LogisticRegression(**model_inputs)
+        self._warm_start = warm_start
+        self._partial_fit = partial_fit
+        if partial_fit:
+            self._model = SGDClassifier(**dict({"loss": "log_loss"}, **model_inputs))
+        else:
+            if warm_start:
+                model_inputs = dict(model_inputs, warm_start=True)
+            self._model = LogisticRegression(**model_inputs)
         self._n_features = n_features
         classes = np.sort(np.asarray(classes))
         self._model.classes_ = classes
@@ -25,7 +54,23 @@ class LogisticRegressionModel(TrainableModel):
         if n_classes == 2:
             n_classes = 1
         self.set_model_params(np.zeros((n_classes, n_features + 1)))
-        
+
+    @property
+    def classes(self):
+        return self._model.classes_
+
+    @property
+    def penalty(self):
+        return self._model.penalty
+
+    @property
+    def C(self):
+        return None if self._partial_fit else self._model.C
+
+    @property
+    def fit_intercept(self):
+        return self._model.fit_intercept
+
     def train(self, data, labels):
         """
         Implementation of abstract method of class [TrainableModel](../model/#trainablemodel-class)
@@ -36,8 +81,16 @@ class LogisticRegressionModel(TrainableModel):
         """
         self._check_data(data)
         self._check_labels(labels)
-        
-        self._model.fit(data, labels)
+
+        if self._partial_fit:
+            self._model.partial_fit(data, labels)
+        elif self._warm_start:
+            # The iterations of every call are bounded on purpose, so they are not expected to converge
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", category=ConvergenceWarning)
+                self._model.fit(data, labels)
+        else:
+            self._model.fit(data, labels)
 
     def predict(self, data):
         """
@@ -86,6 +139,126 @@ class LogisticRegressionModel(TrainableModel):
         
         return bas
 
+    @classmethod
+    def evaluate_many(cls, models, data, labels):
+        """
+        Evaluates several logistic regression models at once. Their params are stacked, so the decision \
+        function of all of them comes from a single matrix product, and the metrics are computed from the \
+        confusion matrices of all of them together.
+
+        # Arguments:
+            models: List of LogisticRegressionModel with the same number of features and classes
+            data: Data, array-like of shape (n_samples, n_features)
+            labels: Target classes, array-like of shape (n_samples,)
+
+        # Returns:
+            evaluations: List with the balanced accuracy and Cohen's kappa of every model, as returned by evaluate
+        """
+        if not models:
+            return []
+
+        confusion = cls._confusion_many(models, data, labels)
+        num_samples = len(labels)
+        true_counts = confusion.sum(axis=2)
+        predicted_counts = confusion.sum(axis=1)
+        balanced_accuracy = (np.diagonal(confusion, axis1=1, axis2=2) / true_counts).mean(axis=1)
+
+        observed_agreement = np.trace(confusion, axis1=1, axis2=2)
+        expected_agreement = (true_counts * predicted_counts).sum(axis=1) / num_samples
+        with np.errstate(divide="ignore", invalid="ignore"):
+            kappa = 1 - (num_samples - observed_agreement) / (num_samples - expected_agreement)
+
+        return list(zip(balanced_accuracy, kappa))
+
+    @classmethod
+    def performance_many(cls, models, data, labels):
+        """
+        Performance of several logistic regression models at once, as in evaluate_many.
+
+        # Arguments:
+            models: List of LogisticRegressionModel with the same number of features and classes
+            data: Data, array-like of shape (n_samples, n_features)
+            labels: Target classes, array-like of shape (n_samples,)
+
+        # Returns:
+            performances: List with the balanced accuracy of every model
+        """
+        if not models:
+            return []
+
+        confusion = cls._confusion_many(models, data, labels)
+        recall = np.diagonal(confusion, axis1=1, axis2=2) / confusion.sum(axis=2)
+
+        return list(recall.mean(axis=1))
+
+    @classmethod
+    def performance_each(cls, models, data, labels):
+        """
+        Performance of several logistic regression models, every one over its own data. The data of all the \
+        models is concatenated, every row is scored with the params of its model in a single product and the \
+        confusion matrices of all the models are counted together.
+
+        # Arguments:
+            models: List of LogisticRegressionModel with the same number of features and classes
+            data: List with the data of every model, array-like of shape (n_samples, n_features)
+            labels: List with the target classes of every model, array-like of shape (n_samples,)
+
+        # Returns:
+            performances: List with the balanced accuracy of every model
+        """
+        if not models:
+            return []
+        for model_data, model_labels in zip(data, labels):
+            models[0]._check_data(model_data)
+            models[0]._check_labels(model_labels)
+
+        rows_model = np.repeat(np.arange(len(models)), [len(model_labels) for model_labels in labels])
+        params = np.stack([model.get_model_params() for model in models])[rows_model]
+        data = np.concatenate([np.asarray(model_data).reshape(len(model_data), -1) for model_data in data])
+        scores = params[:, :, 0] + np.einsum("nf,ncf->nc", data, params[:, :, 1:])
+        if scores.shape[1] == 1:
+            predicted = (scores[:, 0] > 0).astype(int)
+        else:
+            predicted = scores.argmax(axis=1)
+
+        classes = models[0].classes
+        num_models, num_classes = len(models), len(classes)
+        true = np.searchsorted(classes, np.concatenate([np.asarray(model_labels) for model_labels in labels]))
+        cells = (rows_model * num_classes + true) * num_classes + predicted
+        confusion = np.bincount(cells, minlength=num_models * num_classes ** 2).reshape(
+            num_models, num_classes, num_classes)
+
+        recall = np.diagonal(confusion, axis1=1, axis2=2) / confusion.sum(axis=2)
+
+        return list(recall.mean(axis=1))
+
+    @staticmethod
+    def _confusion_many(models, data, labels):
+        """
+        Confusion matrices of several models over the same data, rows being the true classes.
+
+        # Returns:
+            confusion: Array of shape (n_models, n_classes, n_classes)
+        """
+        models[0]._check_data(data)
+        models[0]._check_labels(labels)
+
+        params = np.stack([model.get_model_params() for model in models])
+        data = np.asarray(data).reshape(len(data), -1)
+        scores = params[:, np.newaxis, :, 0] + np.matmul(data, params[:, :, 1:].transpose(0, 2, 1))
+        if scores.shape[2] == 1:
+            predicted = (scores[:, :, 0] > 0).astype(int)
+        else:
+            predicted = scores.argmax(axis=2)
+
+        classes = models[0].classes
+        num_models, num_classes = len(models), len(classes)
+        true = np.searchsorted(classes, np.asarray(labels))
+        cells = (np.arange(num_models)[:, np.newaxis] * num_classes + true) * num_classes + predicted
+
+        return np.bincount(cells.ravel(), minlength=num_models * num_classes ** 2).reshape(
+            num_models, num_classes, num_classes)
+
     def get_model_params(self):
         """
         Implementation of abstract method of class [TrainableModel](../model/#trainablemodel-class)
@@ -97,8 +270,11 @@ class LogisticRegressionModel(TrainableModel):
         """
         Implementation of abstract method of class [TrainableModel](../model/#trainablemodel-class)
         """
-        self._model.intercept_ = params[:,0]
-        self._model.coef_ = params[:, 1:]
+        if isinstance(params, ParamVector):
+            params = params.to_params()
+        # Copied, since training from the current params may update them in place
+        self._model.intercept_ = np.array(params[:, 0])
+        self._model.coef_ = np.array(params[:, 1:])
 
     def _check_data(self, data):
         """
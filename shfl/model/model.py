@@ -66,4 +66,53 @@ class TrainableModel(abc.ABC):
         # Arguments:
             data: Data to be evaluated
             labels: True values of data
-        """
\ No newline at end of file
+        """
+
+    @classmethod
+    def evaluate_many(cls, models, data, labels):
+        """
+        Evaluates several models of this class over the same data. By default every model is evaluated on its \
+        own; models that can evaluate many instances at once, as the linear ones, override it.
+
+        # Arguments:
+            models: List of models of this class
+            data: Data to be evaluated
+            labels: True values of data
+
+        # Returns:
+            evaluations: List with the evaluate result of every model
+        """
+        return [model.evaluate(data, labels) for model in models]
+
+    @classmethod
+    def performance_many(cls, models, data, labels):
+        """
+        Performance of several models of this class over the same data, in terms of the most representative \
+        metric. By default every model is evaluated on its own.
+
+        # Arguments:
+            models: List of models of this class
+            data: Data to be evaluated
+            labels: True values of data
+
+        # Returns:
+            performances: List with the performance of every model
+        """
+        return [model.performance(data, labels) for model in models]
+
+    @classmethod
+    def performance_each(cls, models, data, labels):
+        """
+        Performance of several models of this class, every one over its own data, in terms of the most \
+        representative metric. By default every model is evaluated on its own.
+
+        # Arguments:
+            models: List of models of this class
+            data: List with the data to be evaluated by every model
+            labels: List with the true values of the data of every model
+
+        # Returns:
+            performances: List with the performance of every model
+        """
+        return [model.performance(model_data, model_labels)
+                for model, model_data, model_labels in zip(models, data, labels)]
@@ -0,0 +1,111 @@
+import numpy as np
+
+
+class ParamVector:
+    """
+    Representation of the params of a model as one contiguous buffer plus the layout of the arrays it holds.
+
+    The arrays of params (e.g. the layers of a [DeepLearningModel](../model/#deeplearningmodel-class)) are views \
+    of the buffer, so they are obtained without copying. Operations over the params of several models, like \
+    averaging them, become operations over whole buffers instead of loops over their arrays.
+
+    Params are not turned into a ParamVector automatically; it is built with from_params. The models of this \
+    package accept it in set_model_params, and FedAvgAggregator, WeightedFedAvgAggregator and the cluster \
+    aggregators can aggregate it.
+
+    # Arguments:
+        buffer: One dimensional array with all the params
+        shapes: List with the shape of every array of params, in the order they are stored in the buffer
+        is_list: Whether the params are a list of arrays or a single array (default True)
+    """
+
+    def __init__(self, buffer, shapes, is_list=True):
+        shapes = [tuple(shape) for shape in shapes]
+        if buffer.ndim != 1 or sum(int(np.prod(shape)) for shape in shapes) != buffer.size:
+            raise ValueError("The buffer does not match the shapes of the params")
+        if not is_list and len(shapes) != 1:
+            raise ValueError("Params that are not a list must have a single shape")
+
+        self._buffer = buffer
+        self._shapes = shapes
+        self._is_list = is_list
+
+    @classmethod
+    def from_params(cls, params, dtype=np.float32):
+        """
+        Copies some model params into a new ParamVector.
+
+        # Arguments:
+            params: Params as returned by get_model_params, either an array or a list of arrays
+            dtype: Type of the buffer (default float32)
+
+        # Returns:
+            param_vector: ParamVector holding the params
+        """
+        if isinstance(params, ParamVector):
+            return params.with_buffer(params.buffer.astype(dtype))
+
+        is_list = isinstance(params, (list, tuple)) or (isinstance(params, np.ndarray) and params.dtype == object)
+        arrays = [np.asarray(array) for array in params] if is_list else [np.asarray(params)]
+
+        buffer = np.empty(sum(array.size for array in arrays), dtype=dtype)
+        offset = 0
+        for array in arrays:
+            buffer[offset:offset + array.size] = array.ravel()
+            offset += array.size
+
+        return cls(buffer, [array.shape for array in arrays], is_list)
+
+    @property
+    def buffer(self):
+        return self._buffer
+
+    @property
+    def shapes(self):
+        return self._shapes
+
+    @property
+    def is_list(self):
+        return self._is_list
+
+    def layers(self):
+        """
+        Gets every array of params as a view of the buffer.
+
+        # Returns:
+            layers: List of arrays sharing memory with the buffer
+        """
+        layers = []
+        offset = 0
+        for shape in self._shapes:
+            size = int(np.prod(shape))
+            layers.append(self._buffer[offset:offset + size].reshape(shape))
+            offset += size
+
+        return layers
+
+    def to_params(self):
+        """
+        Gets the params with the structure expected by set_model_params, without copying them.
+
+        # Returns:
+            params: List of arrays or single array, sharing memory with the buffer
+        """
+        layers = self.layers()
+
+        return layers if self._is_list else layers[0]
+
+    def with_buffer(self, buffer):
+        """
+        Creates a ParamVector with the same layout and another buffer.
+
+        # Arguments:
+            buffer: One dimensional array with all the params
+
+        # Returns:
+            param_vector: ParamVector using the given buffer
+        """
+        return ParamVector(buffer, self._shapes, self._is_list)
+
+    def __len__(self):
+        return self._buffer.size
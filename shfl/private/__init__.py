@@ -13,8 +13,17 @@ from shfl.private.node import DataNode
 from shfl.private.query import Query
 from shfl.private.query import Mean
 from shfl.private.query import IdentityFunction
+from shfl.private.query import SufficientStatistics
 from shfl.private.reproducibility import Reproducibility
 from shfl.private.federated_attack import FederatedDataAttack
 from shfl.private.federated_attack import ShuffleNode
 from shfl.private.federated_attack import FederatedPoisoningDataAttack
 
+from shfl.private.data_storage import DataStorage
+from shfl.private.data_storage import LazyLabeledData
+from shfl.private.data_storage import SharedArray
+from shfl.private.data_storage import SharedLabeledData
+from shfl.private.data_storage import SharedMemoryStorage
+from shfl.private.data_storage import MemmapLabeledData
+from shfl.private.data_storage import MemmapStorage
+from shfl.private.device_profile import DeviceProfile
@@ -34,6 +34,9 @@ class LabeledData:
     def label(self, label):
         self._label = label
 
+    def __len__(self):
+        return len(self.data)
+
 
 class DataAccessDefinition(abc.ABC):
     """
@@ -142,6 +145,15 @@ class DPDataAccessDefinition(DataAccessDefinition):
 class UnprotectedAccess(DataAccessDefinition):
     """
     This class implements access to data without restrictions, plain data will be returned.
+
+    # Arguments:
+        query: Function to apply over private data (see: [Query](../query)). This parameter is optional and \
+            the data is returned as it is if it is not provided.
     """
+    def __init__(self, query=None):
+        self._query = query
+
     def apply(self, data):
-        return data
+        if self._query is None:
+            return data
+        return self._query.get(data)
@@ -0,0 +1,472 @@
+import abc
+import copy
+import multiprocessing
+import os
+import tempfile
+from multiprocessing import resource_tracker
+from multiprocessing import shared_memory
+import numpy as np
+
+from shfl.private.data import LabeledData
+
+_created_blocks = set()
+
+
+class DataStorage(abc.ABC):
+    """
+    Interface defining where the private data of the nodes of a [FederatedData](../federated_operation/#federateddata-class) \
+    is stored. By default, every node holds its own in-memory arrays. A DataStorage allows to keep the partitions \
+    of all the nodes in a common backing store, so the nodes only hold a reference to their partition.
+    """
+
+    @abc.abstractmethod
+    def store(self, federated_data, federated_label):
+        """
+        Stores the partitions of every node in the backing store.
+
+        # Arguments:
+            federated_data: List with the data of every node
+            federated_label: List with the labels of every node
+
+        # Returns:
+            nodes_data: List with a [LabeledData](../data/#labeleddata) per node backed by the store
+        """
+
+    def store_indices(self, data, labels, federated_indices):
+        """
+        Stores the partitions of every node, given as the indices of its samples in the original arrays.
+
+        By default the partitions are gathered and passed to store. Storages can override it to gather \
+        the samples directly into the backing store.
+
+        # Arguments:
+            data: Array with the original data
+            labels: Array with the original labels
+            federated_indices: List with the array of indices of every node
+
+        # Returns:
+            nodes_data: List with a [LabeledData](../data/#labeleddata) per node backed by the store
+        """
+        return self.store([data[indices] for indices in federated_indices],
+                          [labels[indices] for indices in federated_indices])
+
+
+class LazyLabeledData(LabeledData):
+    """
+    [LabeledData](../data/#labeleddata) defined by the indices of its samples in the original arrays.
+
+    The samples are gathered from the original arrays on first access, so nodes that are never accessed do not \
+    hold a copy of their data and nodes sampled with replacement reference the same original rows until they \
+    are used. The gathered arrays are private copies of the node, and once they are gathered the references \
+    to the original arrays are dropped, so the data of other nodes can not be reached through it. A \
+    [DataNode](../data_node/#datanode-class) gathers it before any query. Copying it does not gather the data, \
+    while pickling it only sends the samples of the node.
+
+    # Arguments:
+        source_data: Original data array
+        source_label: Original labels array
+        indices: Indices of the samples of the node in the original arrays
+
+    # Properties:
+        indices: Indices of the samples of the node
+    """
+
+    def __init__(self, source_data, source_label, indices):
+        super().__init__(None, None)
+        self._source_data = source_data
+        self._source_label = source_label
+        self._indices = indices
+
+    @property
+    def indices(self):
+        return self._indices
+
+    @property
+    def data(self):
+        self.gather()
+        return self._data
+
+    @data.setter
+    def data(self, data):
+        self._data = data
+
+    @property
+    def label(self):
+        self.gather()
+        return self._label
+
+    @label.setter
+    def label(self, label):
+        self._label = label
+
+    def gather(self):
+        """
+        Gathers the samples of the node from the original arrays, if they are not gathered yet, and drops the \
+        references to the original arrays.
+        """
+        if self._source_data is None:
+            return
+        if self._data is None:
+            self._data = self._source_data[self._indices]
+        if self._label is None:
+            self._label = self._source_label[self._indices]
+        self._source_data = None
+        self._source_label = None
+
+    def __len__(self):
+        return len(self._indices)
+
+    def __getstate__(self):
+        return {"_data": self.data, "_label": self.label, "_indices": np.arange(len(self._indices)),
+                "_source_data": None, "_source_label": None}
+
+    def __deepcopy__(self, memo):
+        result = self.__class__.__new__(self.__class__)
+        result.__dict__.update(self.__dict__)
+        result._data = copy.deepcopy(self._data, memo)
+        result._label = copy.deepcopy(self._label, memo)
+        return result
+
+
+class SharedArray:
+    """
+    Numpy array living in a block of shared memory (see: \
+    [multiprocessing.shared_memory](https://docs.python.org/3/library/multiprocessing.shared_memory.html)).
+
+    A SharedArray is pickled by the name of its block, so it can be sent to other processes, which attach \
+    to the same memory instead of receiving a copy of the array. Other processes can also attach to it \
+    using its name, shape and dtype.
+
+    # Arguments:
+        shape: Shape of the array
+        dtype: Data type of the array
+        name: Name of an existing block to attach to. If None, a new block is created (default None)
+
+    # Properties:
+        name: Name of the shared memory block
+        shape: Shape of the array
+        dtype: Data type of the array
+        array: Read-only numpy array backed by the shared memory block
+    """
+
+    def __init__(self, shape, dtype, name=None):
+        self._shape = tuple(shape)
+        self._dtype = np.dtype(dtype)
+        if name is None:
+            size = max(int(np.prod(self._shape)) * self._dtype.itemsize, 1)
+            self._shared_memory = shared_memory.SharedMemory(create=True, size=size)
+            _created_blocks.add(self._shared_memory.name)
+        else:
+            self._shared_memory = shared_memory.SharedMemory(name=name)
+            if name not in _created_blocks and multiprocessing.parent_process() is None:
+                # An independent process attaching must not unlink the block of its creator when it exits.
+                # Child processes share the resource tracker of their parent, so they keep the registration.
+                resource_tracker.unregister(self._shared_memory._name, "shared_memory")
+        self._array = np.ndarray(self._shape, dtype=self._dtype, buffer=self._shared_memory.buf)
+        self._array.flags.writeable = False
+
+    @classmethod
+    def from_indices(cls, array, federated_indices):
+        """
+        Creates a SharedArray with the rows of array selected by every array of indices, one after another. \
+        The rows are gathered directly into the shared memory block.
+
+        # Arguments:
+            array: Original array
+            federated_indices: List of arrays of indices of the rows of array
+
+        # Returns:
+            shared_array: SharedArray containing all the selected rows
+        """
+        array = np.asarray(array)
+        num_rows = sum(len(indices) for indices in federated_indices)
+        shared_array = cls((num_rows,) + array.shape[1:], array.dtype)
+
+        writable = shared_array.writable_array()
+        start = 0
+        for indices in federated_indices:
+            np.take(array, indices, axis=0, out=writable[start:start + len(indices)])
+            start += len(indices)
+
+        return shared_array
+
+    @classmethod
+    def from_partitions(cls, partitions):
+        """
+        Creates a SharedArray with the concatenation of the partitions along the first axis. Every partition \
+        is written directly into the shared memory block.
+
+        # Arguments:
+            partitions: List of arrays with the same shape except for the first dimension
+
+        # Returns:
+            shared_array: SharedArray containing all the partitions
+        """
+        partitions = [np.asarray(partition) for partition in partitions]
+        num_rows = sum(len(partition) for partition in partitions)
+        shared_array = cls((num_rows,) + partitions[0].shape[1:], np.result_type(*partitions))
+
+        writable = shared_array.writable_array()
+        start = 0
+        for partition in partitions:
+            writable[start:start + len(partition)] = partition
+            start += len(partition)
+
+        return shared_array
+
+    @property
+    def name(self):
+        return self._shared_memory.name
+
+    @property
+    def shape(self):
+        return self._shape
+
+    @property
+    def dtype(self):
+        return self._dtype
+
+    @property
+    def array(self):
+        return self._array
+
+    def writable_array(self):
+        """
+        # Returns:
+            array: Writable numpy array backed by the shared memory block
+        """
+        return np.ndarray(self._shape, dtype=self._dtype, buffer=self._shared_memory.buf)
+
+    def close(self):
+        """
+        Closes the access to the block from this instance. The block is not destroyed.
+        """
+        self._array = None
+        self._shared_memory.close()
+
+    def unlink(self):
+        """
+        Destroys the shared memory block. It must be called once, by its creator, when no process needs it anymore.
+        """
+        self._shared_memory.unlink()
+
+    def __reduce__(self):
+        return self.__class__, (self._shape, self._dtype, self.name)
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+class SharedLabeledData(LabeledData):
+    """
+    [LabeledData](../data/#labeleddata) whose data and labels are a range of rows of two \
+    [SharedArray](./#sharedarray-class).
+
+    The node only holds the shared arrays and the index range, so pickling or copying it does not copy the data. \
+    Data and labels are read-only views of the shared memory. Assigning new data or labels keeps them in the \
+    node (copy-on-write), without modifying the shared memory.
+
+    # Arguments:
+        shared_data: SharedArray with the data
+        shared_label: SharedArray with the labels
+        start: First row of the range
+        stop: Last row (excluded) of the range
+    """
+
+    def __init__(self, shared_data, shared_label, start, stop):
+        super().__init__(None, None)
+        self._shared_data = shared_data
+        self._shared_label = shared_label
+        self._start = start
+        self._stop = stop
+
+    @property
+    def data(self):
+        if self._data is not None:
+            return self._data
+        return self._shared_data.array[self._start:self._stop]
+
+    @data.setter
+    def data(self, data):
+        self._data = data
+
+    @property
+    def label(self):
+        if self._label is not None:
+            return self._label
+        return self._shared_label.array[self._start:self._stop]
+
+    @label.setter
+    def label(self, label):
+        self._label = label
+
+    def __deepcopy__(self, memo):
+        result = copy.copy(self)
+        result._data = copy.deepcopy(self._data, memo)
+        result._label = copy.deepcopy(self._label, memo)
+        return result
+
+
+class SharedMemoryStorage(DataStorage):
+    """
+    Storage where the partitions of all the nodes live in one shared memory block per array \
+    (see: [SharedArray](./#sharedarray-class)).
+
+    Nodes only hold an index range of the blocks, so worker processes can train them without pickling their data \
+    and several experiments on the same machine can share a single copy of the data.
+
+    It implements [DataStorage](./#datastorage-class)
+
+    # Properties:
+        shared_arrays: List of the SharedArray created by this storage
+    """
+
+    def __init__(self):
+        self._shared_arrays = []
+
+    @property
+    def shared_arrays(self):
+        return self._shared_arrays
+
+    def store(self, federated_data, federated_label):
+        shared_data = SharedArray.from_partitions(federated_data)
+        shared_label = SharedArray.from_partitions(federated_label)
+
+        return self._nodes_data(shared_data, shared_label, [len(node_data) for node_data in federated_data])
+
+    def store_indices(self, data, labels, federated_indices):
+        shared_data = SharedArray.from_indices(data, federated_indices)
+        shared_label = SharedArray.from_indices(labels, federated_indices)
+
+        return self._nodes_data(shared_data, shared_label, [len(indices) for indices in federated_indices])
+
+    def _nodes_data(self, shared_data, shared_label, sizes):
+        """
+        Creates the data of every node as consecutive ranges of the shared arrays.
+        """
+        self._shared_arrays.extend([shared_data, shared_label])
+
+        nodes_data = []
+        start = 0
+        for size in sizes:
+            nodes_data.append(SharedLabeledData(shared_data, shared_label, start, start + size))
+            start += size
+
+        return nodes_data
+
+    def unlink(self):
+        """
+        Destroys every shared memory block created by this storage. The memory is released once every node \
+        using it has been deleted.
+        """
+        for shared_array in self._shared_arrays:
+            shared_array.unlink()
+        self._shared_arrays = []
+
+
+class MemmapLabeledData(LabeledData):
+    """
+    [LabeledData](../data/#labeleddata) whose data and labels are stored in .npy files on disk.
+
+    The node only holds the paths of the files, which are opened as read-only memory maps \
+    (see: [numpy.load](https://numpy.org/doc/stable/reference/generated/numpy.load.html)) on first access, \
+    so the data is read from disk as it is used and never fully loaded in memory. Pickling or copying it \
+    only copies the paths. Assigning new data or labels keeps them in the node (copy-on-write), without \
+    modifying the files.
+
+    # Arguments:
+        data_path: Path of the .npy file with the data
+        label_path: Path of the .npy file with the labels
+    """
+
+    def __init__(self, data_path, label_path):
+        super().__init__(None, None)
+        self._data_path = data_path
+        self._label_path = label_path
+        self._data_memmap = None
+        self._label_memmap = None
+
+    @property
+    def data(self):
+        if self._data is not None:
+            return self._data
+        if self._data_memmap is None:
+            self._data_memmap = np.load(self._data_path, mmap_mode='r')
+        return self._data_memmap
+
+    @data.setter
+    def data(self, data):
+        self._data = data
+
+    @property
+    def label(self):
+        if self._label is not None:
+            return self._label
+        if self._label_memmap is None:
+            self._label_memmap = np.load(self._label_path, mmap_mode='r')
+        return self._label_memmap
+
+    @label.setter
+    def label(self, label):
+        self._label = label
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_data_memmap"] = None
+        state["_label_memmap"] = None
+        return state
+
+    def __deepcopy__(self, memo):
+        result = copy.copy(self)
+        result._data = copy.deepcopy(self._data, memo)
+        result._label = copy.deepcopy(self._label, memo)
+        return result
+
+
+class MemmapStorage(DataStorage):
+    """
+    Storage where the partition of every node is written to .npy files on disk and read through memory maps \
+    (see: [MemmapLabeledData](./#memmaplabeleddata-class)). It allows to simulate nodes whose data does not fit \
+    in memory. [DeepLearningModel](../../model/#deeplearningmodel-class) reads memory-mapped data batch by batch \
+    during training.
+
+    It implements [DataStorage](./#datastorage-class)
+
+    # Arguments:
+        directory: Directory where the files are written. If None, a new temporary directory is created \
+        (default None)
+
+    # Properties:
+        directory: Directory where the files are written
+    """
+
+    def __init__(self, directory=None):
+        if directory is None:
+            directory = tempfile.mkdtemp(prefix="shfl_")
+        os.makedirs(directory, exist_ok=True)
+        self._directory = directory
+        self._num_stored = 0
+
+    @property
+    def directory(self):
+        return self._directory
+
+    def store(self, federated_data, federated_label):
+        return [self._store_node(node_data, node_label)
+                for node_data, node_label in zip(federated_data, federated_label)]
+
+    def store_indices(self, data, labels, federated_indices):
+        # Only the partition of one node is gathered in memory at a time
+        return [self._store_node(data[indices], labels[indices]) for indices in federated_indices]
+
+    def _store_node(self, node_data, node_label):
+        """
+        Writes the data of a node to disk.
+        """
+        data_path = os.path.join(self._directory, "node_" + str(self._num_stored) + "_data.npy")
+        label_path = os.path.join(self._directory, "node_" + str(self._num_stored) + "_label.npy")
+        np.save(data_path, np.asarray(node_data))
+        np.save(label_path, np.asarray(node_label))
+        self._num_stored += 1
+
+        return MemmapLabeledData(data_path, label_path)
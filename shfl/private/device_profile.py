@@ -0,0 +1,53 @@
+class DeviceProfile:
+    """
+    Simulated hardware of a [FederatedDataNode](../federated_operation/#federateddatanode-class), used to estimate \
+    how long the node takes to train its model and to upload the trained parameters.
+
+    # Arguments:
+        compute_speed: Number of samples processed per second when training
+        bandwidth: Upload bandwidth in bytes per second
+        latency: Fixed time in seconds added to every upload (default 0)
+    """
+
+    def __init__(self, compute_speed, bandwidth, latency=0):
+        if compute_speed <= 0 or bandwidth <= 0:
+            raise ValueError("Compute speed and bandwidth must be positive")
+        self._compute_speed = compute_speed
+        self._bandwidth = bandwidth
+        self._latency = latency
+
+    @property
+    def compute_speed(self):
+        return self._compute_speed
+
+    @property
+    def bandwidth(self):
+        return self._bandwidth
+
+    @property
+    def latency(self):
+        return self._latency
+
+    def training_time(self, num_samples):
+        """
+        Simulated time to train over some samples.
+
+        # Arguments:
+            num_samples: Number of samples
+
+        # Returns:
+            seconds: Simulated time in seconds
+        """
+        return num_samples / self._compute_speed
+
+    def upload_time(self, num_bytes):
+        """
+        Simulated time to upload some bytes.
+
+        # Arguments:
+            num_bytes: Number of bytes
+
+        # Returns:
+            seconds: Simulated time in seconds
+        """
+        return self._latency + num_bytes / self._bandwidth
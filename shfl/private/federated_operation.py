@@ -1,6 +1,8 @@
 import abc
 from shfl.private.node import DataNode
 from shfl.private.data import LabeledData
+from shfl.differential_privacy.composition_dp import AdaptiveDifferentialPrivacy
+from shfl.differential_privacy.composition_dp import PrivacyBudgetLedger
 
 
 class FederatedDataNode(DataNode):
@@ -13,6 +15,10 @@ class FederatedDataNode(DataNode):
     # Arguments:
         federated_data_identifier: identifier to use in private data
 
+    # Properties:
+        device_profile: Simulated hardware of the node, None by default \
+        (see: [DeviceProfile](../device_profile/#deviceprofile-class))
+
     When you iterate over [FederatedData](./#federateddata-class) the kind of DataNode that you obtain is a \
     FederatedDataNode.
 
@@ -32,6 +38,18 @@ class FederatedDataNode(DataNode):
     def __init__(self, federated_data_identifier):
         super().__init__()
         self._federated_data_identifier = federated_data_identifier
+        self._device_profile = None
+
+    @property
+    def device_profile(self):
+        return self._device_profile
+
+    @device_profile.setter
+    def device_profile(self, device_profile):
+        """
+        Sets the simulated hardware of the node (see: [DeviceProfile](../device_profile/#deviceprofile-class))
+        """
+        self._device_profile = device_profile
 
     def query(self, private_property=None, **kwargs):
         """
@@ -44,34 +62,46 @@ class FederatedDataNode(DataNode):
             private_property = self._federated_data_identifier
         return super().query(private_property, **kwargs)
 
-    def configure_data_access(self, data_access_definition):
+    def configure_data_access(self, data_access_definition, ownership="copy"):
         """
         Adds a DataAccessDefinition for some concrete private data.
 
         # Arguments:
             data_access_definition: Policy to access data (see: [DataAccessDefinition](../data/#dataaccessdefinition-class))
+            ownership: "copy" or "transfer" (default "copy", see: [DataNode](../data_node))
+        """
+        super().configure_data_access(self._federated_data_identifier, data_access_definition, ownership)
+
+    def data_access_definition(self):
+        """
+        Returns the DataAccessDefinition configured over the private data of the node.
+
+        # Returns:
+            data_access_definition: The access policy of the private data, None if it is not configured
         """
-        super().configure_data_access(self._federated_data_identifier, data_access_definition)
+        return super().data_access_definition(self._federated_data_identifier)
 
-    def set_private_data(self, data):
+    def set_private_data(self, data, ownership="copy"):
         """
         Creates copy of data in private memory using name as key. If there is a previous value with this key the
         data will be overridden.
 
         # Arguments:
             data: Data to be stored in the private memory of the DataNode
+            ownership: "copy", "transfer" or "shared" (default "copy", see: [DataNode](../data_node))
         """
-        super().set_private_data(self._federated_data_identifier, data)
+        super().set_private_data(self._federated_data_identifier, data, ownership)
 
-    def set_private_test_data(self, data):
+    def set_private_test_data(self, data, ownership="copy"):
         """
         Creates copy of test data in private memory using name as key. If there is a previous value with this key the
         data will be override.
 
         # Arguments:
             data: Data to be stored in the private memory of the DataNode
+            ownership: "copy", "transfer" or "shared" (default "copy", see: [DataNode](../data_node))
         """
-        super().set_private_test_data(self._federated_data_identifier, data)
+        super().set_private_test_data(self._federated_data_identifier, data, ownership)
 
     def train_model(self):
         """
@@ -101,6 +131,135 @@ class FederatedDataNode(DataNode):
         """
         return super().evaluate(data, test), super().local_evaluate(self._federated_data_identifier)
 
+    @classmethod
+    def evaluate_many(cls, data_nodes, data, test):
+        """
+        Evaluates the models of several data nodes over the same data, as evaluate does for every node. Models \
+        of the same class are evaluated together (see: [DataNode](../node/#datanode-class)).
+
+        # Arguments:
+            data_nodes: List of [FederatedDataNode](./#federateddatanode-class)
+            data: Data to predict
+            test: True values of data
+
+        # Returns:
+            evaluations: List with the metrics over data and over the private test data of every node, \
+            as returned by evaluate
+        """
+        if cls._model_class(data_nodes) is None:
+            return [data_node.evaluate(data, test) for data_node in data_nodes]
+
+        evaluations = super().evaluate_many(data_nodes, data, test)
+
+        return [(evaluation, data_node.local_evaluate(data_node._federated_data_identifier))
+                for data_node, evaluation in zip(data_nodes, evaluations)]
+
+    def evaluate_snapshot(self, model_params, model, data, test):
+        """
+        Evaluates a snapshot of the parameters of the model of the node, as evaluate does, using another model so \
+        the model of the node can keep training meanwhile.
+
+        # Arguments:
+            model_params: Parameters taken with snapshot_model_params
+            model: Model with the same architecture as the model of the node, where the parameters are set
+            data: Data to predict
+            test: True values of data
+
+        # Returns:
+            metrics: array with metrics values for predictions for data argument.
+            local_metrics: array with metrics values over the private test data, None if the node has no test data
+        """
+        model.set_model_params(model_params)
+        labeled_data = self._private_test_data.get(self._federated_data_identifier)
+        local_evaluation = None
+        if labeled_data is not None:
+            local_evaluation = model.evaluate(labeled_data.data, labeled_data.label)
+
+        return model.evaluate(data, test), local_evaluation
+
+    def num_samples(self):
+        """
+        Number of samples in the private data of the node. This value is not protected, since it is needed \
+        to balance the workload between workers and to weight the contribution of the node.
+
+        # Returns:
+            num_samples: number of samples in the private data (0 if the node has no data)
+        """
+        labeled_data = self._private_data.get(self._federated_data_identifier)
+        if labeled_data is None:
+            return 0
+        return len(labeled_data)
+
+    def simulated_time(self, num_bytes):
+        """
+        Simulated time the node takes to train its model over its private data and to upload its parameters, \
+        according to its device profile.
+
+        # Arguments:
+            num_bytes: Size in bytes of the parameters uploaded
+
+        # Returns:
+            seconds: Simulated time in seconds, 0 if the node has no device profile
+        """
+        if self._device_profile is None:
+            return 0
+        return self._device_profile.training_time(self.num_samples()) + self._device_profile.upload_time(num_bytes)
+
+    def local_performance(self, max_samples=None):
+        """
+        Performance of the model of the node over its own private data, in terms of the most representative \
+        metric of the model (see: [TrainableModel](../../model/#trainablemodel-class)). Only the value of the \
+        metric leaves the node.
+
+        # Arguments:
+            max_samples: Maximum number of samples used, taken from the beginning of the private data \
+            (default None, all of them)
+
+        # Returns:
+            metric: value of the main metric, or None if the node has no data
+        """
+        labeled_data = self._private_data.get(self._federated_data_identifier)
+        if labeled_data is None or len(labeled_data) == 0:
+            return None
+
+        data = labeled_data.data[:max_samples]
+        label = labeled_data.label[:max_samples]
+
+        return self._model.performance(data, label)
+
+    @classmethod
+    def local_performance_many(cls, data_nodes, max_samples=None):
+        """
+        Performance of the models of several data nodes, every one over its own private data, as \
+        local_performance does for every node. When every node holds a model of the same class, they are \
+        evaluated together through the performance_each method of the class \
+        (see: [TrainableModel](../../model/#trainablemodel-class)), otherwise node by node.
+
+        # Arguments:
+            data_nodes: List of [FederatedDataNode](./#federateddatanode-class)
+            max_samples: Maximum number of samples of every node used (default None, all of them)
+
+        # Returns:
+            performances: List with the value of the main metric of every node, None for nodes without data
+        """
+        model_class = cls._model_class(data_nodes)
+        if model_class is None:
+            return [data_node.local_performance(max_samples) for data_node in data_nodes]
+
+        labeled_data = [data_node._private_data.get(data_node._federated_data_identifier)
+                        for data_node in data_nodes]
+        with_data = [index for index, node_data in enumerate(labeled_data)
+                     if node_data is not None and len(node_data) > 0]
+        performances = [None] * len(data_nodes)
+        node_performances = model_class.performance_each(
+            [data_nodes[index]._model for index in with_data],
+            [labeled_data[index].data[:max_samples] for index in with_data],
+            [labeled_data[index].label[:max_samples] for index in with_data])
+        for index, performance in zip(with_data, node_performances):
+            performances[index] = performance
+
+        return performances
+
     def split_train_test(self, test_split=0.2):
         """
         Splits private_data in train and test sets
@@ -115,8 +274,8 @@ class FederatedDataNode(DataNode):
         test_data = labeled_data.data[:int(test_split * length)]
         test_label = labeled_data.label[:int(test_split * length)]
 
-        self.set_private_data(LabeledData(train_data, train_label))
-        self.set_private_test_data(LabeledData(test_data, test_label))
+        self.set_private_data(LabeledData(train_data, train_label), ownership="transfer")
+        self.set_private_test_data(LabeledData(test_data, test_label), ownership="transfer")
 
 
 class FederatedData:
@@ -135,15 +294,16 @@ class FederatedData:
     def __iter__(self):
         return iter(self._data_nodes)
 
-    def add_data_node(self, data):
+    def add_data_node(self, data, ownership="copy"):
         """
         This method adds a new node containing data to the federated data
 
         # Arguments:
             data: Data to add to this node
+            ownership: "copy", "transfer" or "shared" (default "copy", see: [DataNode](../data_node))
         """
         node = FederatedDataNode(str(id(self)))
-        node.set_private_data(data)
+        node.set_private_data(data, ownership)
         self._data_nodes.append(node)
 
     def num_nodes(self):
@@ -153,29 +313,120 @@ class FederatedData:
         """
         return len(self._data_nodes)
 
+    def select(self, indices):
+        """
+        Creates a view of some of the data nodes. The view holds the same node objects, so nothing is copied \
+        and changes made through the view are seen in this federated data.
+
+        # Arguments:
+            indices: Indices of the data nodes to include
+
+        # Returns:
+            federated_data: FederatedData with the selected data nodes
+        """
+        federated_data = FederatedData()
+        federated_data._data_nodes = [self._data_nodes[index] for index in indices]
+
+        return federated_data
+
+    def evaluate(self, data, test):
+        """
+        Evaluates the models of all the data nodes over the same data. When every node holds a model of the \
+        same class, they are evaluated together through the evaluate_many method of the class \
+        (see: [TrainableModel](../../model/#trainablemodel-class)), otherwise node by node.
+
+        # Arguments:
+            data: Data to predict
+            test: True values of data
+
+        # Returns:
+            evaluations: List with the metrics over data and over the private test data of every node, \
+            as returned by [FederatedDataNode](./#federateddatanode-class) evaluate
+        """
+        return FederatedDataNode.evaluate_many(self._data_nodes, data, test)
+
+    def performance(self, data, test):
+        """
+        Performance of the models of all the data nodes over the same data, in terms of the most representative \
+        metric. As in evaluate, models of the same class are evaluated together.
+
+        # Arguments:
+            data: Data to predict
+            test: True values of data
+
+        # Returns:
+            performances: List with the main metric value of every node
+        """
+        return FederatedDataNode.performance_many(self._data_nodes, data, test)
+
+    def local_performance(self, max_samples=None):
+        """
+        Performance of the model of every data node over its own private data, in terms of the most \
+        representative metric. Models of the same class are evaluated together (see: \
+        [FederatedDataNode](./#federateddatanode-class) local_performance_many).
+
+        # Arguments:
+            max_samples: Maximum number of samples of every node used (default None, all of them)
+
+        # Returns:
+            performances: List with the value of the main metric of every node, None for nodes without data
+        """
+        return FederatedDataNode.local_performance_many(self._data_nodes, max_samples)
+
     def configure_data_access(self, data_access_definition):
         """
         Creates the same policy to access data over all the data nodes
 
+        An [AdaptiveDifferentialPrivacy](../../differential_privacy/composition/#adaptivedifferentialprivacy-class) \
+        is not copied into every node. Instead, the budget of all the nodes is kept in a single \
+        [PrivacyBudgetLedger](../../differential_privacy/composition/#privacybudgetledger-class), where every \
+        node starts with the privacy already spent by the given filter.
+
         # Arguments:
             data_access_definition: (see: [DataAccessDefinition](../data/#dataaccessdefinition-class))
         """
+        if isinstance(data_access_definition, AdaptiveDifferentialPrivacy):
+            ledger = PrivacyBudgetLedger.from_privacy_filter(data_access_definition, self.num_nodes())
+            for node, data_node in enumerate(self._data_nodes):
+                data_node.configure_data_access(
+                    ledger.node_filter(node, data_access_definition.differentially_private_mechanism),
+                    ownership="transfer")
+            return
+
         for data_node in self._data_nodes:
             data_node.configure_data_access(data_access_definition)
 
-    def query(self):
+    def query(self, **kwargs):
         """
         Queries over every node and returns the answer of every node in a list
 
+        When the privacy budget of all the nodes is kept in the same \
+        [PrivacyBudgetLedger](../../differential_privacy/composition/#privacybudgetledger-class), it is checked \
+        and charged for all of them at once before any node is queried, so either every node answers or, \
+        if the budget of some node does not allow it, none does.
+
+        # Arguments:
+            kwargs: Arguments of the query of every node, such as the differentially_private_mechanism
+
         # Returns:
             answer: List containing responses for every node
         """
+        self._prepay_privacy_budget(kwargs.get("differentially_private_mechanism"))
+
         answer = []
         for data_node in self._data_nodes:
-            answer.append(data_node.query())
+            answer.append(data_node.query(**kwargs))
 
         return answer
 
+    def _prepay_privacy_budget(self, differentially_private_mechanism):
+        """
+        Charges the privacy budget of a query of all the data nodes at once, if their privacy filters share the \
+        same ledger and the query uses the same mechanism in all of them.
+        """
+        PrivacyBudgetLedger.prepay_filters([data_node.data_access_definition() for data_node in self._data_nodes],
+                                           differentially_private_mechanism)
+
 
 class FederatedTransformation(abc.ABC):
     """
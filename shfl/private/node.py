@@ -1,6 +1,9 @@
 import copy
+import numpy as np
 
+from shfl.private.data import LabeledData
 from shfl.private.data import UnprotectedAccess
+from shfl.private.data_storage import LazyLabeledData
 
 
 class DataNode:
@@ -16,6 +19,15 @@ class DataNode:
     in order to learn. It is assumed that a model is represented by its parameters and the access to these parameters
     must be also configured before queries.
 
+    Every method receiving data, models or parameters accepts an ownership mode that defines how the DataNode \
+    takes the object:
+
+    - "copy": a deep copy is stored, so the caller keeps full control of the original object (default).
+    - "transfer": the object is stored without copying. The caller gives up the object and must not use it anymore.
+    - "shared": the object is stored without copying, but numpy arrays are stored as read-only views. Neither \
+    the node nor the queries answered by the node can modify the shared arrays. Transformations assigning new \
+    arrays to the data work as copy-on-write. Only available for data and model parameters.
+
     # Properties:
         model: access to the model
         private_data: access to train data
@@ -43,7 +55,17 @@ class DataNode:
         # Arguments:
             model: Instance of a class implementing ~TrainableModel
         """
-        self._model = copy.deepcopy(model)
+        self.set_model(model)
+
+    def set_model(self, model, ownership="copy"):
+        """
+        Sets the model to use in the node
+
+        # Arguments:
+            model: Instance of a class implementing ~TrainableModel
+            ownership: "copy" or "transfer" (default "copy")
+        """
+        self._model = _take_ownership(model, ownership, shareable=False)
 
     @property
     def private_data(self):
@@ -69,7 +91,7 @@ class DataNode:
         print(type(self._private_test_data))
         print(self._private_test_data)
 
-    def set_private_data(self, name, data):
+    def set_private_data(self, name, data, ownership="copy"):
         """
         Creates copy of data in private memory using name as key. If there is a previous value with this key the
         data will be overridden.
@@ -77,10 +99,11 @@ class DataNode:
         # Arguments:
             name: String with the key identifier for the data
             data: Data to be stored in the private memory of the DataNode
+            ownership: "copy", "transfer" or "shared" (default "copy")
         """
-        self._private_data[name] = copy.deepcopy(data)
+        self._private_data[name] = _take_ownership(data, ownership)
 
-    def set_private_test_data(self, name, data):
+    def set_private_test_data(self, name, data, ownership="copy"):
         """
         Creates copy of test data in private memory using name as key. If there is a previous value with this key the
         data will be override.
@@ -88,28 +111,44 @@ class DataNode:
         # Arguments:
             name: String with the key identifier for the data
             data: Data to be stored in the private memory of the DataNode
+            ownership: "copy", "transfer" or "shared" (default "copy")
         """
-        self._private_test_data[name] = copy.deepcopy(data)
+        self._private_test_data[name] = _take_ownership(data, ownership)
 
-    def configure_data_access(self, name, data_access_definition):
+    def configure_data_access(self, name, data_access_definition, ownership="copy"):
         """
         Adds a DataAccessDefinition for some concrete private data.
 
         # Arguments:
             name: Identifier for the data that will be configured
             data_access_definition: Policy to access data (see: [DataAccessDefinition](../data/#dataaccessdefinition-class))
+            ownership: "copy" or "transfer" (default "copy")
+        """
+        self._private_data_access_policies[name] = _take_ownership(data_access_definition, ownership,
+                                                                   shareable=False)
+
+    def data_access_definition(self, name):
+        """
+        Returns the DataAccessDefinition configured for some concrete private data.
+
+        # Arguments:
+            name: Identifier for the data
+
+        # Returns:
+            data_access_definition: The access policy of the data, None if it is not configured
         """
-        self._private_data_access_policies[name] = copy.deepcopy(data_access_definition)
+        return self._private_data_access_policies.get(name)
 
-    def configure_model_params_access(self, data_access_definition):
+    def configure_model_params_access(self, data_access_definition, ownership="copy"):
         """
         Adds a DataAccessDefinition for model parameters.
 
         # Arguments:
             data_access_definition: Policy to access parameters \
             (see: [DataAccessDefinition](../data/#dataaccessdefinition-class))
+            ownership: "copy" or "transfer" (default "copy")
         """
-        self._model_access_policy = copy.deepcopy(data_access_definition)
+        self._model_access_policy = _take_ownership(data_access_definition, ownership, shareable=False)
 
     def apply_data_transformation(self, private_property, federated_transformation):
         """
@@ -132,7 +171,10 @@ class DataNode:
             raise ValueError("Data access must be configured before query data")
 
         data_access_policy = self._private_data_access_policies[private_property]
-        return data_access_policy.apply(self._private_data[private_property], **kwargs)
+        data = self._private_data[private_property]
+        if isinstance(data, LazyLabeledData):
+            data.gather()
+        return data_access_policy.apply(data, **kwargs)
 
     def query_model_params(self):
         """
@@ -140,14 +182,35 @@ class DataNode:
         """
         return self._model_access_policy.apply(self._model.get_model_params())
 
-    def set_model_params(self, model_params):
+    def snapshot_model_params(self):
+        """
+        Copies the current parameters of the model without applying the access policy. The copy is meant to \
+        evaluate the model later on while it keeps training, so it must not leave the simulation.
+
+        # Returns:
+            model_params: Deep copy of the parameters of the model
+        """
+        return copy.deepcopy(self._model.get_model_params())
+
+    def trained_model_params(self):
+        """
+        Gets the current parameters of the model without applying the access policy nor copying them. They are \
+        meant to move the trained model between the processes of the simulation, so they must not leave it.
+
+        # Returns:
+            model_params: Parameters of the model
+        """
+        return self._model.get_model_params()
+
+    def set_model_params(self, model_params, ownership="copy"):
         """
         Sets the model to use in the node
 
         # Arguments:
             model_params: Parameters to set in the model
+            ownership: "copy", "transfer" or "shared" (default "copy")
         """
-        self._model.set_model_params(copy.deepcopy(model_params))
+        self._model.set_model_params(_take_ownership(model_params, ownership))
 
     def train_model(self, training_data_key):
         """
@@ -200,6 +263,63 @@ class DataNode:
         """
         return self._model.performance(data, labels)
 
+    @classmethod
+    def evaluate_many(cls, data_nodes, data, labels):
+        """
+        Evaluates the models of several data nodes over the same data. When every node holds a model of the \
+        same class, they are evaluated together through the evaluate_many method of the class \
+        (see: [TrainableModel](../../model/#trainablemodel-class)), otherwise node by node.
+
+        # Arguments:
+            data_nodes: List of data nodes
+            data: Data to predict
+            labels: True values of data
+
+        # Returns:
+            evaluations: List with the evaluate result of every node
+        """
+        model_class = cls._model_class(data_nodes)
+        if model_class is None:
+            return [data_node.evaluate(data, labels) for data_node in data_nodes]
+
+        return model_class.evaluate_many([data_node._model for data_node in data_nodes], data, labels)
+
+    @classmethod
+    def performance_many(cls, data_nodes, data, labels):
+        """
+        Performance of the models of several data nodes over the same data, in terms of the most representative \
+        metric. As in evaluate_many, models of the same class are evaluated together.
+
+        # Arguments:
+            data_nodes: List of data nodes
+            data: Data to predict
+            labels: True values of data
+
+        # Returns:
+            performances: List with the main metric value of every node
+        """
+        model_class = cls._model_class(data_nodes)
+        if model_class is None:
+            return [data_node.performance(data, labels) for data_node in data_nodes]
+
+        return model_class.performance_many([data_node._model for data_node in data_nodes], data, labels)
+
+    @staticmethod
+    def _model_class(data_nodes):
+        """
+        Class of the models of the data nodes if all of them are of the same class, None otherwise. Models \
+        which do not extend TrainableModel have no evaluate_many, so their class is None too.
+        """
+        model_classes = {type(data_node._model) for data_node in data_nodes}
+        if len(model_classes) != 1:
+            return None
+
+        model_class = model_classes.pop()
+        if not hasattr(model_class, "evaluate_many"):
+            return None
+
+        return model_class
+
     def local_evaluate(self, data_key):
         """
         Evaluation of local models on local data test
@@ -212,3 +332,44 @@ class DataNode:
             return self._model.evaluate(labeled_data.data, labeled_data.label)
         else:
             return None
+
+
+def _take_ownership(obj, ownership, shareable=True):
+    """
+    Returns the object that a DataNode stores according to the ownership mode (see: [DataNode](./#datanode-class)).
+
+    # Arguments:
+        obj: Object handed to the node
+        ownership: "copy", "transfer" or "shared"
+        shareable: Whether the "shared" mode is allowed for this object
+
+    # Returns:
+        owned_obj: Object to store in the node
+    """
+    if ownership == "copy":
+        return copy.deepcopy(obj)
+    if ownership == "transfer":
+        return obj
+    if ownership == "shared" and shareable:
+        return _read_only(obj)
+    raise ValueError("Ownership mode " + str(ownership) + " is not valid. Valid modes are " +
+                     ("'copy', 'transfer' and 'shared'" if shareable else "'copy' and 'transfer'"))
+
+
+def _read_only(obj):
+    """
+    Returns a read-only view of every numpy array contained in obj, which can be an array, a \
+    [LabeledData](../data/#labeleddata) or a list or tuple of them. Other objects are returned as they are.
+    """
+    if isinstance(obj, np.ndarray):
+        view = obj.view()
+        view.flags.writeable = False
+        return view
+    if type(obj) is LabeledData:
+        return LabeledData(_read_only(obj.data), _read_only(obj.label))
+    if isinstance(obj, LabeledData):
+        # Storage-backed data is already read-only and cheap to copy
+        return copy.deepcopy(obj)
+    if isinstance(obj, (list, tuple)):
+        return type(obj)(_read_only(item) for item in obj)
+    return obj
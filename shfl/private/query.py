@@ -35,3 +35,18 @@ class Mean(Query):
     """
     def get(self, data):
         return np.mean(data)
+
+
+class SufficientStatistics(Query):
+    """
+    Implements the sufficient statistics of linear regression over labeled data: the matrix Z^T Z, where the \
+    rows of Z are [1, x, y] for every sample. It holds the number of samples, the sums of the features and \
+    labels, X^T X and X^T y, so the data of several nodes can be fitted exactly adding their statistics \
+    (see: [SufficientStatisticsAggregator](../../federated_aggregator/#sufficientstatisticsaggregator-class)).
+    """
+    def get(self, data):
+        features = np.asarray(data.data, dtype=float).reshape(len(data), -1)
+        labels = np.asarray(data.label, dtype=float).reshape(len(data), -1)
+        augmented = np.column_stack((np.ones(len(data)), features, labels))
+
+        return augmented.T @ augmented
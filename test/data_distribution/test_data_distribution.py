@@ -32,3 +32,20 @@ def test_data_distribution_private_data():
     dt = TestDataDistribution(data)
 
     assert data == dt._database
+
+
+def test_gather_federated_data():
+    data = np.random.rand(10, 3)
+    labels = np.random.rand(10)
+    federated_indices = [np.array([0, 1, 2]), np.array([3, 4]), np.array([5, 6, 7])]
+
+    federated_data, federated_label = DataDistribution._gather_federated_data(data, labels, federated_indices)
+
+    assert federated_data.shape == federated_label.shape == (3,)
+    for node, indices in enumerate(federated_indices):
+        assert np.array_equal(federated_data[node], data[indices])
+        assert np.array_equal(federated_label[node], labels[indices])
+
+    federated_data, _ = DataDistribution._gather_federated_data(data, labels, [np.array([0, 1]), np.array([2, 3])])
+    assert federated_data.shape == (2,)
+    assert federated_data[1].shape == (2, 3)
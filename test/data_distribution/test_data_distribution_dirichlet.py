@@ -0,0 +1,116 @@
+import numpy as np
+import pytest
+
+from shfl.data_base.data_base import DataBase
+from shfl.data_distribution.data_distribution_dirichlet import DirichletDataDistribution
+from shfl.private.data import UnprotectedAccess
+
+
+class TestDataBase(DataBase):
+    def __init__(self):
+        super(TestDataBase, self).__init__()
+
+    def load_data(self):
+        self._train_data = np.random.rand(1000).reshape([200, 5])
+        self._test_data = np.random.rand(250).reshape([50, 5])
+        self._train_labels = np.random.randint(0, 4, 200)
+        self._test_labels = np.random.randint(0, 4, 50)
+
+
+def test_wrong_alpha():
+    with pytest.raises(ValueError):
+        DirichletDataDistribution(TestDataBase(), alpha=0)
+
+
+def test_make_index_federated():
+    np.random.seed(123)
+    data = TestDataBase()
+    data.load_data()
+    data_distribution = DirichletDataDistribution(data, alpha=0.5)
+
+    num_nodes = 10
+    federated_indices = data_distribution.make_index_federated(data.train[1], num_nodes, 100, None)
+
+    all_indices = np.concatenate(federated_indices)
+    assert len(federated_indices) == num_nodes
+    assert np.array_equal(np.sort(all_indices), np.arange(200))
+
+
+def test_make_index_federated_weights():
+    np.random.seed(123)
+    labels = np.eye(4)[np.random.randint(0, 4, 1000)]
+    data_distribution = DirichletDataDistribution(TestDataBase(), alpha=100)
+
+    weights = [0.3, 0.1, 0.1]
+    federated_indices = data_distribution.make_index_federated(labels, 3, 50, weights)
+
+    all_indices = np.concatenate(federated_indices)
+    assert len(np.unique(all_indices)) == len(all_indices)
+    assert 250 - 4 <= len(all_indices) <= 250
+    sizes = np.array([len(node_indices) for node_indices in federated_indices])
+    assert np.allclose(sizes / sizes.sum(), [0.6, 0.2, 0.2], atol=0.05)
+
+
+def test_make_index_federated_skew():
+    np.random.seed(123)
+    labels = np.random.randint(0, 10, 5000)
+    num_nodes = 20
+
+    concentrated = DirichletDataDistribution(TestDataBase(), alpha=0.01)
+    uniform = DirichletDataDistribution(TestDataBase(), alpha=1000)
+
+    for data_distribution, max_classes in [(concentrated, 3), (uniform, 10)]:
+        federated_indices = data_distribution.make_index_federated(labels, num_nodes, 100, None)
+        classes_per_node = [np.count_nonzero(np.bincount(labels[node_indices]) > 10)
+                            for node_indices in federated_indices]
+        assert np.mean(classes_per_node) <= max_classes
+    assert np.mean(classes_per_node) == 10
+
+
+def test_make_index_federated_with_replacement():
+    np.random.seed(123)
+    labels = np.random.randint(0, 4, 200)
+    data_distribution = DirichletDataDistribution(TestDataBase())
+
+    weights = [0.5, 0.25, 0.25]
+    federated_indices = data_distribution.make_index_federated(labels, 3, 100, weights, 'with_replacement')
+
+    for node_indices, weight in zip(federated_indices, weights):
+        assert len(node_indices) == int(weight * 200)
+        assert len(np.unique(node_indices)) == len(node_indices)
+        assert ((node_indices >= 0) & (node_indices < 200)).all()
+
+
+def test_make_index_federated_with_replacement_small_classes():
+    np.random.seed(123)
+    labels = np.repeat(np.arange(4), [5, 5, 5, 85])
+    data_distribution = DirichletDataDistribution(TestDataBase(), alpha=0.1)
+
+    federated_indices = data_distribution.make_index_federated(labels, 5, 100, [0.6] * 5, 'with_replacement')
+
+    for node_indices in federated_indices:
+        assert len(node_indices) == 60
+        assert len(np.unique(node_indices)) == 60
+        assert (np.bincount(labels[node_indices], minlength=4) <= [5, 5, 5, 85]).all()
+
+
+def test_get_federated_data():
+    np.random.seed(123)
+    data = TestDataBase()
+    data.load_data()
+    data_distribution = DirichletDataDistribution(data)
+
+    num_nodes = 4
+    federated_data, test_data, test_label = data_distribution.get_federated_data(num_nodes)
+    federated_data.configure_data_access(UnprotectedAccess())
+
+    x, y = data.train
+    for i in range(federated_data.num_nodes()):
+        node_data = federated_data[i].query()
+        indices = [np.where((sample == x).all(axis=1))[0][0] for sample in node_data.data]
+        assert np.array_equal(y[indices], node_data.label)
+
+    assert federated_data.num_nodes() == num_nodes
+    assert sum(federated_data[i].num_samples() for i in range(num_nodes)) == len(x)
+    assert np.array_equal(test_data, data.test[0])
+    assert np.array_equal(test_label, data.test[1])
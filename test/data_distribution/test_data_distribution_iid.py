@@ -106,3 +106,26 @@ def test_make_data_federated_wrong_weights():
     assert num_nodes == federated_data.shape[0] == federated_label.shape[0]
     assert (np.sort(all_data.ravel()) == np.sort(train_data[idx,].ravel())).all()
     assert (np.sort(all_label, 0) == np.sort(train_label[idx], 0)).all()
+
+
+def test_make_index_federated():
+    data = TestDataBase()
+    data.load_data()
+    data_distribution = IidDataDistribution(data)
+
+    train_data, train_label = data_distribution._database.train
+
+    num_nodes = 3
+    percent = 50
+    weights = [0.5, 0.25, 0.25]
+    federated_indices = data_distribution.make_index_federated(train_label, num_nodes, percent, weights)
+
+    all_indices = np.concatenate(federated_indices)
+    assert len(federated_indices) == num_nodes
+    assert [len(indices) for indices in federated_indices] == [10, 5, 5]
+    assert len(np.unique(all_indices)) == len(all_indices)
+
+    federated_indices = data_distribution.make_index_federated(train_label, num_nodes, percent, weights,
+                                                               sampling="with_replacement")
+    assert [len(indices) for indices in federated_indices] == [10, 5, 5]
+    assert ((np.concatenate(federated_indices) >= 0) & (np.concatenate(federated_indices) < 40)).all()
@@ -148,3 +148,28 @@ def test_get_federated_data():
     assert np.array_equal(test_label, dt._database.test[1])
 
 
+def test_make_index_federated_integer_labels():
+    random.seed(123)
+    np.random.seed(123)
+
+    labels = np.random.randint(0, 4, 200)
+    one_hot_labels = tf.keras.utils.to_categorical(labels)
+    data_distribution = NonIidDataDistribution(TestDataBase())
+
+    num_nodes = 4
+    federated_indices = data_distribution.make_index_federated(labels, num_nodes, 100, None, 'without_replacement')
+
+    random.seed(123)
+    np.random.seed(123)
+    np.random.randint(0, 4, 200)
+    one_hot_indices = data_distribution.make_index_federated(one_hot_labels, num_nodes, 100, None,
+                                                             'without_replacement')
+
+    random.seed(123)
+    random_classes = data_distribution.choose_labels(num_nodes, 4)
+
+    all_indices = np.concatenate(federated_indices)
+    assert len(np.unique(all_indices)) == len(all_indices)
+    for node_indices, one_hot_node_indices, node_classes in zip(federated_indices, one_hot_indices, random_classes):
+        assert np.array_equal(node_indices, one_hot_node_indices)
+        assert np.isin(labels[node_indices], node_classes).all()
@@ -5,7 +5,9 @@ from shfl.private import DataNode
 from shfl.private.data import UnprotectedAccess
 from shfl.differential_privacy.composition_dp import ExceededPrivacyBudgetError
 from shfl.differential_privacy.composition_dp import AdaptiveDifferentialPrivacy
+from shfl.differential_privacy.composition_dp import PrivacyBudgetLedger
 from shfl.differential_privacy.dp_mechanism import GaussianMechanism
+from shfl.differential_privacy.dp_mechanism import LaplaceMechanism
 
 
 def test_exception__budget():
@@ -98,3 +100,158 @@ def test_exception_budget_2():
     with pytest.raises(ExceededPrivacyBudgetError):
         for i in range(1, 1000):
             data_node.query("test", differentially_private_mechanism=GaussianMechanism(1, epsilon_delta=(0.1, 1)))
+
+
+def test_can_afford():
+    dp_mechanism = LaplaceMechanism(1, 0.6)
+    data_access_definition = AdaptiveDifferentialPrivacy(epsilon_delta=(1, 1),
+                                                         differentially_private_mechanism=dp_mechanism)
+
+    assert data_access_definition.can_afford()
+    assert data_access_definition.can_afford()
+
+    data_access_definition.apply(1)
+
+    assert not data_access_definition.can_afford()
+    assert data_access_definition.can_afford(LaplaceMechanism(1, 0.4))
+    with pytest.raises(ExceededPrivacyBudgetError):
+        data_access_definition.apply(1)
+    data_access_definition.apply(1, LaplaceMechanism(1, 0.4))
+    assert not data_access_definition.can_afford(LaplaceMechanism(1, 0.01))
+
+
+def test_can_afford_no_access_definition():
+    data_access_definition = AdaptiveDifferentialPrivacy(epsilon_delta=(1, 1))
+
+    with pytest.raises(ValueError):
+        data_access_definition.can_afford()
+
+
+def test_running_sums():
+    data_access_definition = AdaptiveDifferentialPrivacy(epsilon_delta=(100, 0.01))
+    epsilon_delta_history = [(0.1, 1e-5), (0.2, 2e-5), (0.3, 3e-5)]
+    for epsilon_delta in epsilon_delta_history:
+        data_access_definition.apply(1, GaussianMechanism(1, epsilon_delta=epsilon_delta))
+
+    epsilons = np.array([epsilon for epsilon, _ in epsilon_delta_history])
+    assert np.allclose(data_access_definition.spent, [epsilons.sum(), 6e-5, (epsilons ** 2).sum(),
+                                                      (epsilons * (np.exp(epsilons) - 1) * 0.5).sum()])
+
+
+def test_exceeded_budget_not_spent():
+    data_access_definition = AdaptiveDifferentialPrivacy(epsilon_delta=(1, 0.001))
+    with pytest.raises(ExceededPrivacyBudgetError):
+        data_access_definition.apply(1, GaussianMechanism(1, epsilon_delta=(0.1, 1)))
+
+    assert np.array_equal(data_access_definition.spent, [0, 0, 0, 0])
+    assert data_access_definition._private_data_epsilon_delta_access_history == []
+
+
+def test_privacy_budget_ledger_same_filter():
+    epsilons = [0.05, 0.2, 0.1, 0.3, 0.02, 0.4, 0.3, 0.25]
+    data_access_definition = AdaptiveDifferentialPrivacy(epsilon_delta=(1, 0.001))
+    ledger = PrivacyBudgetLedger(epsilon_delta=(1, 0.001), num_nodes=3)
+
+    for epsilon in epsilons:
+        mechanism = LaplaceMechanism(1, epsilon)
+        affordable = data_access_definition.can_afford(mechanism)
+        assert np.array_equal(ledger.can_afford(mechanism.epsilon_delta), [affordable] * 3)
+        if affordable:
+            data_access_definition.apply(1, mechanism)
+            ledger.charge(mechanism.epsilon_delta)
+        else:
+            with pytest.raises(ExceededPrivacyBudgetError):
+                ledger.charge(mechanism.epsilon_delta)
+
+    assert np.allclose(ledger.spent, [[data_access_definition.spent[0], 0]] * 3)
+
+
+def test_privacy_budget_ledger_charge_nodes():
+    ledger = PrivacyBudgetLedger(epsilon_delta=(1, 0), num_nodes=3)
+
+    ledger.charge((0.6, 0), nodes=[0, 2])
+
+    assert np.array_equal(ledger.can_afford((0.5, 0)), [False, True, False])
+    with pytest.raises(ExceededPrivacyBudgetError):
+        ledger.charge((0.5, 0))
+    assert np.array_equal(ledger.spent, [[0.6, 0], [0, 0], [0.6, 0]])
+
+    ledger.charge((0.5, 0), nodes=[1])
+    assert np.array_equal(ledger.spent, [[0.6, 0], [0.5, 0], [0.6, 0]])
+
+
+def test_privacy_budget_ledger_prepay():
+    ledger = PrivacyBudgetLedger(epsilon_delta=(1, 0), num_nodes=2)
+
+    ledger.prepay((0.4, 0))
+    ledger.spend((0.4, 0), 0)
+
+    assert np.array_equal(ledger.spent, [[0.4, 0], [0.4, 0]])
+
+    ledger.spend((0.4, 0), 0)
+    ledger.spend((0.1, 0), 1)
+
+    assert np.array_equal(ledger.spent, [[0.8, 0], [0.5, 0]])
+
+
+def test_privacy_budget_ledger_from_privacy_filter():
+    data_access_definition = AdaptiveDifferentialPrivacy(epsilon_delta=(1, 0.5))
+    data_access_definition.apply(1, GaussianMechanism(1, epsilon_delta=(0.1, 0.01)))
+
+    ledger = PrivacyBudgetLedger.from_privacy_filter(data_access_definition, 2)
+
+    assert ledger.epsilon_delta == (1, 0.5)
+    assert np.allclose(ledger.spent, [[0.1, 0.01], [0.1, 0.01]])
+
+
+def test_privacy_budget_ledger_prepay_filters():
+    ledger = PrivacyBudgetLedger(epsilon_delta=(1, 0), num_nodes=3)
+    mechanism = LaplaceMechanism(1, 0.3)
+
+    PrivacyBudgetLedger.prepay_filters([ledger.node_filter(0, mechanism), ledger.node_filter(2, mechanism)])
+    assert np.allclose(ledger.spent[:, 0], [0.3, 0, 0.3])
+
+    PrivacyBudgetLedger.prepay_filters([ledger.node_filter(0), ledger.node_filter(1)], LaplaceMechanism(1, 0.2))
+    assert np.allclose(ledger.spent[:, 0], [0.5, 0.2, 0.3])
+
+    other_ledger = PrivacyBudgetLedger(epsilon_delta=(1, 0), num_nodes=3)
+    PrivacyBudgetLedger.prepay_filters([ledger.node_filter(0, mechanism), other_ledger.node_filter(1, mechanism)])
+    PrivacyBudgetLedger.prepay_filters([ledger.node_filter(0, mechanism),
+                                        ledger.node_filter(1, LaplaceMechanism(1, 0.1))])
+    PrivacyBudgetLedger.prepay_filters([ledger.node_filter(0, mechanism),
+                                        AdaptiveDifferentialPrivacy((1, 0), mechanism)])
+    assert np.allclose(ledger.spent[:, 0], [0.5, 0.2, 0.3])
+    assert np.allclose(other_ledger.spent[:, 0], [0, 0, 0])
+
+
+def test_adaptive_differential_privacy_mechanism():
+    mechanism = LaplaceMechanism(1, 0.3)
+
+    assert AdaptiveDifferentialPrivacy((1, 0), mechanism).differentially_private_mechanism is mechanism
+    assert AdaptiveDifferentialPrivacy((1, 0)).differentially_private_mechanism is None
+
+
+def test_ledger_privacy_filter():
+    ledger = PrivacyBudgetLedger(epsilon_delta=(1, 0), num_nodes=2)
+    data_access_definition = ledger.node_filter(1, LaplaceMechanism(1, 0.6))
+    data_node = DataNode()
+    data_node.set_private_data("test", np.array(range(10)))
+    data_node.configure_data_access("test", data_access_definition, ownership="transfer")
+
+    assert data_access_definition.epsilon_delta == (1, 0)
+    assert data_access_definition.can_afford()
+    assert data_node.query("test") is not None
+    assert not data_access_definition.can_afford()
+    with pytest.raises(ExceededPrivacyBudgetError):
+        data_node.query("test")
+    assert data_node.query("test", differentially_private_mechanism=LaplaceMechanism(1, 0.4)) is not None
+    assert np.allclose(ledger.spent, [[0, 0], [1, 0]])
+
+
+def test_ledger_privacy_filter_no_access_definition():
+    ledger = PrivacyBudgetLedger(epsilon_delta=(1, 0), num_nodes=1)
+
+    with pytest.raises(ValueError):
+        ledger.node_filter(0).apply(1)
+    with pytest.raises(ValueError):
+        ledger.node_filter(0, UnprotectedAccess())
@@ -2,6 +2,7 @@ import numpy as np
 from unittest.mock import Mock, patch
 
 from shfl.federated_aggregator.cluster_fedavg_aggregator import ClusterFedAvgAggregator
+from shfl.model.param_vector import ParamVector
 
 
 @patch('shfl.federated_aggregator.cluster_fedavg_aggregator.KMeans')
@@ -26,3 +27,15 @@ def test_aggregate_weights(mock_kmeans):
     assert isinstance(res, np.ndarray)
     assert np.array_equal(res, centers)
 
+
+
+def test_aggregate_weights_param_vector():
+    cfa = ClusterFedAvgAggregator()
+
+    clients_params = [np.array([[0, 0], [10, 10]]) + np.random.rand(2, 2) for _ in range(5)]
+    res = cfa.aggregate_weights([ParamVector.from_params(params) for params in clients_params])
+
+    assert isinstance(res, ParamVector)
+    assert res.shapes == [(2, 2)]
+    centers = res.to_params()
+    assert np.allclose(np.sort(centers[:, 0]), [0.5, 10.5], atol=0.5)
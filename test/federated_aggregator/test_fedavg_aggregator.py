@@ -1,6 +1,7 @@
 import numpy as np
 
 from shfl.federated_aggregator.fedavg_aggregator import FedAvgAggregator
+from shfl.model.param_vector import ParamVector
 
 
 def test_aggregated_weights():
@@ -65,4 +66,49 @@ def test_aggregated_weights_multidimensional_3D_array():
     own_agg = own_agg / num_clients 
     
     assert np.array_equal(own_agg, aggregated_weights)
-    assert aggregated_weights.shape == own_agg.shape
\ No newline at end of file
+    assert aggregated_weights.shape == own_agg.shape
+
+def test_accumulate_weights():
+    num_clients = 10
+    tams = [[128, 64], [64], [64, 10]]
+
+    clients_params = [[np.random.rand(*tam).astype(np.float32) for tam in tams] for _ in range(num_clients)]
+    clients_weights = np.random.rand(num_clients)
+
+    avgfa = FedAvgAggregator()
+    avgfa.begin()
+    for params, weight in zip(clients_params, clients_weights):
+        avgfa.add(params, weight)
+    aggregated_weights = avgfa.finalize()
+
+    assert len(aggregated_weights) == len(tams)
+    for layer in range(len(tams)):
+        own_agg = np.average([params[layer] for params in clients_params], axis=0, weights=clients_weights)
+        assert aggregated_weights[layer].dtype == np.float32
+        assert np.allclose(own_agg, aggregated_weights[layer])
+
+    avgfa.begin()
+    avgfa.add(clients_params[0])
+    aggregated_weights = avgfa.finalize()
+    for layer in range(len(tams)):
+        assert np.allclose(clients_params[0][layer], aggregated_weights[layer])
+
+
+def test_aggregated_weights_param_vector():
+    num_clients = 10
+    tams = [[128, 64], [64], [64, 10]]
+
+    clients_params = [[np.random.rand(*tam) for tam in tams] for _ in range(num_clients)]
+    clients_vectors = [ParamVector.from_params(params) for params in clients_params]
+
+    avgfa = FedAvgAggregator()
+    aggregated_weights = avgfa.aggregate_weights(clients_vectors)
+
+    assert isinstance(aggregated_weights, ParamVector)
+    assert aggregated_weights.buffer.dtype == np.float32
+    assert aggregated_weights.shapes == clients_vectors[0].shapes
+    own_agg = np.mean([params.buffer for params in clients_vectors], axis=0)
+    assert np.allclose(own_agg, aggregated_weights.buffer)
+    for layer in range(len(tams)):
+        assert np.allclose(np.mean([params[layer] for params in clients_params], axis=0),
+                           aggregated_weights.layers()[layer], atol=1e-6)
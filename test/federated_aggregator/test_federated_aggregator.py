@@ -1,3 +1,6 @@
+import numpy as np
+from unittest.mock import Mock
+
 from shfl.federated_aggregator.federated_aggregator import FederatedAggregator
 
 
@@ -12,3 +15,23 @@ def test_federated_aggregator_private_data():
 
     assert fa._percentage == percentage
 
+
+
+def test_accumulate_default():
+    fa = TestFederatedAggregator()
+    fa.aggregate_weights = Mock(return_value=0)
+    clients_params = [np.random.rand(3), np.random.rand(3)]
+
+    fa.begin()
+    for params in clients_params:
+        fa.add(params)
+    aggregated_weights = fa.finalize()
+
+    assert aggregated_weights == 0
+    fa.aggregate_weights.assert_called_once_with(clients_params)
+    assert fa._clients_params == []
+
+
+def test_client_weight():
+    assert TestFederatedAggregator().client_weight(3) == 1
+    assert TestFederatedAggregator([0.1, 0.2, 0.7]).client_weight(2) == 0.7
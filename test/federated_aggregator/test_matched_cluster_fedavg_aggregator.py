@@ -0,0 +1,68 @@
+import numpy as np
+
+from shfl.federated_aggregator.matched_cluster_fedavg_aggregator import MatchedClusterFedAvgAggregator
+from shfl.model.param_vector import ParamVector
+
+
+def test_aggregate_weights():
+    mca = MatchedClusterFedAvgAggregator()
+
+    centroids = np.array([[0, 0], [10, 10], [0, 10]])
+    clients_params = [centroids[np.random.permutation(3)] + np.random.rand(3, 2) for _ in range(10)]
+    aligned_params = [params[np.argsort(params.sum(axis=1) + 10 * params[:, 0])] for params in clients_params]
+    reference_order = np.argsort(clients_params[0].sum(axis=1) + 10 * clients_params[0][:, 0])
+
+    res = mca.aggregate_weights(clients_params)
+
+    assert isinstance(res, np.ndarray)
+    assert res.shape == (3, 2)
+    assert np.allclose(res[reference_order], np.mean(aligned_params, axis=0))
+
+
+def test_aggregate_weights_stable_identities():
+    mca = MatchedClusterFedAvgAggregator(init=np.array([[0, 0], [10, 10]]))
+
+    first = mca.aggregate_weights([np.array([[10, 10], [0, 0]]), np.array([[1, 1], [11, 11]])])
+    second = mca.aggregate_weights([np.array([[11, 11], [1, 1]]), np.array([[0, 0], [10, 10]])])
+
+    assert np.array_equal(first, np.array([[0.5, 0.5], [10.5, 10.5]]))
+    assert np.array_equal(second, first)
+
+
+def test_aggregate_weights_weighted():
+    mca = MatchedClusterFedAvgAggregator(init=np.array([[0, 0], [10, 10]]))
+
+    mca.begin()
+    mca.add(np.array([[0, 0], [10, 10]]), 3)
+    mca.add(np.array([[14, 14], [4, 4]]), 1)
+    res = mca.finalize()
+
+    assert np.array_equal(res, np.array([[1, 1], [11, 11]]))
+
+
+def test_aggregate_weights_counts():
+    mca = MatchedClusterFedAvgAggregator(init=np.array([[0, 0], [10, 10], [20, 20]]), counts=True)
+
+    clients_params = [np.array([[0, 0, 0], [30, 30, 3], [57, 57, 3]]),
+                      np.array([[21, 21, 1], [0, 0, 0], [2, 2, 2]])]
+
+    res = mca.aggregate_weights(clients_params)
+
+    assert np.array_equal(res, np.array([[2, 2, 2], [30, 30, 3], [78, 78, 4]]))
+    assert np.array_equal(mca._centroids, np.array([[1, 1], [10, 10], [19.5, 19.5]]))
+
+    res = mca.aggregate_weights([np.array([[0, 0, 0], [22, 22, 2], [0, 0, 0]])])
+
+    assert np.array_equal(res, np.array([[0, 0, 0], [22, 22, 2], [0, 0, 0]]))
+    assert np.array_equal(mca._centroids, np.array([[1, 1], [11, 11], [19.5, 19.5]]))
+
+
+def test_aggregate_weights_param_vector():
+    mca = MatchedClusterFedAvgAggregator()
+
+    clients_params = [np.array([[0, 0], [10, 10]]) + np.random.rand(2, 2) for _ in range(5)]
+    res = mca.aggregate_weights([ParamVector.from_params(params) for params in clients_params])
+
+    assert isinstance(res, ParamVector)
+    assert res.shapes == [(2, 2)]
+    assert np.allclose(res.to_params(), np.mean(clients_params, axis=0))
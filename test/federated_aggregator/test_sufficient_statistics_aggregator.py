@@ -0,0 +1,60 @@
+import numpy as np
+from sklearn.linear_model import LinearRegression
+
+from shfl.federated_aggregator.sufficient_statistics_aggregator import SufficientStatisticsAggregator
+from shfl.private.data import LabeledData
+from shfl.private.query import SufficientStatistics
+
+
+def test_sufficient_statistics():
+    data = np.random.rand(20, 3)
+    labels = np.random.rand(20)
+
+    statistics = SufficientStatistics().get(LabeledData(data, labels))
+
+    assert statistics.shape == (5, 5)
+    assert statistics[0, 0] == 20
+    assert np.allclose(statistics[1:4, 1:4], data.T @ data)
+    assert np.allclose(statistics[1:4, 4], data.T @ labels)
+
+
+def test_aggregate_weights_exact():
+    num_clients = 4
+    data = [np.random.rand(30, 3) for _ in range(num_clients)]
+    labels = [node_data @ np.array([1, -2, 3]) + np.random.rand(30) for node_data in data]
+    clients_params = [SufficientStatistics().get(LabeledData(node_data, node_labels))
+                      for node_data, node_labels in zip(data, labels)]
+
+    aggregated_weights = SufficientStatisticsAggregator().aggregate_weights(clients_params)
+
+    centralized = LinearRegression().fit(np.concatenate(data), np.concatenate(labels))
+    assert aggregated_weights.shape == (1, 4)
+    assert np.allclose(aggregated_weights[0], np.r_[centralized.intercept_, centralized.coef_])
+
+
+def test_aggregate_weights_ridge_multiple_targets():
+    data = np.random.rand(50, 3)
+    labels = np.random.rand(50, 2)
+    ridge = 2
+    aggregator = SufficientStatisticsAggregator(n_targets=2, ridge=ridge)
+
+    aggregator.begin()
+    aggregator.add(SufficientStatistics().get(LabeledData(data[:20], labels[:20])))
+    aggregator.add(SufficientStatistics().get(LabeledData(data[20:], labels[20:])))
+    aggregated_weights = aggregator.finalize()
+
+    features = np.column_stack((np.ones(50), data))
+    penalty = ridge * np.diag([0, 1, 1, 1])
+    expected = np.linalg.solve(features.T @ features + penalty, features.T @ labels).T
+    assert aggregated_weights.shape == (2, 4)
+    assert np.allclose(aggregated_weights, expected)
+
+
+def test_aggregate_weights_singular():
+    data = np.ones((10, 2))
+    labels = np.full(10, 3.0)
+    statistics = SufficientStatistics().get(LabeledData(data, labels))
+
+    aggregated_weights = SufficientStatisticsAggregator().aggregate_weights([statistics])
+
+    assert np.allclose(np.column_stack((np.ones(10), data)) @ aggregated_weights[0], labels)
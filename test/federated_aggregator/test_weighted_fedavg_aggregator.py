@@ -1,6 +1,7 @@
 import numpy as np
 
 from shfl.federated_aggregator.weighted_fedavg_aggregator import WeightedFedAvgAggregator
+from shfl.model.param_vector import ParamVector
 
 
 def test_aggregated_weights():
@@ -23,6 +24,45 @@ def test_aggregated_weights():
     own_agg = np.array([np.sum(own_ponderated_weights[:, layer], axis=0) for layer in range(num_layers)])
 
     for i in range(num_layers):
-        assert np.array_equal(own_agg[i],aggregated_weights[i])
+        assert np.allclose(own_agg[i],aggregated_weights[i])
     assert aggregated_weights.shape[0] == num_layers
 
+
+
+def test_accumulate_weights():
+    num_clients = 10
+    tams = [[128, 64], [64], [64, 10]]
+
+    clients_params = [[np.random.rand(*tam) for tam in tams] for _ in range(num_clients)]
+    percentage = np.random.dirichlet(np.ones(num_clients), size=1)[0]
+
+    avgfa = WeightedFedAvgAggregator(percentage=percentage)
+    avgfa.begin()
+    for params in clients_params:
+        avgfa.add(params)
+    aggregated_weights = avgfa.finalize()
+
+    for layer in range(len(tams)):
+        own_agg = np.sum([percentage[client] * clients_params[client][layer] for client in range(num_clients)], axis=0)
+        assert np.allclose(own_agg, aggregated_weights[layer])
+
+    avgfa.begin()
+    avgfa.add(clients_params[0], 0.5)
+    avgfa.add(clients_params[1], 0.25)
+    aggregated_weights = avgfa.finalize()
+    for layer in range(len(tams)):
+        own_agg = (0.5 * clients_params[0][layer] + 0.25 * clients_params[1][layer]) / 0.75
+        assert np.allclose(own_agg, aggregated_weights[layer])
+
+
+def test_aggregated_weights_param_vector():
+    num_clients = 10
+    clients_vectors = [ParamVector.from_params([np.random.rand(8, 4), np.random.rand(4)]) for _ in range(num_clients)]
+    percentage = np.random.dirichlet(np.ones(num_clients), size=1)[0]
+
+    avgfa = WeightedFedAvgAggregator(percentage=percentage)
+    aggregated_weights = avgfa.aggregate_weights(clients_vectors)
+
+    own_agg = percentage @ np.array([params.buffer for params in clients_vectors])
+    assert isinstance(aggregated_weights, ParamVector)
+    assert np.allclose(own_agg, aggregated_weights.buffer)
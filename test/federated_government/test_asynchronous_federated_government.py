@@ -0,0 +1,108 @@
+import numpy as np
+import pytest
+from unittest.mock import Mock
+
+from shfl.data_base.data_base import DataBase
+from shfl.data_distribution.data_distribution_iid import IidDataDistribution
+from shfl.federated_aggregator.fedavg_aggregator import FedAvgAggregator
+from shfl.federated_aggregator.weighted_fedavg_aggregator import WeightedFedAvgAggregator
+from shfl.federated_government.asynchronous_federated_government import AsynchronousFederatedGovernment
+from shfl.federated_government.training_executor import ThreadPoolTrainingExecutor
+from shfl.model.linear_regression_model import LinearRegressionModel
+
+
+class TestDataBase(DataBase):
+    def __init__(self):
+        super(TestDataBase, self).__init__()
+
+    def load_data(self):
+        self._train_data = np.random.rand(400).reshape([80, 5])
+        self._test_data = np.random.rand(200).reshape([40, 5])
+        self._train_labels = self._train_data @ np.arange(5) + 1
+        self._test_labels = self._test_data @ np.arange(5) + 1
+
+
+def model_builder():
+    return LinearRegressionModel(n_features=5)
+
+
+def get_federated_data(num_nodes=4):
+    database = TestDataBase()
+    database.load_data()
+    db = IidDataDistribution(database)
+
+    return db.get_federated_data(num_nodes)
+
+
+def test_wrong_parameters():
+    federated_data, _, _ = get_federated_data()
+    with pytest.raises(ValueError):
+        AsynchronousFederatedGovernment(model_builder, federated_data, FedAvgAggregator(), buffer_size=0)
+    with pytest.raises(ValueError):
+        AsynchronousFederatedGovernment(model_builder, federated_data, FedAvgAggregator(), mixing_rate=0)
+
+
+def test_staleness_weight():
+    federated_data, _, _ = get_federated_data()
+    afg = AsynchronousFederatedGovernment(model_builder, federated_data, FedAvgAggregator(), staleness_exponent=1)
+
+    assert afg.staleness_weight(0) == 1
+    assert afg.staleness_weight(3) == 0.25
+
+
+def test_add_client_update():
+    federated_data, _, _ = get_federated_data()
+    afg = AsynchronousFederatedGovernment(model_builder, federated_data, FedAvgAggregator(), buffer_size=2,
+                                          mixing_rate=0.5, staleness_exponent=1)
+
+    first_node = federated_data[0]
+    first_node.query_model_params = Mock(return_value=np.full((1, 6), 2.0))
+    second_node = federated_data[1]
+    second_node.query_model_params = Mock(return_value=np.full((1, 6), 4.0))
+
+    assert not afg.add_client_update(first_node, 0)
+    assert np.array_equal(afg.global_model.get_model_params(), np.zeros((1, 6)))
+    assert afg.add_client_update(second_node, 1)
+
+    # alpha = 0.5 * (1 + 0.5) / 2, aggregated parameters = 3
+    assert afg.version == 1
+    assert np.allclose(afg.global_model.get_model_params(), 0.375 * 3)
+
+
+
+def test_add_client_update_weights():
+    federated_data, _, _ = get_federated_data()
+    afg = AsynchronousFederatedGovernment(model_builder, federated_data,
+                                          WeightedFedAvgAggregator(percentage=[0.1, 0.2, 0.3, 0.4]), buffer_size=2,
+                                          mixing_rate=1, staleness_exponent=0)
+    for index, data_node in enumerate(federated_data):
+        data_node.query_model_params = Mock(return_value=np.full((1, 6), index + 1.0))
+
+    afg.add_client_update(federated_data[3], 0)
+    afg.add_client_update(federated_data[1], 0)
+
+    assert np.allclose(afg.global_model.get_model_params(), (0.4 * 4 + 0.2 * 2) / 0.6)
+
+def test_run_rounds():
+    federated_data, test_data, test_labels = get_federated_data()
+    executor = ThreadPoolTrainingExecutor(max_workers=2)
+    afg = AsynchronousFederatedGovernment(model_builder, federated_data, FedAvgAggregator(), executor=executor,
+                                          buffer_size=2, mixing_rate=1, concurrency=3)
+    afg.evaluate_global_model = Mock()
+
+    afg.run_rounds(5, test_data, test_labels)
+    executor.shutdown()
+
+    assert afg.version == 5
+    assert afg.evaluate_global_model.call_count == 5
+    assert np.allclose(afg.global_model.get_model_params(), [[1, 0, 1, 2, 3, 4]])
+
+
+def test_run_rounds_serial():
+    federated_data, test_data, test_labels = get_federated_data()
+    afg = AsynchronousFederatedGovernment(model_builder, federated_data, FedAvgAggregator())
+    afg.evaluate_global_model = Mock()
+
+    afg.run_rounds(3, test_data, test_labels)
+
+    assert afg.version == 3
@@ -0,0 +1,123 @@
+import numpy as np
+import pytest
+from unittest.mock import Mock
+from unittest.mock import patch
+
+from shfl.federated_government.client_selector import UniformClientSelector
+from shfl.federated_government.client_selector import SizeWeightedClientSelector
+from shfl.federated_government.client_selector import PowerOfChoiceClientSelector
+from shfl.private.federated_operation import FederatedData
+from shfl.private.data import LabeledData
+from shfl.model.linear_regression_model import LinearRegressionModel
+
+
+def get_federated_data(sizes):
+    federated_data = FederatedData()
+    for size in sizes:
+        federated_data.add_data_node(np.random.rand(size))
+
+    return federated_data
+
+
+def test_wrong_fraction():
+    with pytest.raises(ValueError):
+        UniformClientSelector(0)
+    with pytest.raises(ValueError):
+        SizeWeightedClientSelector(1.5)
+
+
+def test_uniform_client_selector():
+    federated_data = get_federated_data([10] * 20)
+    selector = UniformClientSelector(0.1)
+
+    selected = selector.select(federated_data)
+
+    assert len(selected) == 2
+    assert len(np.unique(selected)) == 2
+    assert ((selected >= 0) & (selected < 20)).all()
+
+
+def test_uniform_client_selector_min_clients():
+    federated_data = get_federated_data([10] * 20)
+    selector = UniformClientSelector(0.01, min_clients=3)
+
+    assert len(selector.select(federated_data)) == 3
+
+
+def test_size_weighted_client_selector():
+    federated_data = get_federated_data([0, 10, 0, 10, 1000])
+    selector = SizeWeightedClientSelector(0.6)
+
+    counts = np.zeros(5)
+    for _ in range(100):
+        selected = selector.select(federated_data)
+        assert len(selected) == 3
+        counts[selected] += 1
+
+    assert counts[0] == counts[2] == 0
+    assert counts[4] == 100
+
+
+def get_model_federated_data(sizes):
+    federated_data = get_federated_data(sizes)
+    for data_node in federated_data:
+        data_node.set_private_data(LabeledData(np.random.rand(data_node.num_samples(), 2),
+                                               np.random.rand(data_node.num_samples())))
+        data_node.set_model(Mock(), ownership="transfer")
+    return federated_data
+
+
+def test_power_of_choice_client_selector():
+    federated_data = get_model_federated_data([10] * 6)
+    for index, data_node in enumerate(federated_data):
+        data_node._model.performance.return_value = index
+    global_model = Mock()
+    global_model.get_model_params.return_value = np.zeros(3)
+
+    selector = PowerOfChoiceClientSelector(0.5, num_candidates=6)
+    selected = selector.select(federated_data, global_model)
+
+    assert np.array_equal(selected, [0, 1, 2])
+    assert selector.candidates_performance == {index: index for index in range(6)}
+    for data_node in federated_data:
+        data_node._model.set_model_params.assert_called_once()
+        data_node._model.performance.assert_called_once()
+
+    loss_selector = PowerOfChoiceClientSelector(0.5, num_candidates=6, performance_is_loss=True)
+    assert np.array_equal(loss_selector.select(federated_data, global_model), [3, 4, 5])
+
+
+def test_power_of_choice_client_selector_candidates():
+    federated_data = get_model_federated_data([10] * 10)
+    for data_node in federated_data:
+        data_node._model.performance.return_value = 0
+
+    selector = PowerOfChoiceClientSelector(0.2, num_candidates=4, max_samples=5)
+    selected = selector.select(federated_data)
+
+    assert len(selected) == 2
+    assert len(selector.candidates_performance) == 4
+    assert set(selected) <= set(selector.candidates_performance)
+    probed = [data_node for data_node in federated_data if data_node._model.performance.called]
+    assert len(probed) == 4
+    for data_node in probed:
+        assert len(data_node._model.performance.call_args[0][0]) == 5
+
+
+def test_power_of_choice_client_selector_batched_probe():
+    federated_data = get_model_federated_data([10] * 8)
+    for data_node in federated_data:
+        data_node.set_model(LinearRegressionModel(n_features=2), ownership="transfer")
+    global_model = LinearRegressionModel(n_features=2)
+    global_model.set_model_params(np.random.rand(1, 3))
+
+    selector = PowerOfChoiceClientSelector(0.25, num_candidates=4)
+    with patch.object(LinearRegressionModel, "performance_each",
+                      wraps=LinearRegressionModel.performance_each) as each:
+        selected = selector.select(federated_data, global_model)
+        each.assert_called_once()
+
+    assert len(selected) == 2
+    for candidate, performance in selector.candidates_performance.items():
+        assert np.isclose(performance, federated_data[candidate].local_performance())
+        assert np.array_equal(federated_data[candidate].query_model_params(), global_model.get_model_params())
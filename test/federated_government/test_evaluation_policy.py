@@ -0,0 +1,127 @@
+import numpy as np
+import pytest
+from unittest.mock import Mock
+
+from shfl.federated_government.evaluation_policy import FullEvaluationPolicy
+from shfl.federated_government.evaluation_policy import SubsampleEvaluationPolicy
+from shfl.federated_government.evaluation_policy import ShardedEvaluationPolicy
+from shfl.federated_government.federated_government import FederatedGovernment
+from shfl.private.federated_operation import FederatedData
+
+
+def test_wrong_every():
+    with pytest.raises(ValueError):
+        FullEvaluationPolicy(every=0)
+
+
+def test_evaluates():
+    policy = FullEvaluationPolicy(every=3)
+
+    assert [policy.evaluates(i) for i in range(6)] == [False, False, True, False, False, True]
+
+
+def test_full_evaluation_policy():
+    data, labels = np.random.rand(20, 2), np.random.rand(20)
+    policy = FullEvaluationPolicy()
+
+    test_data = policy.client_test_data(data, labels, 3)
+
+    assert isinstance(test_data, list)
+    assert len(test_data) == 3
+    for client_data, client_labels in test_data:
+        assert client_data is data
+        assert client_labels is labels
+    assert policy.global_test_data(data, labels) == (data, labels)
+    assert policy.combine([1, 2, 3], test_data) is None
+
+
+def test_subsample_evaluation_policy():
+    data = np.arange(100).reshape(50, 2)
+    labels = np.repeat(np.eye(2), [40, 10], axis=0)
+    policy = SubsampleEvaluationPolicy(num_samples=10)
+
+    sub_data, sub_labels = policy.global_test_data(data, labels)
+
+    assert len(sub_data) == 10
+    assert sub_labels[:, 1].sum() == 2
+    assert np.all(np.diff(sub_data[:, 0]) > 0)
+    assert np.array_equal(labels[sub_data[:, 0] // 2], sub_labels)
+    for client_data, client_labels in policy.client_test_data(data, labels, 2):
+        assert client_data is sub_data
+        assert client_labels is sub_labels
+
+
+def test_subsample_evaluation_policy_cache():
+    data, labels = np.random.rand(50, 2), np.random.randint(0, 3, 50)
+    policy = SubsampleEvaluationPolicy(num_samples=10)
+
+    first = policy.global_test_data(data, labels)
+    assert policy.global_test_data(data, labels)[0] is first[0]
+
+    other_data = data.copy()
+    assert policy.global_test_data(other_data, labels)[0] is not first[0]
+
+
+def test_subsample_evaluation_policy_small_test():
+    data, labels = np.random.rand(5, 2), np.random.rand(5)
+    policy = SubsampleEvaluationPolicy(num_samples=10)
+
+    sub_data, sub_labels = policy.global_test_data(data, labels)
+
+    assert np.array_equal(sub_data, data)
+    assert np.array_equal(sub_labels, labels)
+
+
+def test_sharded_evaluation_policy():
+    data, labels = np.arange(21).reshape(21, 1), np.arange(21)
+    policy = ShardedEvaluationPolicy()
+
+    test_data = policy.client_test_data(data, labels, 4)
+
+    assert isinstance(test_data, list)
+    assert [len(client_labels) for _, client_labels in test_data] == [6, 5, 5, 5]
+    assert np.array_equal(np.sort(np.concatenate([client_labels for _, client_labels in test_data])), labels)
+    for client_data, client_labels in test_data:
+        assert np.array_equal(client_data[:, 0], client_labels)
+    assert policy.client_test_data(data, labels, 4) is test_data
+    assert len(policy.client_test_data(data, labels, 3)) == 3
+
+    combined = policy.combine([[1, 0], [2, 1], [2, 1], [2, 1]], test_data)
+    assert np.allclose(combined, [(6 + 30) / 21, 15 / 21])
+
+
+def test_government_evaluation_policy(capsys):
+    federated_data = FederatedData()
+    for _ in range(3):
+        federated_data.add_data_node(np.random.rand(10))
+    model = Mock()
+    model.evaluate.return_value = 1
+
+    fdg = FederatedGovernment(lambda: model, federated_data, Mock(),
+                              evaluation_policy=ShardedEvaluationPolicy())
+    for data_node in federated_data:
+        data_node.evaluate = Mock(return_value=(1, None))
+    data, labels = np.random.rand(30, 2), np.random.rand(30)
+
+    fdg.evaluate_clients(data, labels)
+
+    for data_node in federated_data:
+        assert len(data_node.evaluate.call_args[0][1]) == 10
+    assert "Combined clients test performance : 1.0" in capsys.readouterr().out
+
+
+def test_run_rounds_every():
+    federated_data = FederatedData()
+    federated_data.add_data_node(np.random.rand(10))
+    fdg = FederatedGovernment(Mock, federated_data, Mock(), evaluation_policy=FullEvaluationPolicy(every=2))
+    fdg.deploy_central_model = Mock()
+    fdg.train_all_clients = Mock()
+    fdg.aggregate_weights = Mock()
+    fdg.evaluate_clients = Mock()
+    fdg.evaluate_global_model = Mock()
+
+    fdg.run_rounds(5, np.random.rand(5), np.random.rand(5))
+
+    assert fdg.train_all_clients.call_count == 5
+    assert fdg.evaluate_clients.call_count == 2
+    assert fdg.evaluate_global_model.call_count == 2
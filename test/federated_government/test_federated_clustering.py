@@ -1,6 +1,8 @@
 from shfl.federated_government.federated_clustering import FederatedClustering, ClusteringDataBases
-from shfl.federated_aggregator.cluster_fedavg_aggregator import ClusterFedAvgAggregator
+from shfl.federated_aggregator.matched_cluster_fedavg_aggregator import MatchedClusterFedAvgAggregator
+from shfl.federated_aggregator.fedavg_aggregator import FedAvgAggregator
 from shfl.model.kmeans_model import KMeansModel
+from shfl.model.kmeans_model import LloydKMeansModel
 from unittest.mock import Mock, patch
 
 import numpy as np
@@ -18,7 +20,7 @@ def test_FederatedClustering():
     assert cfg._test_labels is not None
     assert cfg._num_clusters == len(np.unique(train_labels))
     assert cfg._num_features == train_data.shape[1]
-    assert isinstance(cfg._aggregator, ClusterFedAvgAggregator)
+    assert isinstance(cfg._aggregator, MatchedClusterFedAvgAggregator)
     assert isinstance(cfg._model, KMeansModel)
     assert cfg._federated_data is not None
 
@@ -28,7 +30,7 @@ def test_FederatedClustering():
     assert cfg._test_labels is not None
     assert cfg._num_clusters == len(np.unique(train_labels))
     assert cfg._num_features == train_data.shape[1]
-    assert isinstance(cfg._aggregator, ClusterFedAvgAggregator)
+    assert isinstance(cfg._aggregator, MatchedClusterFedAvgAggregator)
     assert isinstance(cfg._model, KMeansModel)
     assert cfg._federated_data is not None
 
@@ -81,4 +83,17 @@ def test_model_builder(mock_kmeans):
     model = cfg.model_builder()
 
     assert isinstance(model, Mock)
-    mock_kmeans.assert_called_with(n_clusters=cfg._num_clusters, n_features=cfg._num_features)
\ No newline at end of file
+    mock_kmeans.assert_called_with(n_clusters=cfg._num_clusters, n_features=cfg._num_features, warm_start=True)
+
+def test_FederatedClustering_lloyd():
+    cfg = FederatedClustering('IRIS', iid=True, num_nodes=3, percent=20, lloyd=True)
+
+    assert isinstance(cfg._aggregator, FedAvgAggregator)
+    assert isinstance(cfg._model, LloydKMeansModel)
+    assert cfg._model.get_model_params()[:, -1].sum() > 0
+
+    cfg.deploy_central_model()
+    cfg.train_all_clients()
+    cfg.aggregate_weights()
+
+    assert cfg._model.get_model_params().shape == (cfg._num_clusters, cfg._num_features + 1)
@@ -1,4 +1,6 @@
+import re
 import numpy as np
+import pytest
 from unittest.mock import Mock
 
 from shfl.federated_government.federated_government import FederatedGovernment
@@ -6,6 +8,9 @@ from shfl.data_base.data_base import DataBase
 from shfl.data_distribution.data_distribution_iid import IidDataDistribution
 from shfl.private.data import UnprotectedAccess
 from shfl.private.federated_operation import split_train_test
+from shfl.private.device_profile import DeviceProfile
+from shfl.federated_aggregator.fedavg_aggregator import FedAvgAggregator
+from shfl.federated_aggregator.weighted_fedavg_aggregator import WeightedFedAvgAggregator
 
 
 class TestFederatedGovernment(FederatedGovernment):
@@ -150,10 +155,12 @@ def test_aggregate_weights():
     fdg = FederatedGovernment(model_builder, federated_data, aggregator)
 
     weights = np.random.rand(64, 32)
-    fdg._aggregator.aggregate_weights.return_value = weights
+    fdg._aggregator.finalize.return_value = weights
 
     fdg.aggregate_weights()
 
+    fdg._aggregator.begin.assert_called_once()
+    assert fdg._aggregator.add.call_count == num_nodes
     fdg._model.set_model_params.assert_called_once_with(weights)
 
 
@@ -226,4 +233,232 @@ def test_run_rounds_local_tests():
     fdg.train_all_clients.assert_called_once()
     fdg.evaluate_clients.assert_called_once_with(test_data, test_labels)
     fdg.aggregate_weights.assert_called_once()
-    fdg.evaluate_global_model.assert_called_once_with(test_data, test_labels)
\ No newline at end of file
+    fdg.evaluate_global_model.assert_called_once_with(test_data, test_labels)
+
+def test_select_clients():
+    model_builder = Mock
+    aggregator = Mock()
+    database = TestDataBase()
+    database.load_data()
+    db = IidDataDistribution(database)
+
+    num_nodes = 4
+    federated_data, test_data, test_labels = db.get_federated_data(num_nodes)
+
+    client_selector = Mock()
+    client_selector.select.return_value = [0, 2]
+    fdg = FederatedGovernment(model_builder, federated_data, aggregator, client_selector=client_selector)
+    for data_node in federated_data:
+        data_node.train_model = Mock()
+        data_node.set_model_params = Mock()
+
+    fdg.select_clients()
+    fdg.deploy_central_model()
+    fdg.train_all_clients()
+    fdg.aggregate_weights()
+
+    client_selector.select.assert_called_once_with(federated_data, fdg.global_model)
+    for index, data_node in enumerate(federated_data):
+        assert data_node.train_model.called == (index in [0, 2])
+        assert data_node.set_model_params.called == (index in [0, 2])
+    assert aggregator.add.call_count == 2
+
+
+def test_aggregate_weights_selected_clients_weights():
+    database = TestDataBase()
+    database.load_data()
+    db = IidDataDistribution(database)
+    federated_data, test_data, test_labels = db.get_federated_data(10)
+
+    client_selector = Mock()
+    client_selector.select.return_value = [1, 4, 7]
+    percentage = np.array([0.05, 0.2, 0.05, 0.05, 0.1, 0.05, 0.1, 0.3, 0.05, 0.05])
+    fdg = FederatedGovernment(CountingModel, federated_data, WeightedFedAvgAggregator(percentage=percentage),
+                              client_selector=client_selector)
+
+    fdg.select_clients()
+    for index, data_node in enumerate(federated_data):
+        data_node.set_model_params(np.array([[5, 1, 2, 3]]) * (index + 1))
+    fdg.aggregate_weights()
+
+    expected = (0.2 * 2 + 0.1 * 5 + 0.3 * 8) / 0.6 * np.array([[5, 1, 2, 3]])
+    assert np.allclose(fdg.global_model.get_model_params(), expected)
+
+    client_selector.select.return_value = [2, 5, 8]
+    fdg.select_clients()
+    for data_node in federated_data:
+        data_node.set_model_params(np.array([[5, 1, 2, 3]]))
+    fdg.aggregate_weights()
+
+    assert np.allclose(fdg.global_model.get_model_params(), [[5, 1, 2, 3]])
+
+
+def test_run_rounds_select_clients():
+    model_builder = Mock
+    aggregator = Mock()
+    database = TestDataBase()
+    database.load_data()
+    db = IidDataDistribution(database)
+
+    federated_data, test_data, test_labels = db.get_federated_data(3)
+
+    fdg = FederatedGovernment(model_builder, federated_data, aggregator)
+
+    fdg.select_clients = Mock()
+    fdg.deploy_central_model = Mock()
+    fdg.train_all_clients = Mock()
+    fdg.evaluate_clients = Mock()
+    fdg.aggregate_weights = Mock()
+    fdg.evaluate_global_model = Mock()
+
+    fdg.run_rounds(2, test_data, test_labels)
+
+    assert fdg.select_clients.call_count == 2
+
+
+def get_profiled_government(**kwargs):
+    database = TestDataBase()
+    database.load_data()
+    db = IidDataDistribution(database)
+    federated_data, test_data, test_labels = db.get_federated_data(4)
+
+    aggregator = Mock()
+    aggregator.client_weight.side_effect = [0.1, 0.2, 0.3, 0.4].__getitem__
+    model_builder = Mock
+    fdg = FederatedGovernment(model_builder, federated_data, aggregator, **kwargs)
+    fdg._model.get_model_params.return_value = np.zeros(100)
+    # Every node has 10 samples and uploads 800 bytes
+    for compute_speed, data_node in zip([10, 5, 2, 1], federated_data):
+        data_node.device_profile = DeviceProfile(compute_speed=compute_speed, bandwidth=800)
+        data_node.train_model = Mock()
+
+    return fdg, federated_data
+
+
+def test_timing_reports():
+    fdg, federated_data = get_profiled_government()
+
+    fdg.train_all_clients()
+    fdg.aggregate_weights()
+    fdg.train_all_clients()
+
+    assert fdg.clock.now == 22
+    assert len(fdg.timing_reports) == 2
+    report = fdg.timing_reports[1]
+    assert report["round"] == 1
+    assert report["start"] == 11
+    assert report["duration"] == 11
+    assert report["num_selected"] == 4
+    assert report["num_stragglers"] == 0
+    assert np.array_equal(report["node_times"], [2, 3, 6, 11])
+    assert fdg._aggregator.add.call_count == 4
+
+
+def test_deadline_drop():
+    fdg, federated_data = get_profiled_government(deadline=5)
+
+    fdg.train_all_clients()
+    fdg.aggregate_weights()
+
+    assert fdg.clock.now == 5
+    assert fdg.timing_reports[0]["num_stragglers"] == 2
+    for index, data_node in enumerate(federated_data):
+        assert data_node.train_model.called == (index < 2)
+    assert fdg._aggregator.add.call_count == 2
+    assert [call[0][1] for call in fdg._aggregator.add.call_args_list] == [0.1, 0.2]
+
+
+def test_deadline_partial():
+    fdg, federated_data = get_profiled_government(deadline=5, straggler_policy="partial")
+
+    fdg.train_all_clients()
+    fdg.aggregate_weights()
+
+    assert fdg.clock.now == 5
+    for data_node in federated_data:
+        data_node.train_model.assert_called_once()
+    weights = [call[0][1] for call in fdg._aggregator.add.call_args_list]
+    assert np.allclose(weights, [0.1, 0.2, 0.3 * 5 / 6, 0.4 * 5 / 11])
+
+
+def test_deadline_partial_weighted_fedavg():
+    fdg, federated_data = get_profiled_government(deadline=5, straggler_policy="partial")
+    fdg._aggregator = WeightedFedAvgAggregator(percentage=[0.1, 0.2, 0.3, 0.4])
+    for index, data_node in enumerate(federated_data):
+        data_node.query_model_params = Mock(return_value=np.full(2, index + 1.0))
+
+    fdg.train_all_clients()
+    fdg.aggregate_weights()
+
+    weights = np.array([0.1, 0.2, 0.3 * 5 / 6, 0.4 * 5 / 11])
+    expected = weights @ np.arange(1, 5) / weights.sum()
+    assert np.allclose(fdg._model.set_model_params.call_args[0][0], np.full(2, expected))
+
+
+def test_deadline_no_clients():
+    fdg, federated_data = get_profiled_government(deadline=1)
+
+    fdg.train_all_clients()
+    fdg.aggregate_weights()
+
+    fdg._aggregator.begin.assert_not_called()
+    fdg._model.set_model_params.assert_not_called()
+
+
+def test_wrong_straggler_policy():
+    with pytest.raises(ValueError):
+        get_profiled_government(straggler_policy="wait")
+
+
+class CountingModel:
+    def __init__(self):
+        self._params = np.zeros(2)
+
+    def train(self, data, labels):
+        self._params = self._params + 1
+
+    def get_model_params(self):
+        return self._params
+
+    def set_model_params(self, params):
+        self._params = np.array(params)
+
+    def evaluate(self, data, labels):
+        return self._params.sum()
+
+
+def test_run_rounds_pipelined(capsys):
+    outputs = []
+    for pipelined in [False, True]:
+        database = TestDataBase()
+        database.load_data()
+        db = IidDataDistribution(database)
+        federated_data, test_data, test_labels = db.get_federated_data(3)
+        split_train_test(federated_data)
+
+        fdg = FederatedGovernment(CountingModel, federated_data, FedAvgAggregator(), pipelined=pipelined)
+        fdg.run_rounds(3, test_data, test_labels)
+        outputs.append(re.sub("0x[0-9a-f]+", "", capsys.readouterr().out))
+
+    assert "Global model test performance : 6.0" in outputs[0]
+    assert outputs[0] == outputs[1]
+    assert fdg._evaluation_executor is None
+
+
+def test_run_rounds_pipelined_shutdown_on_error():
+    database = TestDataBase()
+    database.load_data()
+    db = IidDataDistribution(database)
+    federated_data, test_data, test_labels = db.get_federated_data(3)
+
+    fdg = FederatedGovernment(CountingModel, federated_data, FedAvgAggregator(), pipelined=True)
+    executor = Mock()
+    fdg._evaluation_executor = executor
+    fdg.train_all_clients = Mock(side_effect=RuntimeError())
+
+    with pytest.raises(RuntimeError):
+        fdg.run_rounds(3, test_data, test_labels)
+
+    executor.shutdown.assert_called_once()
+    assert fdg._evaluation_executor is None
+    assert fdg._pending_evaluation is None
@@ -1,5 +1,6 @@
 from shfl.federated_government.federated_linear_regression import FederatedLinearRegression, LinearRegressionDataBases
 from shfl.federated_aggregator.fedavg_aggregator import FedAvgAggregator
+from shfl.federated_aggregator.sufficient_statistics_aggregator import SufficientStatisticsAggregator
 from shfl.model.linear_regression_model import LinearRegressionModel
 from unittest.mock import Mock, patch
 
@@ -73,4 +74,27 @@ def test_model_builder(mock_linearegression):
     model = lrfg.model_builder()
 
     assert isinstance(model, Mock)
-    mock_linearegression.assert_called_with(n_features=lrfg._num_features)
\ No newline at end of file
+    mock_linearegression.assert_called_with(n_features=lrfg._num_features)
+
+def test_FederatedLinearRegression_sufficient_statistics():
+    database = 'CALIFORNIA'
+    lrfg = FederatedLinearRegression(database, num_nodes=3, percent=20, sufficient_statistics=True, ridge=1)
+
+    assert isinstance(lrfg._aggregator, SufficientStatisticsAggregator)
+    statistics = lrfg._federated_data[0].query()
+    assert statistics.shape == (lrfg._num_features + 2, lrfg._num_features + 2)
+
+
+def test_run_rounds_sufficient_statistics():
+    database = 'CALIFORNIA'
+    lrfg = FederatedLinearRegression(database, num_nodes=3, percent=20, sufficient_statistics=True)
+
+    lrfg.train_all_clients = Mock()
+    lrfg.aggregate_statistics = Mock()
+    lrfg.evaluate_global_model = Mock()
+
+    lrfg.run_rounds(3)
+
+    lrfg.train_all_clients.assert_not_called()
+    lrfg.aggregate_statistics.assert_called_once()
+    lrfg.evaluate_global_model.assert_called_once_with(lrfg._test_data, lrfg._test_labels)
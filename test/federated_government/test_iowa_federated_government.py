@@ -126,3 +126,19 @@ def test_run_rounds():
     assert len(iowa_fg.evaluate_global_model.call_args[0]) == 2
     np.testing.assert_array_equal(iowa_fg.evaluate_clients.call_args[0][0], test_data)
     np.testing.assert_array_equal(iowa_fg.evaluate_global_model.call_args[0][1], test_label)
+
+
+def test_client_weights_selected_clients():
+    model_builder = Mock
+    database = TestDataBase()
+    database.load_data()
+    db = IidDataDistribution(database)
+    federated_data, test_data, test_labels = db.get_federated_data(5)
+
+    client_selector = Mock()
+    client_selector.select.return_value = [1, 3, 4]
+    iowa_fg = IowaFederatedGovernment(model_builder, federated_data, client_selector=client_selector)
+    iowa_fg.select_clients()
+    iowa_fg._aggregator._percentage = np.array([0.5, 0.3, 0.2])
+
+    assert iowa_fg._client_weights() == [0.5, 0.3, 0.2]
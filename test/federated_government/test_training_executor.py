@@ -0,0 +1,175 @@
+import numpy as np
+import pytest
+from unittest.mock import Mock
+
+from shfl.data_base.data_base import DataBase
+from shfl.data_distribution.data_distribution_iid import IidDataDistribution
+from shfl.federated_government.federated_government import FederatedGovernment
+from shfl.federated_government.training_executor import SerialTrainingExecutor
+from shfl.federated_government.training_executor import ThreadPoolTrainingExecutor
+from shfl.federated_government.training_executor import ProcessPoolTrainingExecutor
+from shfl.federated_government.training_executor import PersistentProcessTrainingExecutor
+from shfl.federated_government.training_executor import _balance_placement
+from shfl.model.linear_regression_model import LinearRegressionModel
+from shfl.private.data_storage import SharedMemoryStorage
+
+
+class TestDataBase(DataBase):
+    def __init__(self):
+        super(TestDataBase, self).__init__()
+
+    def load_data(self):
+        self._train_data = np.random.rand(200).reshape([40, 5])
+        self._test_data = np.random.rand(200).reshape([40, 5])
+        self._train_labels = np.random.rand(40)
+        self._test_labels = np.random.rand(40)
+
+
+def model_builder():
+    return LinearRegressionModel(n_features=5)
+
+
+def get_federated_data(num_nodes=4, storage=None):
+    database = TestDataBase()
+    database.load_data()
+    db = IidDataDistribution(database)
+
+    federated_data, _, _ = db.get_federated_data(num_nodes, storage=storage)
+
+    return federated_data
+
+
+def serial_params(federated_data):
+    fdg = FederatedGovernment(model_builder, federated_data, Mock())
+    fdg.train_all_clients()
+
+    return [data_node.query_model_params() for data_node in federated_data]
+
+
+def test_serial_training_executor():
+    data_nodes = [Mock() for _ in range(3)]
+
+    SerialTrainingExecutor().train(data_nodes)
+
+    for data_node in data_nodes:
+        data_node.train_model.assert_called_once_with()
+
+
+def test_default_executor():
+    fdg = FederatedGovernment(Mock, get_federated_data(), Mock())
+
+    assert isinstance(fdg._executor, SerialTrainingExecutor)
+
+
+def test_thread_pool_training_executor():
+    federated_data = get_federated_data()
+    expected_params = serial_params(federated_data)
+
+    executor = ThreadPoolTrainingExecutor(max_workers=2)
+    fdg = FederatedGovernment(model_builder, federated_data, Mock(), executor=executor)
+    fdg.train_all_clients()
+    executor.shutdown()
+
+    for data_node, params in zip(federated_data, expected_params):
+        assert np.allclose(data_node.query_model_params(), params)
+
+
+def test_process_pool_training_executor():
+    federated_data = get_federated_data()
+    expected_params = serial_params(federated_data)
+
+    executor = ProcessPoolTrainingExecutor(max_workers=2)
+    fdg = FederatedGovernment(model_builder, federated_data, Mock(), executor=executor)
+    fdg.train_all_clients()
+    executor.shutdown()
+
+    for data_node, params in zip(federated_data, expected_params):
+        assert np.allclose(data_node.query_model_params(), params)
+
+
+def test_balance_placement():
+    sizes = [10, 70, 20, 40, 30]
+
+    placement = _balance_placement(sizes, [0, 0])
+
+    loads = np.zeros(2)
+    for size, worker in zip(sizes, placement):
+        loads[worker] += size
+    assert placement[1] != placement[3]
+    assert np.array_equal(np.sort(loads), [80, 90])
+
+
+def test_persistent_process_training_executor():
+    federated_data = get_federated_data()
+    expected_params = serial_params(federated_data)
+
+    executor = PersistentProcessTrainingExecutor(num_workers=2)
+    fdg = FederatedGovernment(model_builder, federated_data, Mock(), executor=executor)
+    fdg.train_all_clients()
+    placement = dict(executor.placement)
+    fdg.deploy_central_model()
+    fdg.train_all_clients()
+
+    assert executor.placement == placement
+    assert sorted(set(placement.values())) == [0, 1]
+    for data_node, params in zip(federated_data, expected_params):
+        assert np.allclose(data_node.query_model_params(), params)
+
+    executor.shutdown()
+    assert executor.placement == {}
+
+
+def test_process_pool_training_executor_shared_memory():
+    storage = SharedMemoryStorage()
+    federated_data = get_federated_data(storage=storage)
+    expected_params = serial_params(federated_data)
+
+    executor = ProcessPoolTrainingExecutor(max_workers=2)
+    fdg = FederatedGovernment(model_builder, federated_data, Mock(), executor=executor)
+    fdg.train_all_clients()
+    executor.shutdown()
+
+    for data_node, params in zip(federated_data, expected_params):
+        assert np.allclose(data_node.query_model_params(), params)
+    storage.unlink()
+
+
+def test_submit():
+    federated_data = get_federated_data()
+    expected_params = serial_params(federated_data)
+
+    for executor in [SerialTrainingExecutor(), ThreadPoolTrainingExecutor(max_workers=2),
+                     ProcessPoolTrainingExecutor(max_workers=2)]:
+        fdg = FederatedGovernment(model_builder, federated_data, Mock(), executor=executor)
+        pending = [executor.submit(data_node) for data_node in federated_data]
+        for future in pending:
+            assert future.result() is None
+        executor.shutdown()
+
+        for data_node, params in zip(federated_data, expected_params):
+            assert np.allclose(data_node.query_model_params(), params)
+
+
+def test_submit_error():
+    data_node = Mock()
+    data_node.train_model.side_effect = ValueError()
+
+    future = SerialTrainingExecutor().submit(data_node)
+
+    assert isinstance(future.exception(), ValueError)
+
+
+def test_persistent_receive_all_drains_connections():
+    failed = Mock()
+    failed.recv.return_value = ("error", "Traceback")
+    trained = Mock()
+    trained.recv.return_value = ("ok", [(1, np.zeros(2))])
+
+    with pytest.raises(RuntimeError, match="Traceback"):
+        PersistentProcessTrainingExecutor._receive_all([failed, trained])
+
+    failed.recv.assert_called_once()
+    trained.recv.assert_called_once()
+    [[(key, params)]] = PersistentProcessTrainingExecutor._receive_all([trained])
+    assert key == 1
+    assert np.array_equal(params, np.zeros(2))
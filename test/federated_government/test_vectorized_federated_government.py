@@ -0,0 +1,180 @@
+import numpy as np
+import pytest
+from unittest.mock import Mock
+
+from shfl.federated_aggregator.fedavg_aggregator import FedAvgAggregator
+from shfl.federated_government.federated_government import FederatedGovernment
+from shfl.federated_government.vectorized_federated_government import VectorizedFederatedGovernment
+from shfl.model.linear_regression_model import LinearRegressionModel
+from shfl.model.logistic_regression_model import LogisticRegressionModel
+from shfl.private.data import LabeledData, UnprotectedAccess
+from shfl.private.federated_operation import FederatedData
+
+
+def get_federated_data(data, labels, sizes):
+    federated_data = FederatedData()
+    offsets = np.cumsum(sizes) - sizes
+    for offset, size in zip(offsets, sizes):
+        federated_data.add_data_node(LabeledData(data[offset:offset + size], labels[offset:offset + size]))
+    federated_data.configure_data_access(UnprotectedAccess())
+
+    return federated_data
+
+
+def get_labels(classes, sizes):
+    labels = np.random.choice(classes, sum(sizes))
+    for offset in np.cumsum(sizes) - sizes:
+        labels[offset:offset + len(classes)] = classes
+
+    return labels
+
+
+@pytest.mark.parametrize("kind", ["linear", "multi_target", "binary", "multinomial"])
+def test_matches_federated_government(kind):
+    sizes = [30, 45, 25, 50]
+    data = np.random.randn(sum(sizes), 3)
+    if kind == "linear":
+        labels = data @ np.array([1, 2, 3]) + np.random.randn(len(data))
+        model_builder = lambda: LinearRegressionModel(n_features=3)
+    elif kind == "multi_target":
+        labels = data @ np.random.rand(3, 2) + np.random.randn(len(data), 2)
+        model_builder = lambda: LinearRegressionModel(n_features=3, n_targets=2)
+    else:
+        classes = [0, 1] if kind == "binary" else ["a", "b", "c"]
+        labels = get_labels(classes, sizes)
+        model_builder = lambda: LogisticRegressionModel(n_features=3, classes=classes)
+    federated_data = get_federated_data(data, labels, sizes)
+
+    vectorized = VectorizedFederatedGovernment.from_federated_data(model_builder, federated_data, FedAvgAggregator())
+    government = FederatedGovernment(model_builder, federated_data, FedAvgAggregator())
+    for fdg in [vectorized, government]:
+        fdg.deploy_central_model()
+        fdg.train_all_clients()
+        fdg.aggregate_weights()
+
+    assert vectorized.clients_params.shape == (4,) + government.global_model.get_model_params().shape
+    for client_params, data_node in zip(vectorized.clients_params, federated_data):
+        assert np.allclose(client_params, data_node.query_model_params(), atol=1e-4)
+    assert np.allclose(vectorized.global_model.get_model_params(), government.global_model.get_model_params(),
+                       atol=1e-4)
+
+
+@pytest.mark.parametrize("logistic", [False, True])
+def test_gradient_descent(logistic):
+    sizes = [20, 30]
+    data = np.random.randn(sum(sizes), 2)
+    if logistic:
+        labels = get_labels([0, 1], sizes)
+        model_builder = lambda: LogisticRegressionModel(n_features=2, classes=[0, 1])
+    else:
+        labels = np.random.randn(sum(sizes))
+        model_builder = lambda: LinearRegressionModel(n_features=2)
+    fdg = VectorizedFederatedGovernment(model_builder, data, labels, sizes, Mock(), local_epochs=3,
+                                        learning_rate=0.5)
+    global_params = np.random.randn(1, 3)
+    fdg.global_model.set_model_params(global_params)
+
+    fdg.deploy_central_model()
+    fdg.train_all_clients()
+
+    inverse_c = 1 if logistic else 0
+    for client, offset in enumerate(np.cumsum(sizes) - sizes):
+        features = np.column_stack((np.ones(sizes[client]), data[offset:offset + sizes[client]]))
+        targets = labels[offset:offset + sizes[client]]
+        params = global_params[0].copy()
+        for _ in range(3):
+            predictions = features @ params
+            if logistic:
+                predictions = 1 / (1 + np.exp(-predictions))
+            gradient = features.T @ (predictions - targets) + inverse_c * np.r_[0, params[1:]]
+            params -= 0.5 * gradient / sizes[client]
+        assert np.allclose(fdg.clients_params[client, 0], params)
+
+
+def test_loss():
+    sizes = [20, 30]
+    data = np.random.randn(sum(sizes), 2)
+    labels = get_labels([0, 1], sizes)
+    fdg = VectorizedFederatedGovernment(lambda: LogisticRegressionModel(2, [0, 1], {"C": 2}), data, labels,
+                                        sizes, Mock())
+    params = np.random.randn(2, 1, 3)
+
+    loss = fdg._loss(params)
+
+    for client, offset in enumerate(np.cumsum(sizes) - sizes):
+        scores = params[client, 0, 0] + data[offset:offset + sizes[client]] @ params[client, 0, 1:]
+        probabilities = 1 / (1 + np.exp(-scores))
+        targets = labels[offset:offset + sizes[client]]
+        expected = -np.sum(targets * np.log(probabilities) + (1 - targets) * np.log(1 - probabilities)) \
+            + 0.25 * np.sum(params[client, 0, 1:] ** 2)
+        assert np.isclose(loss[client], expected)
+
+
+def test_newton_loss_decreases():
+    data = np.random.RandomState(3).randn(20, 2) * 10
+    labels = (data[:, 0] > 0).astype(int)
+    fdg = VectorizedFederatedGovernment(lambda: LogisticRegressionModel(2, [0, 1], {"C": 1000}), data, labels,
+                                        [20], Mock())
+
+    losses = [fdg._loss(fdg._newton(max_iter=max_iter))[0] for max_iter in range(1, 16)]
+
+    assert np.all(np.diff(losses) <= 1e-12)
+
+
+@pytest.mark.parametrize("classes", [[0, 1], [0, 1, 2]])
+def test_newton_drops_converged_clients(classes):
+    sizes = [20] * 3000
+    data = np.random.randn(sum(sizes), 3)
+    labels = get_labels(classes, sizes)
+    fdg = VectorizedFederatedGovernment(lambda: LogisticRegressionModel(3, classes), data, labels, sizes, Mock())
+    fdg._loss = Mock(wraps=fdg._loss)
+
+    fdg.train_all_clients()
+
+    evaluated_clients = sum(len(call_args[0][0]) for call_args in fdg._loss.call_args_list)
+    assert evaluated_clients <= 10 * len(sizes)
+    assert np.abs(fdg._gradient(fdg.clients_params)).max() < 1e-4
+
+
+def test_aggregate_weights():
+    aggregator = Mock()
+    aggregator.finalize.return_value = np.ones((1, 3))
+    fdg = VectorizedFederatedGovernment(lambda: LinearRegressionModel(n_features=2), np.random.rand(10, 2),
+                                        np.random.rand(10), [4, 6], aggregator)
+
+    fdg.aggregate_weights()
+
+    aggregator.begin.assert_called_once()
+    assert aggregator.add.call_count == 2
+    assert np.array_equal(fdg.global_model.get_model_params(), np.ones((1, 3)))
+
+
+def test_run_rounds():
+    fdg = VectorizedFederatedGovernment(lambda: LinearRegressionModel(n_features=2), np.random.rand(10, 2),
+                                        np.random.rand(10), [4, 6], FedAvgAggregator())
+    fdg.deploy_central_model = Mock()
+    fdg.train_all_clients = Mock()
+    fdg.aggregate_weights = Mock()
+    fdg.evaluate_global_model = Mock()
+    test_data, test_labels = np.random.rand(5, 2), np.random.rand(5)
+
+    fdg.run_rounds(2, test_data, test_labels)
+
+    assert fdg.train_all_clients.call_count == 2
+    fdg.evaluate_global_model.assert_called_with(test_data, test_labels)
+
+
+def test_wrong_arguments():
+    data, labels = np.random.rand(10, 2), np.random.rand(10)
+    with pytest.raises(ValueError):
+        VectorizedFederatedGovernment(lambda: LinearRegressionModel(n_features=2), data, labels, [4, 5], Mock())
+    with pytest.raises(ValueError):
+        VectorizedFederatedGovernment(Mock, data, labels, [4, 6], Mock())
+    with pytest.raises(AssertionError):
+        VectorizedFederatedGovernment(lambda: LinearRegressionModel(n_features=3), data, labels, [4, 6], Mock())
+    with pytest.raises(ValueError):
+        VectorizedFederatedGovernment(lambda: LogisticRegressionModel(2, [0, 1], {"penalty": "l1"}), data,
+                                      get_labels([0, 1], [4, 6]), [4, 6], Mock())
+    with pytest.raises(AssertionError):
+        VectorizedFederatedGovernment(lambda: LogisticRegressionModel(2, [0, 1]), data,
+                                      np.r_[np.zeros(4), get_labels([0, 1], [6])], [4, 6], Mock())
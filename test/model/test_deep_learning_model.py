@@ -1,9 +1,13 @@
+import copy
 import numpy as np
+import pickle
 from unittest.mock import Mock
 import pytest
 import tensorflow as tf
 
 from shfl.model.deep_learning_model import DeepLearningModel
+from shfl.model.deep_learning_model import BatchSequence
+from shfl.model.param_vector import ParamVector
 
 
 class TestDeepLearningModel(DeepLearningModel):
@@ -126,6 +130,44 @@ def test_keras_model_train():
     assert params['epochs'] == epoch
 
 
+def test_keras_model_train_memmap(tmp_path):
+    model = Mock()
+    layer = Mock
+
+    sizes = [(1, 24, 24), (24, 10)]
+
+    l1 = layer()
+    l1.get_input_shape_at.return_value = sizes[0]
+    l2 = layer()
+    l2.get_output_shape_at.return_value = sizes[1]
+    model.layers = [l1, l2]
+
+    batch = 8
+    epoch = 2
+    kdpm = DeepLearningModel(model, batch, epoch)
+
+    num_data = 30
+    np.save(tmp_path / "data.npy", np.random.rand(num_data, 24, 24))
+    np.save(tmp_path / "labels.npy", np.eye(10)[np.random.randint(0, 10, num_data)])
+    data = np.load(tmp_path / "data.npy", mmap_mode='r')
+    labels = np.load(tmp_path / "labels.npy", mmap_mode='r')
+
+    kdpm.train(data, labels)
+
+    kdpm._model.fit.assert_called_once()
+    params = kdpm._model.fit.call_args_list[0][1]
+
+    assert isinstance(params['x'], BatchSequence)
+    assert isinstance(params['validation_data'], BatchSequence)
+    assert len(params['x']) == 3
+    assert len(params['validation_data']) == 1
+    assert params['epochs'] == epoch
+    train_data = np.concatenate([params['x'][i][0] for i in range(len(params['x']))])
+    validation_labels = params['validation_data'][0][1]
+    assert np.array_equal(train_data, data[:24])
+    assert np.array_equal(validation_labels, labels[24:])
+
+
 def test_evaluate():
     model = Mock()
     layer = Mock
@@ -281,3 +323,54 @@ def test_performance():
 
     assert res == 0
 
+
+
+def test_pickle_deep_learning_model():
+    model = tf.keras.models.Sequential()
+    model.add(tf.keras.layers.Dense(12, input_shape=(8,)))
+    model.add(tf.keras.layers.Dense(2, activation='softmax'))
+    metrics = ['accuracy', tf.keras.metrics.AUC(name='auc')]
+    model.compile(optimizer='rmsprop', loss='categorical_crossentropy', metrics=metrics)
+
+    dpl = DeepLearningModel(model, metrics=metrics)
+    unpickled = pickle.loads(pickle.dumps(dpl))
+
+    for weights, unpickled_weights in zip(dpl.get_model_params(), unpickled.get_model_params()):
+        assert np.array_equal(weights, unpickled_weights)
+    assert unpickled._model.get_config() == model.get_config()
+    assert unpickled._model.optimizer.__class__.__name__ == model.optimizer.__class__.__name__
+    assert unpickled._model.loss == model.loss
+    assert unpickled._data_shape == dpl._data_shape
+
+    data, labels = np.random.rand(10, 8), np.eye(2)[np.random.randint(0, 2, 10)]
+    for copied in [unpickled, copy.deepcopy(dpl)]:
+        assert copied._metrics[0] == 'accuracy'
+        assert isinstance(copied._metrics[1], tf.keras.metrics.AUC)
+        assert copied._metrics[1] is not metrics[1]
+        assert len(copied.evaluate(data, labels)) == 3
+
+
+def test_pickle_deep_learning_model_optimizer_config():
+    model = tf.keras.models.Sequential()
+    model.add(tf.keras.layers.Dense(2, input_shape=(4,)))
+    model.compile(optimizer=tf.keras.optimizers.SGD(learning_rate=0.5, momentum=0.9), loss='mse')
+
+    unpickled = pickle.loads(pickle.dumps(DeepLearningModel(model)))
+
+    optimizer_config = unpickled._model.optimizer.get_config()
+    assert isinstance(unpickled._model.optimizer, tf.keras.optimizers.SGD)
+    assert np.isclose(optimizer_config["learning_rate"], 0.5)
+    assert np.isclose(optimizer_config["momentum"], 0.9)
+
+
+def test_set_weights_param_vector():
+    model = tf.keras.models.Sequential()
+    model.add(tf.keras.layers.Dense(4, input_shape=(3,)))
+    model.compile(optimizer='rmsprop', loss='mse')
+    dpl = DeepLearningModel(model)
+
+    params = [np.random.rand(3, 4), np.random.rand(4)]
+    dpl.set_model_params(ParamVector.from_params(params))
+
+    for weights, param in zip(dpl.get_model_params(), params):
+        assert np.allclose(weights, param)
@@ -1,7 +1,14 @@
 from shfl.model.kmeans_model import KMeansModel
+from shfl.model.kmeans_model import LloydKMeansModel
+from shfl.federated_aggregator.fedavg_aggregator import FedAvgAggregator
+from shfl.federated_government.federated_government import FederatedGovernment
+from shfl.private.data import LabeledData, UnprotectedAccess
+from shfl.private.federated_operation import FederatedData
+from sklearn.cluster import KMeans
 from unittest.mock import Mock, patch
 
 import numpy as np
+import pytest
 
 
 @patch('shfl.model.kmeans_model.KMeans')
@@ -209,3 +216,187 @@ def test_performance(mock_kmeans, mock_v_measure_score):
     mock_v_measure_score.assert_called_once_with(labels, prediction)
     kmm.predict.assert_called_once_with(data)
 
+
+
+@patch('shfl.model.kmeans_model.KMeans')
+def test_train_warm_start(mock_kmeans):
+    model = Mock()
+    mock_kmeans.return_value = model
+
+    kmm = KMeansModel(2, 2, warm_start=True)
+    data = np.random.rand(10, 2)
+    kmm.train(data)
+
+    model.set_params.assert_not_called()
+    model.fit.assert_called_once_with(data)
+
+    centers = np.array([[0, 0], [1, 1]])
+    kmm.set_model_params(centers)
+    kmm.train(data)
+
+    model.set_params.assert_called_once()
+    assert np.array_equal(model.set_params.call_args[1]["init"], centers)
+    assert model.set_params.call_args[1]["n_init"] == 1
+
+
+def test_train_warm_start_centers():
+    data = np.concatenate([np.random.randn(50, 2), np.random.randn(50, 2) + 10])
+    kmm = KMeansModel(2, 2, warm_start=True)
+    kmm.set_model_params(np.array([[10.0, 10.0], [0.0, 0.0]]))
+
+    kmm.train(data)
+
+    assert kmm._k_means.n_init == 1
+    assert np.allclose(kmm.get_model_params(), [data[50:].mean(axis=0), data[:50].mean(axis=0)])
+
+
+@patch('shfl.model.kmeans_model.clone')
+@patch('shfl.model.kmeans_model.MiniBatchKMeans')
+def test_train_mini_batch(mock_mini_batch_kmeans, mock_clone):
+    model = Mock()
+    mock_mini_batch_kmeans.return_value = model
+    mock_clone.return_value = model
+
+    kmm = KMeansModel(2, 3, n_init=3, mini_batch=True, batch_size=4)
+
+    mock_mini_batch_kmeans.assert_called_once_with(n_clusters=2, init='k-means++', n_init=3, batch_size=4)
+
+    data = np.random.rand(10, 3)
+    kmm.train(data)
+
+    assert model.partial_fit.call_count == 3
+    batches = sorted([call[0][0] for call in model.partial_fit.call_args_list], key=len)
+    assert [len(batch) for batch in batches] == [2, 4, 4]
+    assert np.array_equal(np.sort(np.concatenate(batches), axis=0), np.sort(data, axis=0))
+
+
+
+def test_train_mini_batch_short_tail():
+    data = np.random.rand(21, 2)
+    kmm = KMeansModel(3, 2, mini_batch=True, batch_size=10)
+
+    for _ in range(5):
+        kmm.train(data)
+
+    assert kmm.get_model_params().shape == (3, 2)
+
+
+@patch('shfl.model.kmeans_model.clone')
+@patch('shfl.model.kmeans_model.MiniBatchKMeans')
+def test_train_mini_batch_short_tail_merged(mock_mini_batch_kmeans, mock_clone):
+    model = Mock()
+    mock_mini_batch_kmeans.return_value = model
+    mock_clone.return_value = model
+
+    kmm = KMeansModel(3, 2, mini_batch=True, batch_size=4)
+    data = np.random.rand(10, 2)
+    kmm.train(data)
+
+    batches = sorted([call[0][0] for call in model.partial_fit.call_args_list], key=len)
+    assert [len(batch) for batch in batches] == [4, 6]
+    assert np.array_equal(np.sort(np.concatenate(batches), axis=0), np.sort(data, axis=0))
+
+def test_train_mini_batch_warm_start():
+    data = np.concatenate([np.random.randn(500, 2), np.random.randn(500, 2) + 10])
+    np.random.shuffle(data)
+    kmm = KMeansModel(2, 2, mini_batch=True, warm_start=True, batch_size=100)
+    kmm.set_model_params(np.array([[10.0, 10.0], [0.0, 0.0]]))
+
+    kmm.train(data)
+
+    assert kmm._k_means.n_init == 1
+    assert np.allclose(kmm.get_model_params(), [[10, 10], [0, 0]], atol=0.5)
+
+
+def test_lloyd_kmeans_model_params():
+    init = np.random.rand(3, 2)
+    kmm = LloydKMeansModel(n_clusters=3, n_features=2, init=init)
+
+    params = kmm.get_model_params()
+
+    assert params.shape == (3, 3)
+    assert np.array_equal(params[:, :-1], init)
+    assert np.array_equal(params[:, -1], np.ones(3))
+
+    kmm.train(np.array([[0.0, 0.0], [2.0, 2.0], [10.0, 10.0]]))
+    params = kmm.get_model_params()
+
+    assert params.shape == (3, 3)
+    assert params[:, -1].sum() == 3
+
+
+def test_lloyd_kmeans_model_seeds_uninitialized():
+    kmm = LloydKMeansModel(n_clusters=3, n_features=2, init="k-means++")
+    data = np.random.rand(30, 2)
+
+    assert np.array_equal(kmm.get_model_params(), np.zeros((3, 3)))
+
+    kmm.train(data)
+
+    assert kmm.get_model_params()[:, -1].sum() == 30
+    assert len(np.unique(kmm.predict(data))) == 3
+
+
+def test_lloyd_kmeans_model_train_without_centers():
+    kmm = LloydKMeansModel(n_clusters=3, n_features=2)
+
+    with pytest.raises(ValueError):
+        kmm.train(np.random.rand(30, 2))
+    with pytest.raises(ValueError):
+        LloydKMeansModel(n_clusters=3, n_features=2, init="random")
+
+def test_lloyd_kmeans_model_empty_cluster():
+    kmm = LloydKMeansModel(n_clusters=2, n_features=2, init=np.array([[0.0, 0.0], [100.0, 100.0]]))
+
+    kmm.set_model_params(np.array([[2.0, 4.0, 2.0], [0.0, 0.0, 0.0]]))
+
+    assert np.array_equal(kmm._k_means.cluster_centers_, np.array([[1.0, 2.0], [100.0, 100.0]]))
+
+
+def test_lloyd_kmeans_model_federated_equals_centralized():
+    data = np.concatenate([np.random.randn(50, 3) + center for center in [[0, 0, 0], [5, 5, 0], [0, 5, 5]]])
+    np.random.shuffle(data)
+    init = data[:3].copy()
+    partitions = np.array_split(data, 4)
+
+    global_model = LloydKMeansModel(n_clusters=3, n_features=3, init=init)
+    aggregator = FedAvgAggregator()
+    for _ in range(5):
+        clients_params = []
+        for partition in partitions:
+            local_model = LloydKMeansModel(n_clusters=3, n_features=3)
+            local_model.set_model_params(global_model.get_model_params())
+            local_model.train(partition)
+            clients_params.append(local_model.get_model_params())
+        global_model.set_model_params(aggregator.aggregate_weights(clients_params))
+
+    centralized = KMeans(n_clusters=3, init=init, n_init=1, max_iter=5, tol=0, algorithm="lloyd").fit(data)
+
+    assert np.allclose(global_model._k_means.cluster_centers_, centralized.cluster_centers_)
+    assert np.array_equal(global_model.predict(data), centralized.predict(data))
+
+
+def test_lloyd_kmeans_model_federated_government():
+    data = np.concatenate([np.random.randn(50, 3) + center for center in [[0, 0, 0], [5, 5, 0], [0, 5, 5]]])
+    np.random.shuffle(data)
+    federated_data = FederatedData()
+    for partition in np.array_split(data, 4):
+        federated_data.add_data_node(LabeledData(partition, None))
+    federated_data.configure_data_access(UnprotectedAccess())
+    model_builder = lambda: LloydKMeansModel(n_clusters=3, n_features=3)
+    government = FederatedGovernment(model_builder, federated_data, FedAvgAggregator())
+
+    government.deploy_central_model()
+    with pytest.raises(ValueError):
+        government.train_all_clients()
+
+    init = data[:3].copy()
+    government.global_model.set_model_params(np.column_stack((init, np.ones(3))))
+    for _ in range(3):
+        government.deploy_central_model()
+        government.train_all_clients()
+        government.aggregate_weights()
+
+    centralized = KMeans(n_clusters=3, init=init, n_init=1, max_iter=3, tol=0, algorithm="lloyd").fit(data)
+
+    assert np.allclose(government.global_model._k_means.cluster_centers_, centralized.cluster_centers_)
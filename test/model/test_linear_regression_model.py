@@ -153,3 +153,48 @@ def test_linear_regression_model_performance(mse_mock):
     mse_mock.assert_called_once_with(labels, prediction)
 
     assert -rmse == np.sqrt(mse_mock.return_value)
+
+
+@pytest.mark.parametrize("n_targets", [1, 3])
+def test_evaluate_many(n_targets):
+    n_features = 4
+    data = np.random.rand(50, n_features)
+    models = []
+    for _ in range(5):
+        lnr = LinearRegressionModel(n_features=n_features, n_targets=n_targets)
+        lnr.set_model_params(np.random.rand(n_targets, n_features + 1))
+        models.append(lnr)
+    labels = np.random.rand(50, n_targets) if n_targets > 1 else np.random.rand(50)
+
+    evaluations = LinearRegressionModel.evaluate_many(models, data, labels)
+    performances = LinearRegressionModel.performance_many(models, data, labels)
+
+    assert np.allclose(evaluations, [lnr.evaluate(data, labels) for lnr in models])
+    assert np.allclose(performances, [lnr.performance(data, labels) for lnr in models])
+    assert LinearRegressionModel.evaluate_many([], data, labels) == []
+
+
+@pytest.mark.parametrize("n_targets", [1, 3])
+def test_performance_each(n_targets):
+    n_features = 4
+    sizes = [20, 35, 10]
+    models = []
+    for _ in sizes:
+        lnr = LinearRegressionModel(n_features=n_features, n_targets=n_targets)
+        lnr.set_model_params(np.random.rand(n_targets, n_features + 1))
+        models.append(lnr)
+    data = [np.random.rand(size, n_features) for size in sizes]
+    labels = [np.random.rand(size, n_targets) if n_targets > 1 else np.random.rand(size) for size in sizes]
+
+    performances = LinearRegressionModel.performance_each(models, data, labels)
+
+    assert np.allclose(performances, [lnr.performance(lnr_data, lnr_labels)
+                                      for lnr, lnr_data, lnr_labels in zip(models, data, labels)])
+    assert LinearRegressionModel.performance_each([], [], []) == []
+
+
+def test_evaluate_many_wrong_data():
+    models = [LinearRegressionModel(n_features=3)]
+
+    with pytest.raises(AssertionError):
+        LinearRegressionModel.evaluate_many(models, np.random.rand(10, 2), np.random.rand(10))
@@ -108,4 +108,106 @@ def test_logistic_regression_model_set_get_params():
     params = np.random.rand(len(classes), n_features)
     lgr.set_model_params(params)
     
-    assert np.array_equal(lgr.get_model_params(), params)
\ No newline at end of file
+    assert np.array_equal(lgr.get_model_params(), params)
+
+def test_logistic_regression_model_properties():
+    lgr = LogisticRegressionModel(n_features=3, classes=['a', 'b', 'c'])
+
+    assert np.array_equal(lgr.classes, ['a', 'b', 'c'])
+    assert lgr.penalty == 'l2'
+    assert lgr.C == 1.0
+    assert lgr.fit_intercept
+
+    lgr = LogisticRegressionModel(n_features=3, classes=[0, 1], model_inputs={'C': 5, 'fit_intercept': False})
+
+    assert lgr.C == 5
+    assert not lgr.fit_intercept
+
+    lgr = LogisticRegressionModel(n_features=3, classes=[0, 1], partial_fit=True)
+
+    assert lgr.C is None
+
+
+@pytest.mark.parametrize("classes", [[0, 1], ['a', 'b', 'c']])
+def test_evaluate_many(classes):
+    n_features = 4
+    data = np.random.rand(60, n_features)
+    labels = np.random.choice(classes, 60)
+    labels[:len(classes)] = classes
+    models = []
+    for _ in range(5):
+        lgr = LogisticRegressionModel(n_features=n_features, classes=classes)
+        n_classes = 1 if len(classes) == 2 else len(classes)
+        lgr.set_model_params(np.random.randn(n_classes, n_features + 1))
+        models.append(lgr)
+
+    evaluations = LogisticRegressionModel.evaluate_many(models, data, labels)
+    performances = LogisticRegressionModel.performance_many(models, data, labels)
+
+    assert np.allclose(evaluations, [lgr.evaluate(data, labels) for lgr in models])
+    assert np.allclose(performances, [lgr.performance(data, labels) for lgr in models])
+
+
+@pytest.mark.parametrize("classes", [[0, 1], ['a', 'b', 'c']])
+def test_performance_each(classes):
+    n_features = 4
+    sizes = [30, 45, 20]
+    models = []
+    for _ in sizes:
+        lgr = LogisticRegressionModel(n_features=n_features, classes=classes)
+        n_classes = 1 if len(classes) == 2 else len(classes)
+        lgr.set_model_params(np.random.randn(n_classes, n_features + 1))
+        models.append(lgr)
+    data = [np.random.rand(size, n_features) for size in sizes]
+    labels = [np.random.permutation(np.resize(classes, size)) for size in sizes]
+
+    performances = LogisticRegressionModel.performance_each(models, data, labels)
+
+    assert np.allclose(performances, [lgr.performance(lgr_data, lgr_labels)
+                                      for lgr, lgr_data, lgr_labels in zip(models, data, labels)])
+
+
+def test_train_warm_start():
+    data = np.random.randn(100, 3)
+    labels = (data[:, 0] > 0).astype(int)
+    results = []
+    for warm_start in [False, True]:
+        for init in [np.zeros((1, 4)), np.full((1, 4), 5.0)]:
+            lgr = LogisticRegressionModel(n_features=3, classes=[0, 1], model_inputs={"max_iter": 1},
+                                          warm_start=warm_start)
+            lgr.set_model_params(init)
+            lgr.train(data, labels)
+            results.append(lgr.get_model_params())
+
+    assert np.allclose(results[0], results[1])
+    assert not np.allclose(results[2], results[3])
+
+
+def test_train_partial_fit():
+    data = np.random.randn(100, 3)
+    labels = (data[:, 0] > 0).astype(int)
+    lgr = LogisticRegressionModel(n_features=3, classes=[0, 1], partial_fit=True,
+                                  model_inputs={"learning_rate": "constant", "eta0": 1e-6})
+    init = np.random.randn(1, 4)
+    read_only = init.copy()
+    read_only.flags.writeable = False
+    lgr.set_model_params(read_only)
+
+    lgr.train(data, labels)
+
+    params = lgr.get_model_params()
+    assert params.shape == (1, 4)
+    assert np.allclose(params, init, atol=1e-3)
+    assert not np.array_equal(params, init)
+    assert np.array_equal(read_only, init)
+
+
+def test_train_partial_fit_multiclass():
+    data = np.random.randn(90, 3)
+    labels = np.digitize(data[:, 0], [-0.5, 0.5])
+    lgr = LogisticRegressionModel(n_features=3, classes=[0, 1, 2], partial_fit=True)
+
+    lgr.train(data, labels)
+
+    assert lgr.get_model_params().shape == (3, 4)
+    assert len(lgr.evaluate(data, labels)) == 2
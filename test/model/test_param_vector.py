@@ -0,0 +1,65 @@
+import numpy as np
+import pickle
+import pytest
+
+from shfl.model.param_vector import ParamVector
+from shfl.model.linear_regression_model import LinearRegressionModel
+
+
+def test_from_params_list():
+    params = [np.random.rand(3, 4), np.random.rand(4), np.random.rand(4, 2)]
+    param_vector = ParamVector.from_params(params)
+
+    assert param_vector.buffer.dtype == np.float32
+    assert param_vector.buffer.flags.c_contiguous
+    assert len(param_vector) == 12 + 4 + 8
+    assert param_vector.shapes == [(3, 4), (4,), (4, 2)]
+
+    layers = param_vector.to_params()
+    assert isinstance(layers, list)
+    for layer, original in zip(layers, params):
+        assert np.shares_memory(layer, param_vector.buffer)
+        assert np.allclose(layer, original)
+
+    layers[1][0] = 5
+    assert param_vector.buffer[12] == 5
+
+
+def test_from_params_array():
+    params = np.random.rand(3, 5)
+    param_vector = ParamVector.from_params(params, dtype=np.float64)
+
+    assert not param_vector.is_list
+    assert np.array_equal(param_vector.to_params(), params)
+    assert np.shares_memory(param_vector.to_params(), param_vector.buffer)
+
+
+def test_with_buffer():
+    param_vector = ParamVector.from_params([np.random.rand(2, 2), np.random.rand(3)])
+    other = param_vector.with_buffer(np.arange(7, dtype=np.float32))
+
+    assert other.shapes == param_vector.shapes
+    assert np.array_equal(other.layers()[1], [4, 5, 6])
+
+
+def test_wrong_buffer():
+    with pytest.raises(ValueError):
+        ParamVector(np.zeros(5), [(2, 2)])
+    with pytest.raises(ValueError):
+        ParamVector(np.zeros(5), [(2, 2), (1,)], is_list=False)
+
+
+def test_pickle_param_vector():
+    param_vector = ParamVector.from_params([np.random.rand(2, 2), np.random.rand(3)])
+    unpickled = pickle.loads(pickle.dumps(param_vector))
+
+    assert np.array_equal(unpickled.buffer, param_vector.buffer)
+    assert unpickled.shapes == param_vector.shapes
+
+
+def test_set_model_params_param_vector():
+    model = LinearRegressionModel(n_features=3)
+    params = np.random.rand(1, 4)
+    model.set_model_params(ParamVector.from_params(params, dtype=np.float64))
+
+    assert np.array_equal(model.get_model_params(), params)
@@ -1,6 +1,8 @@
 import numpy as np
 
 from shfl.private.data import LabeledData
+from shfl.private.data import UnprotectedAccess
+from shfl.private.query import Mean
 
 
 def test_labeled_data():
@@ -17,3 +19,10 @@ def test_labeled_data():
     new_label = np.random.rand(1)
     labeled_data.label = new_label
     assert labeled_data.label == new_label
+
+
+def test_unprotected_access_query():
+    data = np.random.rand(10)
+
+    assert UnprotectedAccess().apply(data) is data
+    assert UnprotectedAccess(query=Mean()).apply(data) == np.mean(data)
@@ -0,0 +1,206 @@
+import copy
+import multiprocessing
+import pickle
+import numpy as np
+import pytest
+
+from shfl.data_base.data_base import DataBase
+from shfl.data_distribution.data_distribution_iid import IidDataDistribution
+from shfl.private.data import UnprotectedAccess
+from shfl.private.data_storage import LazyLabeledData
+from shfl.private.data_storage import SharedArray
+from shfl.private.data_storage import SharedLabeledData
+from shfl.private.data_storage import SharedMemoryStorage
+from shfl.private.data_storage import MemmapLabeledData
+from shfl.private.data_storage import MemmapStorage
+
+
+class TestDataBase(DataBase):
+    def __init__(self):
+        super(TestDataBase, self).__init__()
+
+    def load_data(self):
+        self._train_data = np.random.rand(200).reshape([40, 5])
+        self._test_data = np.random.rand(200).reshape([40, 5])
+        self._train_labels = np.random.randint(0, 10, 40)
+        self._test_labels = np.random.randint(0, 10, 40)
+
+
+def sum_shared_array(shared_array):
+    return shared_array.array.sum()
+
+
+def test_shared_array_from_partitions():
+    partitions = [np.random.rand(3, 4), np.random.rand(5, 4)]
+
+    shared_array = SharedArray.from_partitions(partitions)
+
+    assert shared_array.shape == (8, 4)
+    assert np.array_equal(shared_array.array, np.concatenate(partitions))
+    assert not shared_array.array.flags.writeable
+    shared_array.unlink()
+
+
+def test_shared_array_attach():
+    shared_array = SharedArray.from_partitions([np.random.rand(6, 2)])
+
+    attached = SharedArray(shared_array.shape, shared_array.dtype, name=shared_array.name)
+    unpickled = pickle.loads(pickle.dumps(shared_array))
+
+    assert np.array_equal(attached.array, shared_array.array)
+    assert np.array_equal(unpickled.array, shared_array.array)
+    assert copy.deepcopy(shared_array) is shared_array
+    shared_array.unlink()
+
+
+def test_shared_array_other_process():
+    shared_array = SharedArray.from_partitions([np.random.rand(6, 2)])
+
+    with multiprocessing.get_context("spawn").Pool(1) as pool:
+        result = pool.apply(sum_shared_array, (shared_array,))
+
+    assert result == pytest.approx(shared_array.array.sum())
+    shared_array.unlink()
+
+
+def test_shared_labeled_data():
+    data = [np.random.rand(3, 4), np.random.rand(5, 4)]
+    label = [np.random.rand(3), np.random.rand(5)]
+    storage = SharedMemoryStorage()
+
+    nodes_data = storage.store(data, label)
+
+    assert len(storage.shared_arrays) == 2
+    for node_data, data_partition, label_partition in zip(nodes_data, data, label):
+        assert isinstance(node_data, SharedLabeledData)
+        assert np.array_equal(node_data.data, data_partition)
+        assert np.array_equal(node_data.label, label_partition)
+        assert not node_data.data.flags.writeable
+
+    node_copy = copy.deepcopy(nodes_data[1])
+    node_copy.data = node_copy.data * 2
+    assert np.array_equal(node_copy.data, data[1] * 2)
+    assert np.array_equal(nodes_data[1].data, data[1])
+    assert np.array_equal(pickle.loads(pickle.dumps(nodes_data[0])).data, data[0])
+
+    storage.unlink()
+    assert storage.shared_arrays == []
+
+
+def test_get_federated_data_shared_memory():
+    database = TestDataBase()
+    database.load_data()
+    db = IidDataDistribution(database)
+    storage = SharedMemoryStorage()
+
+    federated_data, test_data, test_labels = db.get_federated_data(4, storage=storage)
+    federated_data.configure_data_access(UnprotectedAccess())
+
+    all_data = np.concatenate([node.query().data for node in federated_data])
+    assert np.array_equal(all_data, storage.shared_arrays[0].array)
+    assert np.array_equal(np.sort(all_data.ravel()), np.sort(database.train[0].ravel()))
+    assert federated_data.num_nodes() == 4
+
+    storage.unlink()
+
+
+def test_memmap_storage(tmp_path):
+    data = [np.random.rand(3, 4), np.random.rand(5, 4)]
+    label = [np.random.rand(3), np.random.rand(5)]
+    storage = MemmapStorage(str(tmp_path))
+
+    nodes_data = storage.store(data, label)
+
+    assert storage.directory == str(tmp_path)
+    assert len(list(tmp_path.iterdir())) == 4
+    for node_data, data_partition, label_partition in zip(nodes_data, data, label):
+        assert isinstance(node_data, MemmapLabeledData)
+        assert isinstance(node_data.data, np.memmap)
+        assert np.array_equal(node_data.data, data_partition)
+        assert np.array_equal(node_data.label, label_partition)
+        assert not node_data.data.flags.writeable
+
+    unpickled = pickle.loads(pickle.dumps(nodes_data[0]))
+    assert unpickled._data_memmap is None
+    assert np.array_equal(unpickled.data, data[0])
+
+    node_copy = copy.deepcopy(nodes_data[1])
+    node_copy.data = node_copy.data * 2
+    assert np.array_equal(node_copy.data, data[1] * 2)
+    assert np.array_equal(nodes_data[1].data, data[1])
+
+
+def test_get_federated_data_memmap(tmp_path):
+    database = TestDataBase()
+    database.load_data()
+    db = IidDataDistribution(database)
+
+    federated_data, test_data, test_labels = db.get_federated_data(4, storage=MemmapStorage(str(tmp_path)))
+    federated_data.configure_data_access(UnprotectedAccess())
+
+    all_data = np.concatenate([node.query().data for node in federated_data])
+    assert np.array_equal(np.sort(all_data.ravel()), np.sort(database.train[0].ravel()))
+    assert len(list(tmp_path.iterdir())) == 8
+
+
+def test_lazy_labeled_data():
+    source_data = np.random.rand(10, 3)
+    source_label = np.random.rand(10)
+    indices = np.array([7, 2, 2, 5])
+
+    lazy_data = LazyLabeledData(source_data, source_label, indices)
+
+    assert len(lazy_data) == 4
+    assert lazy_data._data is None and lazy_data._label is None
+    lazy_copy = copy.deepcopy(lazy_data)
+    assert lazy_copy._source_data is source_data
+    assert np.array_equal(lazy_data.data, source_data[indices])
+    assert np.array_equal(lazy_data.label, source_label[indices])
+    assert lazy_data._source_data is None and lazy_data._source_label is None
+    assert lazy_copy._data is None
+
+    original_row = source_data[7].copy()
+    lazy_data.data[0] = 0
+    assert np.array_equal(source_data[7], original_row)
+
+    unpickled = pickle.loads(pickle.dumps(lazy_copy))
+    assert unpickled._source_data is None
+    assert np.array_equal(unpickled.data, source_data[indices])
+    assert np.array_equal(unpickled.label, source_label[indices])
+
+
+def test_store_indices():
+    data = np.random.rand(10, 3)
+    label = np.random.rand(10)
+    federated_indices = [np.array([7, 2, 2]), np.array([0, 9])]
+    storage = SharedMemoryStorage()
+
+    nodes_data = storage.store_indices(data, label, federated_indices)
+
+    for node_data, indices in zip(nodes_data, federated_indices):
+        assert isinstance(node_data, SharedLabeledData)
+        assert np.array_equal(node_data.data, data[indices])
+        assert np.array_equal(node_data.label, label[indices])
+    storage.unlink()
+
+
+def test_get_federated_data_lazy():
+    database = TestDataBase()
+    database.load_data()
+    db = IidDataDistribution(database)
+
+    federated_data, test_data, test_labels = db.get_federated_data(4, sampling="with_replacement")
+
+    for node in federated_data:
+        node_data = node._private_data[node._federated_data_identifier]
+        assert isinstance(node_data, LazyLabeledData)
+        assert node_data._source_data is database.train[0]
+        assert node_data._data is None
+        assert node.num_samples() == 10
+
+    federated_data.configure_data_access(UnprotectedAccess())
+    for node in federated_data:
+        indices = node._private_data[node._federated_data_identifier].indices
+        node_data = node.query()
+        assert node_data._source_data is None and node_data._source_label is None
+        assert np.array_equal(node_data.data, database.train[0][indices])
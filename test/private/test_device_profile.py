@@ -0,0 +1,31 @@
+import numpy as np
+import pytest
+
+from shfl.private.device_profile import DeviceProfile
+from shfl.private.federated_operation import FederatedData
+
+
+def test_device_profile():
+    profile = DeviceProfile(compute_speed=100, bandwidth=1000, latency=0.5)
+
+    assert profile.training_time(250) == 2.5
+    assert profile.upload_time(2000) == 2.5
+
+
+def test_wrong_device_profile():
+    with pytest.raises(ValueError):
+        DeviceProfile(compute_speed=0, bandwidth=1000)
+    with pytest.raises(ValueError):
+        DeviceProfile(compute_speed=10, bandwidth=-1)
+
+
+def test_simulated_time():
+    federated_data = FederatedData()
+    federated_data.add_data_node(np.random.rand(50))
+    data_node = federated_data[0]
+
+    assert data_node.device_profile is None
+    assert data_node.simulated_time(1000) == 0
+
+    data_node.device_profile = DeviceProfile(compute_speed=10, bandwidth=100)
+    assert data_node.simulated_time(1000) == 15
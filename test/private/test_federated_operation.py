@@ -8,6 +8,11 @@ from shfl.private.federated_operation import FederatedTransformation
 from shfl.private.federated_operation import FederatedData
 from shfl.private.federated_operation import FederatedDataNode
 from shfl.private.data import UnprotectedAccess, LabeledData
+from shfl.model.linear_regression_model import LinearRegressionModel
+from shfl.differential_privacy.composition_dp import AdaptiveDifferentialPrivacy
+from shfl.differential_privacy.composition_dp import ExceededPrivacyBudgetError
+from shfl.differential_privacy.composition_dp import LedgerPrivacyFilter
+from shfl.differential_privacy.dp_mechanism import LaplaceMechanism
 
 
 class TestTransformation(FederatedTransformation):
@@ -66,6 +71,31 @@ def test_federated_data():
     assert federated_data[0].query()[0] == array[0]
 
 
+def test_select():
+    federated_data = FederatedData()
+    for _ in range(5):
+        federated_data.add_data_node(np.random.rand(10))
+
+    selected = federated_data.select([1, 3])
+
+    assert selected.num_nodes() == 2
+    assert selected[0] is federated_data[1]
+    assert selected[1] is federated_data[3]
+    assert federated_data.num_nodes() == 5
+
+
+def test_local_performance():
+    federated_data = FederatedData()
+    federated_data.add_data_node(LabeledData(np.random.rand(10, 2), np.random.rand(10)))
+    data_node = federated_data[0]
+    data_node._model = Mock()
+    data_node._model.performance.return_value = 0.5
+
+    assert data_node.local_performance(max_samples=4) == 0.5
+    data, labels = data_node._model.performance.call_args[0]
+    assert len(data) == len(labels) == 4
+
+
 def test_federated_data_identifier():
     data_size = 10
     federated_data = FederatedData()
@@ -76,6 +106,16 @@ def test_federated_data_identifier():
         federated_data[0].query("bad_identifier_federated_data")
 
 
+def test_num_samples():
+    federated_data = FederatedData()
+    federated_data.add_data_node(LabeledData(np.random.rand(12, 3), np.random.rand(12)))
+    federated_data.add_data_node(np.random.rand(7))
+
+    assert federated_data[0].num_samples() == 12
+    assert federated_data[1].num_samples() == 7
+    assert FederatedDataNode("empty").num_samples() == 0
+
+
 def test_split_train_test():
     num_nodes = 10
     data = np.random.rand(10,num_nodes)
@@ -117,3 +157,125 @@ def test_evaluate(mock_super_local_evaluate, mock_super_evaluate):
     mock_super_local_evaluate.assert_called_once_with(identifier)
 
 
+
+
+def test_evaluate_snapshot():
+    federated_data = FederatedData()
+    federated_data.add_data_node(LabeledData(np.random.rand(10, 2), np.random.rand(10)))
+    data_node = federated_data[0]
+    data_node._model = Mock()
+    model = Mock()
+    model.evaluate.return_value = 0.5
+    params = np.random.rand(3)
+    data, labels = np.random.rand(5, 2), np.random.rand(5)
+
+    assert data_node.evaluate_snapshot(params, model, data, labels) == (0.5, None)
+    model.set_model_params.assert_called_once_with(params)
+    model.evaluate.assert_called_once_with(data, labels)
+
+    data_node.split_train_test()
+    evaluation, local_evaluation = data_node.evaluate_snapshot(params, model, data, labels)
+    assert local_evaluation == 0.5
+    assert len(model.evaluate.call_args_list[-2][0][0]) == 2
+    data_node._model.evaluate.assert_not_called()
+
+
+def test_federated_data_evaluate():
+    federated_data = FederatedData()
+    for _ in range(3):
+        federated_data.add_data_node(LabeledData(np.random.rand(10, 2), np.random.rand(10)))
+    for data_node in federated_data:
+        model = LinearRegressionModel(n_features=2)
+        model.set_model_params(np.random.rand(1, 3))
+        data_node.set_model(model, ownership="transfer")
+    federated_data[0].split_train_test()
+    data, labels = np.random.rand(20, 2), np.random.rand(20)
+
+    with patch.object(LinearRegressionModel, "evaluate_many", wraps=LinearRegressionModel.evaluate_many) as many:
+        evaluations = federated_data.evaluate(data, labels)
+        many.assert_called_once()
+
+    assert len(evaluations) == 3
+    for data_node, (evaluation, local_evaluation) in zip(federated_data, evaluations):
+        expected, expected_local = data_node.evaluate(data, labels)
+        assert np.allclose(evaluation, expected)
+        assert (local_evaluation is None) == (expected_local is None)
+        if expected_local is not None:
+            assert np.allclose(local_evaluation, expected_local)
+    assert np.allclose(federated_data.performance(data, labels),
+                       [data_node.performance(data, labels) for data_node in federated_data])
+
+
+def test_federated_data_local_performance():
+    federated_data = FederatedData()
+    for size in [10, 15, 8]:
+        federated_data.add_data_node(LabeledData(np.random.rand(size, 2), np.random.rand(size)))
+    federated_data.add_data_node(LabeledData(np.random.rand(0, 2), np.random.rand(0)))
+    for data_node in federated_data:
+        model = LinearRegressionModel(n_features=2)
+        model.set_model_params(np.random.rand(1, 3))
+        data_node.set_model(model, ownership="transfer")
+
+    with patch.object(LinearRegressionModel, "performance_each",
+                      wraps=LinearRegressionModel.performance_each) as each:
+        performances = federated_data.local_performance(max_samples=9)
+        each.assert_called_once()
+
+    assert performances[3] is None
+    assert np.allclose(performances[:3], [data_node.local_performance(max_samples=9)
+                                          for data_node in federated_data][:3])
+
+
+def test_federated_data_evaluate_mixed_models():
+    federated_data = FederatedData()
+    for _ in range(2):
+        federated_data.add_data_node(np.random.rand(10))
+    federated_data[0].set_model(LinearRegressionModel(n_features=2))
+    federated_data[1].set_model(Mock())
+    for data_node in federated_data:
+        data_node.evaluate = Mock(return_value=(1, None))
+        data_node.performance = Mock(return_value=1)
+
+    assert federated_data.evaluate(np.random.rand(5, 2), np.random.rand(5)) == [(1, None), (1, None)]
+    assert federated_data.performance(np.random.rand(5, 2), np.random.rand(5)) == [1, 1]
+    for data_node in federated_data:
+        data_node.local_performance = Mock(return_value=2)
+    assert federated_data.local_performance() == [2, 2]
+
+
+def test_configure_data_access_privacy_ledger():
+    random_array = np.random.rand(5)
+    federated_array = shfl.private.federated_operation.federate_array(random_array, 5)
+    data_access_definition = AdaptiveDifferentialPrivacy(epsilon_delta=(1, 0),
+                                                         differentially_private_mechanism=LaplaceMechanism(1, 0.3))
+    federated_array.configure_data_access(data_access_definition)
+
+    privacy_filters = [data_node.data_access_definition() for data_node in federated_array]
+    ledger = privacy_filters[0].ledger
+    assert all(isinstance(privacy_filter, LedgerPrivacyFilter) for privacy_filter in privacy_filters)
+    assert all(privacy_filter.ledger is ledger for privacy_filter in privacy_filters)
+    assert [privacy_filter.node for privacy_filter in privacy_filters] == list(range(5))
+
+    answer = federated_array.query()
+
+    assert len(answer) == 5
+    assert np.allclose(ledger.spent, [[0.3, 0]] * 5)
+
+    federated_array[0].query(differentially_private_mechanism=LaplaceMechanism(1, 0.5))
+    with pytest.raises(ExceededPrivacyBudgetError):
+        federated_array.query()
+    assert np.allclose(ledger.spent[:, 0], [0.8, 0.3, 0.3, 0.3, 0.3])
+
+    federated_array.select([1, 2]).query(differentially_private_mechanism=LaplaceMechanism(1, 0.7))
+    assert np.allclose(ledger.spent[:, 0], [0.8, 1, 1, 0.3, 0.3])
+
+
+@patch('shfl.private.federated_operation.PrivacyBudgetLedger.prepay')
+def test_query_privacy_ledger_prepay(mock_prepay):
+    federated_array = shfl.private.federated_operation.federate_array(np.random.rand(3), 3)
+    mechanism = LaplaceMechanism(1, 0.3)
+    federated_array.configure_data_access(AdaptiveDifferentialPrivacy(epsilon_delta=(1, 0)))
+
+    federated_array.query(differentially_private_mechanism=mechanism)
+
+    mock_prepay.assert_called_once_with((0.3, 0), [0, 1, 2])
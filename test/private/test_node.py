@@ -3,6 +3,7 @@ import unittest.mock
 from unittest.mock import Mock
 import pytest
 
+from shfl.model.linear_regression_model import LinearRegressionModel
 from shfl.private.node import DataNode
 from shfl.private.data import LabeledData
 from shfl.private.data import UnprotectedAccess
@@ -112,6 +113,42 @@ def test_evaluate():
     data_node._model.evaluate.assert_called_once_with(data, labels)
 
 
+def test_evaluate_many():
+    data = np.random.rand(20, 2)
+    labels = np.random.rand(20)
+    data_nodes = [DataNode() for _ in range(3)]
+    for data_node in data_nodes:
+        model = LinearRegressionModel(n_features=2)
+        model.set_model_params(np.random.rand(1, 3))
+        data_node.set_model(model, ownership="transfer")
+
+    with unittest.mock.patch.object(LinearRegressionModel, "evaluate_many",
+                                    wraps=LinearRegressionModel.evaluate_many) as many:
+        evaluations = DataNode.evaluate_many(data_nodes, data, labels)
+        many.assert_called_once()
+
+    for data_node, evaluation in zip(data_nodes, evaluations):
+        assert np.allclose(evaluation, data_node.evaluate(data, labels))
+    assert np.allclose(DataNode.performance_many(data_nodes, data, labels),
+                       [data_node.performance(data, labels) for data_node in data_nodes])
+
+
+def test_evaluate_many_without_model_class_evaluate_many():
+    class DuckModel:
+        def evaluate(self, data, labels):
+            return 1
+
+        def performance(self, data, labels):
+            return 2
+
+    data_nodes = [DataNode() for _ in range(2)]
+    for data_node in data_nodes:
+        data_node.set_model(DuckModel(), ownership="transfer")
+
+    assert DataNode.evaluate_many(data_nodes, np.random.rand(5, 2), np.random.rand(5)) == [1, 1]
+    assert DataNode.performance_many(data_nodes, np.random.rand(5, 2), np.random.rand(5)) == [2, 2]
+
+
 def test_local_evaluate():
     data_key = 'EMNIST'
     data_node = DataNode()
@@ -154,4 +191,104 @@ def test_performance():
     res = data_node.performance(data, labels)
 
     data_node._model.performance.assert_called_once_with(data, labels)
-    assert res == 0
\ No newline at end of file
+    assert res == 0
+
+def test_set_private_data_transfer():
+    random_array = np.random.rand(30)
+    data_node = DataNode()
+    data_node.set_private_data("random_array", random_array, ownership="transfer")
+
+    assert data_node._private_data["random_array"] is random_array
+
+
+def test_set_private_data_shared():
+    labeled_data = LabeledData(np.random.rand(30), np.random.rand(30))
+    data_node = DataNode()
+    data_node.set_private_data("random_array", labeled_data, ownership="shared")
+    data_node.configure_data_access("random_array", UnprotectedAccess())
+
+    node_data = data_node.query("random_array")
+    assert np.shares_memory(node_data.data, labeled_data.data)
+    assert not node_data.data.flags.writeable
+    assert not node_data.label.flags.writeable
+    assert labeled_data.data.flags.writeable
+    with pytest.raises(ValueError):
+        node_data.data[0] = 0
+
+    node_data.data = node_data.data * 2
+    assert np.array_equal(data_node.query("random_array").data, labeled_data.data * 2)
+    assert not np.array_equal(node_data.data, labeled_data.data)
+
+
+def test_set_private_test_data_shared():
+    random_array = np.random.rand(30)
+    data_node = DataNode()
+    data_node.set_private_test_data("random_array", random_array, ownership="shared")
+
+    assert np.shares_memory(data_node._private_test_data["random_array"], random_array)
+    assert not data_node._private_test_data["random_array"].flags.writeable
+
+
+def test_set_model_params_shared():
+    params = [np.random.rand(3, 4), np.random.rand(4)]
+    data_node = DataNode()
+    data_node._model = Mock()
+    data_node.set_model_params(params, ownership="shared")
+
+    node_params = data_node._model.set_model_params.call_args[0][0]
+    for param, node_param in zip(params, node_params):
+        assert np.shares_memory(param, node_param)
+        assert not node_param.flags.writeable
+
+
+def test_set_model_transfer():
+    model_mock = Mock()
+    data_node = DataNode()
+    data_node.set_model(model_mock, ownership="transfer")
+
+    assert data_node._model is model_mock
+
+
+def test_wrong_ownership():
+    data_node = DataNode()
+    with pytest.raises(ValueError):
+        data_node.set_private_data("random_array", np.random.rand(30), ownership="borrow")
+    with pytest.raises(ValueError):
+        data_node.set_model(Mock(), ownership="shared")
+    with pytest.raises(ValueError):
+        data_node.configure_model_params_access(UnprotectedAccess(), ownership="shared")
+
+
+def test_snapshot_model_params():
+    params = [np.random.rand(3, 2), np.random.rand(2)]
+    data_node = DataNode()
+    data_node._model = Mock()
+    data_node._model.get_model_params.return_value = params
+    data_node.configure_model_params_access(Mock())
+
+    snapshot = data_node.snapshot_model_params()
+    params[0][0, 0] = -1
+
+    assert snapshot[0][0, 0] != -1
+    assert np.array_equal(snapshot[1], params[1])
+
+
+def test_trained_model_params():
+    params = [np.random.rand(3, 2), np.random.rand(2)]
+    data_node = DataNode()
+    data_node._model = Mock()
+    data_node._model.get_model_params.return_value = params
+    access_policy = Mock()
+    data_node.configure_model_params_access(access_policy)
+
+    assert data_node.trained_model_params() is params
+    access_policy.apply.assert_not_called()
+
+
+def test_data_access_definition():
+    data_node = DataNode()
+    data_access_definition = Mock()
+    data_node.configure_data_access("test", data_access_definition, ownership="transfer")
+
+    assert data_node.data_access_definition("test") is data_access_definition
+    assert data_node.data_access_definition("other") is None